@@ -12,46 +12,36 @@ import pandas as pd
 
 from driftwatch import Monitor
 
-
-def create_training_data(n_samples: int = 1000) -> pd.DataFrame:
-    """Generate synthetic training data."""
-    np.random.seed(42)
-    return pd.DataFrame(
-        {
-            "age": np.random.normal(35, 10, n_samples),
-            "income": np.random.lognormal(10.5, 0.5, n_samples),
-            "credit_score": np.random.normal(700, 50, n_samples),
-            "category": np.random.choice(["A", "B", "C"], n_samples, p=[0.5, 0.3, 0.2]),
-        }
-    )
-
-
-def create_production_data_no_drift(n_samples: int = 500) -> pd.DataFrame:
-    """Generate production data similar to training (no drift)."""
-    np.random.seed(123)
-    return pd.DataFrame(
-        {
-            "age": np.random.normal(35, 10, n_samples),
-            "income": np.random.lognormal(10.5, 0.5, n_samples),
-            "credit_score": np.random.normal(700, 50, n_samples),
-            "category": np.random.choice(["A", "B", "C"], n_samples, p=[0.5, 0.3, 0.2]),
-        }
+CATEGORIES = np.array(["A", "B", "C"])
+
+# (mean, std) of age, log-income and credit score, and category weights
+TRAINING_PARAMS = {
+    "loc": (35, 10.5, 700),
+    "scale": (10, 0.5, 50),
+    "category_p": [0.5, 0.3, 0.2],
+}
+DRIFTED_PARAMS = {
+    # Older population, higher incomes, same credit scores
+    "loc": (45, 11, 700),
+    "scale": (15, 0.7, 50),
+    # Category distribution changed
+    "category_p": [0.2, 0.5, 0.3],
+}
+
+
+def _make(seed: int, params: dict, n_samples: int) -> pd.DataFrame:
+    """Generate a synthetic dataset from its own seeded generator."""
+    rng = np.random.default_rng(seed)
+    # One draw and one affine pass for the three numerical columns
+    x = np.asarray(params["loc"]) + np.asarray(params["scale"]) * rng.standard_normal(
+        (n_samples, 3)
     )
-
-
-def create_production_data_with_drift(n_samples: int = 500) -> pd.DataFrame:
-    """Generate production data with drift."""
-    np.random.seed(456)
     return pd.DataFrame(
         {
-            # Age distribution shifted (older population)
-            "age": np.random.normal(45, 15, n_samples),
-            # Income distribution shifted (higher incomes)
-            "income": np.random.lognormal(11, 0.7, n_samples),
-            # Credit score similar (no drift)
-            "credit_score": np.random.normal(700, 50, n_samples),
-            # Category distribution changed
-            "category": np.random.choice(["A", "B", "C"], n_samples, p=[0.2, 0.5, 0.3]),
+            "age": x[:, 0],
+            "income": np.exp(x[:, 1]),
+            "credit_score": x[:, 2],
+            "category": rng.choice(CATEGORIES, size=n_samples, p=params["category_p"]),
         }
     )
 
@@ -62,10 +52,9 @@ def main() -> None:
     print("DriftWatch Basic Example")
     print("=" * 60)
 
-    # Create datasets
-    train_df = create_training_data()
-    prod_no_drift = create_production_data_no_drift()
-    prod_with_drift = create_production_data_with_drift()
+    # Production datasets are only generated right before they are checked
+    train_df = _make(42, TRAINING_PARAMS, 1000)
+    prod_no_drift = _make(123, TRAINING_PARAMS, 500)
 
     print(f"\nTraining data shape: {train_df.shape}")
     print(f"Production data shape: {prod_no_drift.shape}")
@@ -89,12 +78,14 @@ def main() -> None:
 
     report1 = monitor.check(prod_no_drift)
     print(report1.summary())
+    del prod_no_drift
 
     # Check 2: Production data with drift
     print("\n" + "=" * 60)
     print("CHECK 2: Production data WITH drift")
     print("=" * 60)
 
+    prod_with_drift = _make(456, DRIFTED_PARAMS, 500)
     report2 = monitor.check(prod_with_drift)
     print(report2.summary())
 
@@ -3,63 +3,393 @@ FastAPI Drift Monitoring Demo
 
 Run with: python examples/fastapi_demo.py
 Open: http://localhost:8000
+
+Install ``uvicorn[standard]`` to serve with uvloop and httptools. Set
+DEMO_WORKERS to run several worker processes; they share the sample buffer
+and the latest report in shared memory (POSIX only).
 """
 
+import asyncio
+import gzip
+import json
+import os
 import random
+import tempfile
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from importlib.util import find_spec
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
 
 import numpy as np
-import pandas as pd
 import uvicorn
-from fastapi import FastAPI
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel
 
 from driftwatch import Monitor
 
+try:
+    import fcntl
+except ImportError:  # not available on Windows: single worker only
+    fcntl = None
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # orjson is optional for the demo
+
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when it is installed."""
+
+    def render(self, content: object) -> bytes:
+        return _dumps(content)
+
+
 # =============================================================================
 # 1. SHARED STATE (Global - accessible by both middleware and routes)
 # =============================================================================
 
+MONITORED_FEATURES = ["age", "income", "credit_score", "loan_amount"]
+BUFFER_CAPACITY = 10_000
+
+# With several workers the sample buffer lives in a shared memory segment
+# created by the parent process; workers find it through this variable.
+SHM_ENV = "DRIFTWATCH_DEMO_SHM"
+# Header slots at the start of the buffer: n, head, request_count, version,
+# report_version, report_nbytes, last_check (microseconds since the epoch)
+_HEADER = 7
+# Room for the latest report's JSON, between the header and the samples
+REPORT_CAPACITY = 64 * 1024
+# How often SSE streams look for changes published by other workers
+EVENT_POLL_SECONDS = 0.5
+
+
+def _buffer_nbytes(n_features: int, capacity: int) -> int:
+    return 8 * _HEADER + REPORT_CAPACITY + 8 * n_features * capacity
+
+
+def _lock_path(shm_name: str) -> Path:
+    return Path(tempfile.gettempdir()) / f"{shm_name}.lock"
+
+
+def create_shared_buffer(n_features: int, capacity: int) -> SharedMemory:
+    """Allocate a zeroed sample buffer that worker processes can attach to."""
+    shm = SharedMemory(create=True, size=_buffer_nbytes(n_features, capacity))
+    shm.buf[:] = bytes(shm.size)
+    return shm
+
 
 class SharedDriftState:
-    """Global state for drift monitoring."""
+    """Global state for drift monitoring.
+
+    Samples are stored as a struct-of-arrays ring buffer: one preallocated
+    float64 array per monitored feature plus a write index. Ingesting
+    samples is a slice copy per feature, and building the production
+    matrix only reads the filled part of each array.
+
+    The arrays, counters and the latest report's JSON are views into a
+    single buffer. When ``shm_name`` is given, that buffer is a shared memory
+    segment, so every uvicorn worker sees the same samples and report;
+    updates are then serialized with a file lock.
+
+    Every mutation bumps ``version`` and notifies ``changed`` so that
+    /drift/events subscribers are pushed an update instead of polling.
+
+    A report never changes after it is produced, so it is serialized once
+    in ``set_report``. Each worker parses a report written by another
+    worker once, when it sees ``report_version`` change, and serves it
+    from cache afterwards.
+    """
+
+    def __init__(
+        self,
+        features: list[str],
+        capacity: int = BUFFER_CAPACITY,
+        shm_name: str | None = None,
+    ) -> None:
+        self.capacity = capacity
+        nbytes = _buffer_nbytes(len(features), capacity)
+        self._shm: SharedMemory | None = None
+        self._lock_fd: int | None = None
+        if shm_name is None:
+            storage = bytearray(nbytes)
+        else:
+            # Workers are spawned by the parent and share its resource
+            # tracker, so attaching does not make them owners of the segment.
+            self._shm = SharedMemory(name=shm_name)
+            storage = self._shm.buf
+            self._lock_fd = os.open(_lock_path(shm_name), os.O_RDWR | os.O_CREAT)
+        self._header = np.ndarray((_HEADER,), dtype=np.int64, buffer=storage)
+        self._report_buf = np.ndarray(
+            (REPORT_CAPACITY,), dtype=np.uint8, buffer=storage, offset=8 * _HEADER
+        )
+        block = np.ndarray(
+            (len(features), capacity),
+            dtype=np.float64,
+            buffer=storage,
+            offset=8 * _HEADER + REPORT_CAPACITY,
+        )
+        self.buf = dict(zip(features, block))
+        self._lock: asyncio.Lock | None = None
+        self._changed: asyncio.Condition | None = None
+        # This worker's parsed copy of the shared report, as of _report_version
+        self._report_version = 0
+        self.last_check_iso: str | None = None
+        self.last_report_json = b""
+        self._report_status: dict = {}
+        self._feature_results: list[dict] = []
+        self._event_cache: tuple[int, bytes] | None = None
+
+    # The instance is created at import time, before uvicorn starts its
+    # event loop. On Python 3.9 asyncio primitives bind to the loop that is
+    # current when they are created, so they are created on first use,
+    # from a coroutine running in the server's loop.
+    @property
+    def lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    @property
+    def changed(self) -> asyncio.Condition:
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+        return self._changed
+
+    @property
+    def shared(self) -> bool:
+        return self._shm is not None
+
+    @property
+    def n(self) -> int:
+        return int(self._header[0])
+
+    @property
+    def head(self) -> int:
+        return int(self._header[1])
+
+    @property
+    def request_count(self) -> int:
+        return int(self._header[2])
+
+    @property
+    def version(self) -> int:
+        return int(self._header[3])
+
+    @contextmanager
+    def _exclusive(self):
+        """Serialize buffer updates across worker processes."""
+        if self._lock_fd is None:
+            yield
+            return
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    @property
+    def has_report(self) -> bool:
+        self._sync_report()
+        return bool(self.last_report_json)
+
+    async def set_report(self, report) -> None:
+        """Publish a new report to every worker, serialized once."""
+        report_dict = report.to_dict()
+        report_json = _dumps(report_dict)
+        if len(report_json) > REPORT_CAPACITY:
+            raise ValueError(
+                f"Report of {len(report_json)} bytes exceeds REPORT_CAPACITY"
+            )
+        last_check = datetime.now(timezone.utc)
+        header = self._header
+        with self._exclusive():
+            self._report_buf[: len(report_json)] = np.frombuffer(
+                report_json, dtype=np.uint8
+            )
+            header[5] = len(report_json)
+            header[6] = round(last_check.timestamp() * 1_000_000)
+            header[4] += 1
+            self._report_version = int(header[4])
+        self._load_report(report_json, report_dict, last_check)
+        await self.publish()
+
+    def _sync_report(self) -> None:
+        """Load the shared report if another worker replaced or reset it."""
+        if int(self._header[4]) == self._report_version:
+            return
+        with self._exclusive():
+            self._report_version = int(self._header[4])
+            report_json = self._report_buf[: int(self._header[5])].tobytes()
+            last_check_us = int(self._header[6])
+        if not report_json:
+            self._load_report(b"", None, None)
+            return
+        last_check = datetime.fromtimestamp(last_check_us / 1_000_000, timezone.utc)
+        self._load_report(report_json, _loads(report_json), last_check)
+
+    def _load_report(
+        self,
+        report_json: bytes,
+        report_dict: dict | None,
+        last_check: datetime | None,
+    ) -> None:
+        """Cache the forms served by the status, report and event endpoints."""
+        self.last_report_json = report_json
+        if report_dict is None or last_check is None:
+            self.last_check_iso = None
+            self._report_status = {}
+            self._feature_results = []
+            return
+        self.last_check_iso = last_check.isoformat()
+        self._report_status = {
+            "status": report_dict["status"],
+            "has_drift": report_dict["has_drift"],
+            "drift_ratio": report_dict["drift_ratio"],
+            "drifted_features": report_dict["drifted_features"],
+            "last_check": self.last_check_iso,
+        }
+        self._feature_results = report_dict["feature_results"]
+
+    async def publish(self) -> None:
+        """Bump the state version and wake up all event subscribers."""
+        async with self.changed:
+            with self._exclusive():
+                self._header[3] += 1
+            self.changed.notify_all()
+
+    def status(self) -> dict:
+        """Current drift status, as returned by /drift/status."""
+        if not self.has_report:
+            return {
+                "status": "NO_DATA",
+                "samples_collected": self.n,
+                "total_requests": self.request_count,
+            }
 
-    def __init__(self) -> None:
-        self.samples: list[dict] = []
-        self.last_report = None
-        self.last_check_time = None
-        self.request_count = 0
+        return {
+            **self._report_status,
+            "samples_collected": self.n,
+            "total_requests": self.request_count,
+        }
+
+    def event_payload(self) -> bytes:
+        """Serialized status + feature table, computed once per state version."""
+        version = self.version
+        if self._event_cache is None or self._event_cache[0] != version:
+            payload = self.status()
+            payload["feature_results"] = self._feature_results
+            self._event_cache = (version, _dumps(payload))
+        return self._event_cache[1]
+
+    async def add_batch(self, block: np.ndarray) -> None:
+        """Store a (k, n_features) block, overwriting the oldest samples.
+
+        The block lands in the ring buffer with at most two slice copies
+        per feature (one up to the end of the buffer, one wrapping around).
+        """
+        block = block[-self.capacity :]
+        k = len(block)
+        header = self._header
+        async with self.lock:
+            with self._exclusive():
+                start = int(header[1])
+                header[1] = (start + k) % self.capacity
+                header[0] = min(int(header[0]) + k, self.capacity)
+                header[2] += k
+                first = min(k, self.capacity - start)
+                for i, arr in enumerate(self.buf.values()):
+                    np.copyto(arr[start : start + first], block[:first, i])
+                    np.copyto(arr[: k - first], block[first:, i])
+        await self.publish()
+
+    def samples_matrix(self) -> np.ndarray:
+        """Return a (n, features) snapshot of the buffered samples."""
+        with self._exclusive():
+            n = self.n
+            return np.column_stack([arr[:n] for arr in self.buf.values()])
+
+    async def reset(self) -> None:
+        """Forget all buffered samples and the report, in every worker."""
+        header = self._header
+        with self._exclusive():
+            header[:3] = 0
+            header[5] = 0
+            header[4] += 1
+            self._report_version = int(header[4])
+        self._load_report(b"", None, None)
+        await self.publish()
 
 
 # Global instance
-DRIFT_STATE = SharedDriftState()
+DRIFT_STATE = SharedDriftState(MONITORED_FEATURES, shm_name=os.environ.get(SHM_ENV))
 
 # =============================================================================
 # 2. Reference Data & Monitor
 # =============================================================================
 
 np.random.seed(42)
-reference_data = pd.DataFrame(
-    {
-        "age": np.random.normal(35, 10, 1000).clip(18, 80),
-        "income": np.random.lognormal(10.5, 0.5, 1000),
-        "credit_score": np.random.normal(700, 50, 1000).clip(300, 850),
-        "loan_amount": np.random.lognormal(9, 0.8, 1000),
-    }
+# Columns follow MONITORED_FEATURES; the monitor keeps a read-only copy and
+# fits its detectors on it once, so checks only process production samples.
+REFERENCE_NDARRAY = np.column_stack(
+    [
+        np.random.normal(35, 10, 1000).clip(18, 80),
+        np.random.lognormal(10.5, 0.5, 1000),
+        np.random.normal(700, 50, 1000).clip(300, 850),
+        np.random.lognormal(9, 0.8, 1000),
+    ]
 )
+REFERENCE_NDARRAY.flags.writeable = False
 
-monitor = Monitor(
-    reference_data=reference_data, thresholds={"psi": 0.15, "ks_pvalue": 0.05}
+monitor = Monitor.from_arrays(
+    MONITORED_FEATURES,
+    REFERENCE_NDARRAY,
+    thresholds={"psi": 0.15, "ks_pvalue": 0.05},
+    n_jobs=len(MONITORED_FEATURES),
 )
 
-MONITORED_FEATURES = ["age", "income", "credit_score", "loan_amount"]
 MIN_SAMPLES = 5
 
 # =============================================================================
 # 3. FastAPI App
 # =============================================================================
 
-app = FastAPI(title="DriftWatch Demo")
+app = FastAPI(title="DriftWatch Demo", default_response_class=FastJSONResponse)
+
+
+class Sample(BaseModel):
+    """One loan application, as sent to /predict/batch."""
+
+    age: float
+    income: float
+    credit_score: float
+    loan_amount: float
+
+
+def _decide(income: float, credit_score: float) -> dict:
+    """Dummy model: approval probability from income and credit score."""
+    # 0.5 +/- 0.1 per criterion plus uniform noise in [-0.1, 0.1), written
+    # without branches; the result always lies in [0.2, 0.8) so needs no clamp.
+    approval_prob = (
+        0.2
+        + 0.2 * (credit_score > 700)
+        + 0.2 * (income > 50000)
+        + 0.2 * random.random()
+    )
+
+    return {
+        "approval_probability": round(approval_prob, 3),
+        "decision": "APPROVED" if approval_prob > 0.6 else "DENIED",
+    }
 
 
 @app.post("/predict")
@@ -67,87 +397,90 @@ async def predict(age: float, income: float, credit_score: float, loan_amount: f
     """Prediction endpoint that also collects samples."""
 
     # Store sample in global state
-    DRIFT_STATE.samples.append(
-        {
-            "age": age,
-            "income": income,
-            "credit_score": credit_score,
-            "loan_amount": loan_amount,
-        }
+    await DRIFT_STATE.add_batch(
+        np.array([[age, income, credit_score, loan_amount]], dtype=np.float64)
     )
-    DRIFT_STATE.request_count += 1
 
-    # Dummy prediction
-    score = 0.5
-    score += 0.1 if credit_score > 700 else -0.1
-    score += 0.1 if income > 50000 else -0.1
-    approval_prob = max(0, min(1, score + random.uniform(-0.1, 0.1)))
+    return _decide(income, credit_score)
 
-    return {
-        "approval_probability": round(approval_prob, 3),
-        "decision": "APPROVED" if approval_prob > 0.6 else "DENIED",
-    }
+
+@app.post("/predict/batch")
+async def predict_batch(rows: list[Sample]):
+    """Batch prediction endpoint: ingests all samples in one buffer write."""
+    block = np.asarray(
+        [[r.age, r.income, r.credit_score, r.loan_amount] for r in rows],
+        dtype=np.float64,
+    ).reshape(-1, len(MONITORED_FEATURES))
+    await DRIFT_STATE.add_batch(block)
+
+    return {"predictions": [_decide(r.income, r.credit_score) for r in rows]}
 
 
 @app.get("/drift/status")
 async def drift_status():
     """Get current drift status."""
-    if DRIFT_STATE.last_report is None:
-        return {
-            "status": "NO_DATA",
-            "samples_collected": len(DRIFT_STATE.samples),
-            "total_requests": DRIFT_STATE.request_count,
-        }
-
-    return {
-        "status": DRIFT_STATE.last_report.status.value,
-        "has_drift": DRIFT_STATE.last_report.has_drift(),
-        "drift_ratio": DRIFT_STATE.last_report.drift_ratio(),
-        "drifted_features": DRIFT_STATE.last_report.drifted_features(),
-        "last_check": DRIFT_STATE.last_check_time.isoformat()
-        if DRIFT_STATE.last_check_time
-        else None,
-        "samples_collected": len(DRIFT_STATE.samples),
-        "total_requests": DRIFT_STATE.request_count,
-    }
+    return DRIFT_STATE.status()
+
+
+@app.get("/drift/events")
+async def drift_events():
+    """Server-Sent Events stream pushing the status on every state change."""
+
+    async def stream():
+        seen = -1
+        while True:
+            async with DRIFT_STATE.changed:
+                try:
+                    # Other workers cannot notify this process, so shared
+                    # state is also re-checked every EVENT_POLL_SECONDS.
+                    await asyncio.wait_for(
+                        DRIFT_STATE.changed.wait_for(
+                            lambda seen=seen: DRIFT_STATE.version != seen
+                        ),
+                        timeout=EVENT_POLL_SECONDS if DRIFT_STATE.shared else None,
+                    )
+                except asyncio.TimeoutError:
+                    continue
+                seen = DRIFT_STATE.version
+            yield b"data: " + DRIFT_STATE.event_payload() + b"\n\n"
+
+    return StreamingResponse(stream(), media_type="text/event-stream")
 
 
 @app.get("/drift/report")
 async def drift_report():
     """Get full drift report."""
-    if DRIFT_STATE.last_report is None:
-        return {"error": "No report yet", "samples_collected": len(DRIFT_STATE.samples)}
-    return DRIFT_STATE.last_report.to_dict()
+    if not DRIFT_STATE.has_report:
+        return {"error": "No report yet", "samples_collected": DRIFT_STATE.n}
+    return Response(DRIFT_STATE.last_report_json, media_type="application/json")
 
 
 @app.post("/drift/check")
 async def trigger_check():
     """Manually trigger drift check."""
-    if len(DRIFT_STATE.samples) < MIN_SAMPLES:
+    if DRIFT_STATE.n < MIN_SAMPLES:
         return {
-            "error": f"Not enough samples. Need {MIN_SAMPLES}, have {len(DRIFT_STATE.samples)}"
+            "error": f"Not enough samples. Need {MIN_SAMPLES}, have {DRIFT_STATE.n}"
         }
 
-    production_df = pd.DataFrame(DRIFT_STATE.samples)
-    report = monitor.check(production_df)
+    # The check runs off the event loop while /predict keeps writing into the
+    # ring buffer, so it gets a snapshot rather than views. It is dispatched
+    # to the default executor: the monitor's own pool is busy with features.
+    production = DRIFT_STATE.samples_matrix()
+    loop = asyncio.get_running_loop()
+    report = await loop.run_in_executor(
+        None, monitor.check_arrays, production, MONITORED_FEATURES
+    )
 
-    DRIFT_STATE.last_report = report
-    DRIFT_STATE.last_check_time = datetime.now(timezone.utc)
+    await DRIFT_STATE.set_report(report)
 
-    return {
-        "status": report.status.value,
-        "has_drift": report.has_drift(),
-        "drift_ratio": report.drift_ratio(),
-        "drifted_features": report.drifted_features(),
-    }
+    return DRIFT_STATE.status()
 
 
 @app.post("/drift/reset")
 async def reset_samples():
     """Reset collected samples."""
-    DRIFT_STATE.samples.clear()
-    DRIFT_STATE.request_count = 0
-    DRIFT_STATE.last_report = None
+    await DRIFT_STATE.reset()
     return {"message": "Reset complete"}
 
 
@@ -366,10 +699,7 @@ DASHBOARD_HTML = """
             el.innerHTML = `<div class="log-entry">${new Date().toLocaleTimeString()} ${msg}</div>` + el.innerHTML;
         };
 
-        const update = async () => {
-            const res = await fetch('/drift/status');
-            const d = await res.json();
-
+        const applyUpdate = (d) => {
             const statusEl = document.getElementById('status');
             statusEl.textContent = d.status;
             statusEl.style.color = { OK: 'var(--success)', WARNING: 'var(--warning)', CRITICAL: 'var(--critical)', NO_DATA: 'var(--muted)' }[d.status] || 'var(--text)';
@@ -377,11 +707,8 @@ DASHBOARD_HTML = """
             document.getElementById('samples').textContent = d.samples_collected;
             document.getElementById('ratio').textContent = d.drift_ratio ? (d.drift_ratio * 100).toFixed(0) + '%' : '0%';
 
-            if (d.status !== 'NO_DATA') {
-                const rep = await fetch('/drift/report');
-                const r = await rep.json();
-                if (r.feature_results) {
-                    document.getElementById('tbody').innerHTML = r.feature_results.map(f => `
+            if (d.feature_results.length) {
+                document.getElementById('tbody').innerHTML = d.feature_results.map(f => `
                         <tr>
                             <td style="color: white; font-weight: 600;">${f.feature_name}</td>
                             <td>${f.method}</td>
@@ -389,21 +716,32 @@ DASHBOARD_HTML = """
                             <td style="opacity:0.5">${f.threshold}</td>
                             <td><span class="badge ${f.has_drift ? 'drift' : 'ok'}">${f.has_drift ? 'DRIFT' : 'OK'}</span></td>
                         </tr>
-                    `).join('');
-                }
+                `).join('');
             }
         };
 
+        const BATCH_SIZE = 64;
+
         const send = async (n, drifted) => {
             log(`Sending ${n} ${drifted ? 'drifted' : 'normal'} samples...`);
-            for (let i = 0; i < n; i++) {
-                const d = drifted
-                    ? { age: 65 + Math.random() * 10, income: 150000 + Math.random() * 50000, credit_score: 500 + Math.random() * 100, loan_amount: 200000 + Math.random() * 50000 }
-                    : { age: 35 + Math.random() * 10, income: 45000 + Math.random() * 10000, credit_score: 700 + Math.random() * 50, loan_amount: 10000 + Math.random() * 5000 };
-                await fetch('/predict?' + new URLSearchParams(d), { method: 'POST' });
-            }
+            const rows = Array.from({ length: n }, () => drifted
+                ? { age: 65 + Math.random() * 10, income: 150000 + Math.random() * 50000, credit_score: 500 + Math.random() * 100, loan_amount: 200000 + Math.random() * 50000 }
+                : { age: 35 + Math.random() * 10, income: 45000 + Math.random() * 10000, credit_score: 700 + Math.random() * 50, loan_amount: 10000 + Math.random() * 5000 });
+            // Chunks of BATCH_SIZE rows are posted concurrently; if the batch
+            // endpoint is unavailable, fall back to one /predict per sample.
+            const chunks = [];
+            for (let i = 0; i < rows.length; i += BATCH_SIZE) chunks.push(rows.slice(i, i + BATCH_SIZE));
+            await Promise.all(chunks.map(async (chunk) => {
+                const res = await fetch('/predict/batch', {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify(chunk),
+                });
+                if (res.status === 404) {
+                    await Promise.all(chunk.map(r => fetch('/predict?' + new URLSearchParams(r), { method: 'POST' })));
+                }
+            }));
             log('Done!');
-            update();
         };
 
         const check = async () => {
@@ -412,18 +750,15 @@ DASHBOARD_HTML = """
             const d = await res.json();
             if (d.error) { log('⚠️ ' + d.error); }
             else { log('Result: ' + d.status + (d.has_drift ? ' (Drift detected!)' : '')); }
-            update();
         };
 
         const reset = async () => {
             await fetch('/drift/reset', { method: 'POST' });
             log('Buffer reset.');
             document.getElementById('tbody').innerHTML = '<tr><td colspan="5" style="text-align:center; color: var(--muted); padding: 2rem;">Buffer cleared.</td></tr>';
-            update();
         };
 
-        update();
-        setInterval(update, 2000);
+        new EventSource('/drift/events').onmessage = (e) => applyUpdate(JSON.parse(e.data));
         log('Ready.');
     </script>
 </body>
@@ -431,11 +766,51 @@ DASHBOARD_HTML = """
 """
 
 
+# The page is static: encode and compress it once at import time.
+DASHBOARD_BYTES = DASHBOARD_HTML.encode("utf-8")
+DASHBOARD_GZ = gzip.compress(DASHBOARD_BYTES, compresslevel=9)
+DASHBOARD_HEADERS = {"Vary": "Accept-Encoding", "Cache-Control": "public, max-age=3600"}
+
+
 @app.get("/", response_class=HTMLResponse)
-async def dashboard():
-    return DASHBOARD_HTML
+async def dashboard(request: Request):
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            DASHBOARD_GZ,
+            media_type="text/html",
+            headers={**DASHBOARD_HEADERS, "Content-Encoding": "gzip"},
+        )
+    return Response(DASHBOARD_BYTES, media_type="text/html", headers=DASHBOARD_HEADERS)
 
 
 if __name__ == "__main__":
     print("🚀 DriftWatch Demo: http://localhost:8000")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    workers = int(os.environ.get("DEMO_WORKERS", "1"))
+    if workers > 1 and fcntl is None:
+        print("Several workers need fcntl (POSIX); running a single worker.")
+        workers = 1
+
+    # Workers attach to one shared buffer, so /drift/check sees the samples
+    # ingested by every worker and every worker serves the latest report.
+    shm = None
+    if workers > 1:
+        shm = create_shared_buffer(len(MONITORED_FEATURES), BUFFER_CAPACITY)
+        os.environ[SHM_ENV] = shm.name
+
+    try:
+        uvicorn.run(
+            # Several workers need an import string so each process can load the app
+            f"{Path(__file__).stem}:app" if workers > 1 else app,
+            host="0.0.0.0",
+            port=8000,
+            # C event loop and HTTP parser when available, pure Python otherwise
+            loop="uvloop" if find_spec("uvloop") else "asyncio",
+            http="httptools" if find_spec("httptools") else "h11",
+            workers=workers,
+            access_log=False,
+        )
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+            _lock_path(shm.name).unlink(missing_ok=True)
@@ -24,12 +24,22 @@ Multi-Drift Monitoring:
     >>> print(report.drift_types_detected())
 """
 
-from driftwatch.core.concept_monitor import ConceptMonitor
-from driftwatch.core.drift_suite import DriftSuite
-from driftwatch.core.monitor import Monitor
-from driftwatch.core.prediction_monitor import PredictionMonitor
-from driftwatch.core.report import ComprehensiveDriftReport, DriftReport, DriftType
-from driftwatch.explain import DriftExplainer, DriftVisualizer
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from driftwatch.core.concept_monitor import ConceptMonitor
+    from driftwatch.core.drift_suite import DriftSuite
+    from driftwatch.core.monitor import Monitor
+    from driftwatch.core.prediction_monitor import PredictionMonitor
+    from driftwatch.core.report import (
+        ComprehensiveDriftReport,
+        DriftReport,
+        DriftType,
+    )
+    from driftwatch.explain import DriftExplainer, DriftVisualizer
 
 __version__ = "0.4.0"
 __all__ = [
@@ -44,3 +54,30 @@ __all__ = [
     "PredictionMonitor",
     "__version__",
 ]
+
+# Public names and the module defining them, imported on first access
+# (PEP 562) so that `import driftwatch` and the CLI start quickly.
+_LAZY_IMPORTS = {
+    "ComprehensiveDriftReport": "driftwatch.core.report",
+    "ConceptMonitor": "driftwatch.core.concept_monitor",
+    "DriftExplainer": "driftwatch.explain",
+    "DriftReport": "driftwatch.core.report",
+    "DriftSuite": "driftwatch.core.drift_suite",
+    "DriftType": "driftwatch.core.report",
+    "DriftVisualizer": "driftwatch.explain",
+    "Monitor": "driftwatch.core.monitor",
+    "PredictionMonitor": "driftwatch.core.prediction_monitor",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
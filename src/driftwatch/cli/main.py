@@ -7,15 +7,28 @@ from __future__ import annotations
 
 import json
 from pathlib import Path  # noqa: TC003
-from typing import Annotated
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Annotated, Any
 
-import pandas as pd
 import typer
 from rich.console import Console
-from rich.table import Table
 
-from driftwatch import Monitor
-from driftwatch.core.report import DriftReport, DriftStatus
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import pandas as pd
+    from rich.table import Table
+    from rich.text import Text
+
+    from driftwatch.core.report import DriftReport
+
+# pandas, the monitor and rich tables are imported inside the commands
+# that use them, so `driftwatch --help` and `driftwatch report` start fast.
 
 app = typer.Typer(
     name="driftwatch",
@@ -24,23 +37,154 @@ app = typer.Typer(
 )
 console = Console()
 
+# Color of each DriftStatus value
+_STATUS_COLORS = MappingProxyType(
+    {"OK": "green", "WARNING": "yellow", "CRITICAL": "red"}
+)
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize to indented JSON, with orjson when it is installed.
+
+    orjson writes non-finite floats as null where the json module writes
+    Infinity/NaN, which are not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write indented JSON to a file without building an extra copy.
 
-def load_dataframe(path: Path) -> pd.DataFrame:
+    orjson's bytes are written as is; the json module fallback streams
+    into a buffered file instead of building the whole string first.
+    """
+    if orjson is not None:
+        path.write_bytes(_dump_json(data))
+        return
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def _load_json(path: Path) -> Any:
+    """Parse a JSON file, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def load_dataframe(path: Path, columns: list[str] | None = None) -> pd.DataFrame:
     """Load dataframe from CSV or Parquet file.
 
     Args:
         path: Path to the file
+        columns: Only load these columns. Parquet files skip the other
+            columns on disk; CSV files still scan every row but only parse
+            the selected columns. Requested columns that are absent from a
+            CSV file are ignored.
 
     Returns:
         Loaded pandas DataFrame
 
+    Raises:
+        typer.BadParameter: If file format is not supported
+    """
+    import pandas as pd
+
+    if path.suffix.lower() == ".csv":
+        try:
+            # Multithreaded parser, used when pyarrow is installed
+            return pd.read_csv(path, engine="pyarrow", usecols=columns)
+        except (ImportError, ValueError, KeyError):
+            # pyarrow missing, a dialect it cannot parse, or requested
+            # columns absent from the file: use the default parser
+            pass
+        if columns is None:
+            return pd.read_csv(path)
+        wanted = set(columns)
+        return pd.read_csv(path, usecols=lambda name: name in wanted)
+    elif path.suffix.lower() in [".parquet", ".pq"]:
+        return pd.read_parquet(path, columns=columns)
+    else:
+        raise typer.BadParameter(
+            f"Unsupported file format: {path.suffix}. Use .csv or .parquet"
+        )
+
+
+def read_columns(path: Path) -> list[str]:
+    """Read the column names of a CSV or Parquet file without its rows.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Column names, from the CSV header or the Parquet schema
+
+    Raises:
+        typer.BadParameter: If file format is not supported
+    """
+    if path.suffix.lower() == ".csv":
+        import pandas as pd
+
+        return pd.read_csv(path, nrows=0).columns.tolist()
+    elif path.suffix.lower() in [".parquet", ".pq"]:
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Selecting Parquet columns requires pyarrow. "
+                "Install with: pip install pyarrow"
+            ) from e
+
+        return list(pq.read_schema(path).names)
+    else:
+        raise typer.BadParameter(
+            f"Unsupported file format: {path.suffix}. Use .csv or .parquet"
+        )
+
+
+def iter_dataframe(
+    path: Path,
+    chunk_size: int,
+    columns: list[str] | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Load a CSV or Parquet file as DataFrames of at most ``chunk_size`` rows.
+
+    Args:
+        path: Path to the file
+        chunk_size: Maximum number of rows per chunk
+        columns: Only load these columns, as in `load_dataframe`
+
+    Yields:
+        Consecutive chunks of the file
+
     Raises:
         typer.BadParameter: If file format is not supported
     """
     if path.suffix.lower() == ".csv":
-        return pd.read_csv(path)
+        import pandas as pd
+
+        usecols = None
+        if columns is not None:
+            wanted = set(columns)
+            usecols = lambda name: name in wanted  # noqa: E731
+        with pd.read_csv(path, chunksize=chunk_size, usecols=usecols) as reader:
+            yield from reader
     elif path.suffix.lower() in [".parquet", ".pq"]:
-        return pd.read_parquet(path)
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Reading Parquet files in chunks requires pyarrow. "
+                "Install with: pip install pyarrow"
+            ) from e
+
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns):
+            yield batch.to_pandas()
     else:
         raise typer.BadParameter(
             f"Unsupported file format: {path.suffix}. Use .csv or .parquet"
@@ -90,28 +234,56 @@ def check(
         Path | None,
         typer.Option("--output", "-o", help="Save report to JSON file"),
     ] = None,
+    chunk_size: Annotated[
+        int | None,
+        typer.Option(
+            "--chunk-size",
+            min=1,
+            help="Read production data in chunks of this many rows",
+        ),
+    ] = None,
+    features: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--feature",
+            "-f",
+            help="Only check this feature (repeatable; default: all columns)",
+        ),
+    ] = None,
 ) -> None:
     """Check for drift between reference and production datasets.
 
+    With --chunk-size, production data is streamed through the monitor
+    chunk by chunk instead of being loaded at once. With --feature, only
+    the selected columns are read from either file.
+
     Example:
         driftwatch check --ref train.csv --prod prod.csv
         driftwatch check -r train.parquet -p prod.parquet --threshold-psi 0.15
+        driftwatch check -r train.csv -p huge_prod.csv --chunk-size 100000
+        driftwatch check -r train.parquet -p prod.parquet -f age -f income
     """
+    from driftwatch.core.monitor import Monitor
+    from driftwatch.core.report import DriftStatus
+
     console.print("[bold blue]🔍 DriftWatch - Drift Detection[/bold blue]\n")
 
     # Load datasets
     console.print(f"Loading reference data from [cyan]{ref}[/cyan]...")
-    ref_df = load_dataframe(ref)
+    if features:
+        # Checked before loading: Parquet readers fail on unknown columns
+        available = set(read_columns(ref))
+        missing = [name for name in features if name not in available]
+        if missing:
+            raise typer.BadParameter(
+                f"Features not found in reference data: {', '.join(missing)}",
+                param_hint="--feature",
+            )
+    ref_df = load_dataframe(ref, columns=features)
     console.print(
         f"✓ Loaded {len(ref_df):,} samples with {len(ref_df.columns)} features\n"
     )
 
-    console.print(f"Loading production data from [cyan]{prod}[/cyan]...")
-    prod_df = load_dataframe(prod)
-    console.print(
-        f"✓ Loaded {len(prod_df):,} samples with {len(prod_df.columns)} features\n"
-    )
-
     # Create monitor
     console.print("Initializing monitor...")
     monitor = Monitor(
@@ -123,16 +295,32 @@ def check(
         },
     )
 
-    # Run drift check
-    console.print("Running drift detection...\n")
-    report = monitor.check(prod_df)
+    # Run drift check, loading only the reference columns of production data
+    columns = ref_df.columns.tolist()
+    if chunk_size is None:
+        console.print(f"Loading production data from [cyan]{prod}[/cyan]...")
+        prod_df = load_dataframe(prod, columns=columns)
+        console.print(
+            f"✓ Loaded {len(prod_df):,} samples with {len(prod_df.columns)} features\n"
+        )
+        console.print("Running drift detection...\n")
+        report = monitor.check(prod_df)
+    else:
+        console.print(
+            f"Running drift detection on [cyan]{prod}[/cyan] "
+            f"in chunks of {chunk_size:,} rows..."
+        )
+        for chunk in iter_dataframe(prod, chunk_size, columns=columns):
+            monitor.update(chunk)
+        report = monitor.finalize()
+        console.print(f"✓ Processed {report.production_size:,} samples\n")
 
     # Display results
     _display_report(report)
 
     # Save to file if requested
     if output:
-        output.write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
+        _write_json(output, report.to_dict())
         console.print(f"\n✓ Report saved to [cyan]{output}[/cyan]")
 
     # Exit with appropriate code
@@ -177,17 +365,16 @@ def report(
         driftwatch report drift_report.json --format table --output report.txt
     """
     # Load report
-    data = json.loads(input_file.read_text(encoding="utf-8"))
+    data = _load_json(input_file)
 
     # Reconstruct report (basic reconstruction)
     # In a real scenario, you'd have a from_dict method
     if format == "json":
-        output_str = json.dumps(data, indent=2)
         if output:
-            output.write_text(output_str, encoding="utf-8")
+            _write_json(output, data)
             console.print(f"✓ Report saved to [cyan]{output}[/cyan]")
         else:
-            console.print(output_str)
+            console.print(_dump_json(data).decode("utf-8"))
     else:
         # Table format
         _display_dict_report(data)
@@ -198,20 +385,36 @@ def report(
             )
 
 
+def _feature_table() -> tuple[Table, Text, Text]:
+    """Create the per-feature results table and its two status cells.
+
+    Cells are rich Text objects, so rows are not run through the markup
+    parser and the status cells are built once per table.
+    """
+    from rich.table import Table
+    from rich.text import Text
+
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("Feature", style="cyan")
+    table.add_column("Method")
+    table.add_column("Score", justify="right")
+    table.add_column("Threshold", justify="right")
+    table.add_column("Status")
+
+    return table, Text("✓ OK", style="green"), Text("⚠️ DRIFT", style="red")
+
+
 def _display_report(report: DriftReport) -> None:
     """Display drift report with Rich formatting."""
+    from rich.text import Text
+
     # Status
-    status_colors = {
-        DriftStatus.OK: "green",
-        DriftStatus.WARNING: "yellow",
-        DriftStatus.CRITICAL: "red",
-    }
-    color = status_colors.get(report.status, "white")
+    color = _STATUS_COLORS.get(report.status.value, "white")
     console.print(f"[bold {color}]Status: {report.status.value}[/bold {color}]")
 
     if report.has_drift():
         console.print(
-            f"[{color}]Drift Detected: {len(report.drifted_features())}/{len(report.feature_results)} features[/{color}]"
+            f"[{color}]Drift Detected: {report.n_drifted}/{report.n_features} features[/{color}]"
         )
         console.print(f"[{color}]Drift Ratio: {report.drift_ratio():.1%}[/{color}]\n")
     else:
@@ -220,23 +423,14 @@ def _display_report(report: DriftReport) -> None:
     # Feature table
     console.print("[bold]Feature Analysis:[/bold]\n")
 
-    table = Table(show_header=True, header_style="bold cyan")
-    table.add_column("Feature", style="cyan")
-    table.add_column("Method")
-    table.add_column("Score", justify="right")
-    table.add_column("Threshold", justify="right")
-    table.add_column("Status")
-
+    table, ok_cell, drift_cell = _feature_table()
     for result in report.feature_results:
-        status_str = "⚠️ DRIFT" if result.has_drift else "✓ OK"
-        status_color = "red" if result.has_drift else "green"
-
         table.add_row(
-            result.feature_name,
-            result.method,
-            f"{result.score:.4f}",
-            f"{result.threshold:.4f}",
-            f"[{status_color}]{status_str}[/{status_color}]",
+            Text(result.feature_name),
+            Text(result.method),
+            Text(f"{result.score:.4f}"),
+            Text(f"{result.threshold:.4f}"),
+            drift_cell if result.has_drift else ok_cell,
         )
 
     console.print(table)
@@ -244,27 +438,22 @@ def _display_report(report: DriftReport) -> None:
 
 def _display_dict_report(data: dict) -> None:
     """Display drift report from dictionary data."""
+    from rich.text import Text
+
     console.print(f"[bold]Status:[/bold] {data.get('status', 'UNKNOWN')}")
 
     if data.get("feature_results"):
-        table = Table(show_header=True, header_style="bold cyan")
-        table.add_column("Feature", style="cyan")
-        table.add_column("Method")
-        table.add_column("Score", justify="right")
-        table.add_column("Threshold", justify="right")
-        table.add_column("Status")
-
+        table, ok_cell, drift_cell = _feature_table()
         for result in data["feature_results"]:
-            has_drift = result.get("has_drift", False)
-            status_str = "⚠️ DRIFT" if has_drift else "✓ OK"
-            status_color = "red" if has_drift else "green"
-
+            # Reports store NaN and infinite scores as null, so the actual
+            # value is unknown here
+            score = result["score"]
             table.add_row(
-                result["feature_name"],
-                result["method"],
-                f"{result['score']:.4f}",
-                f"{result['threshold']:.4f}",
-                f"[{status_color}]{status_str}[/{status_color}]",
+                Text(result["feature_name"]),
+                Text(result["method"]),
+                Text("n/a" if score is None else f"{score:.4f}"),
+                Text(f"{result['threshold']:.4f}"),
+                drift_cell if result.get("has_drift", False) else ok_cell,
             )
 
         console.print(table)
@@ -1,10 +1,20 @@
 """Core module containing Monitor, DriftReport, and drift type monitors."""
 
-from driftwatch.core.concept_monitor import ConceptMonitor
-from driftwatch.core.drift_suite import DriftSuite
-from driftwatch.core.monitor import Monitor
-from driftwatch.core.prediction_monitor import PredictionMonitor
-from driftwatch.core.report import ComprehensiveDriftReport, DriftReport, DriftType
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from driftwatch.core.concept_monitor import ConceptMonitor
+    from driftwatch.core.drift_suite import DriftSuite
+    from driftwatch.core.monitor import Monitor
+    from driftwatch.core.prediction_monitor import PredictionMonitor
+    from driftwatch.core.report import (
+        ComprehensiveDriftReport,
+        DriftReport,
+        DriftType,
+    )
 
 __all__ = [
     "ComprehensiveDriftReport",
@@ -15,3 +25,28 @@ __all__ = [
     "Monitor",
     "PredictionMonitor",
 ]
+
+# Public names and the submodule defining them. Submodules are imported on
+# first access (PEP 562), so e.g. loading DriftReport does not pull SciPy in.
+_LAZY_IMPORTS = {
+    "ComprehensiveDriftReport": "driftwatch.core.report",
+    "ConceptMonitor": "driftwatch.core.concept_monitor",
+    "DriftReport": "driftwatch.core.report",
+    "DriftSuite": "driftwatch.core.drift_suite",
+    "DriftType": "driftwatch.core.report",
+    "Monitor": "driftwatch.core.monitor",
+    "PredictionMonitor": "driftwatch.core.prediction_monitor",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
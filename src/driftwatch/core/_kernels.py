@@ -0,0 +1,305 @@
+"""
+Inner loops of the performance metrics used by ConceptMonitor.
+
+The loops are compiled with Numba when it is installed
+(``pip install driftwatch[fast]``), without holding the GIL so that
+ConceptMonitor(n_jobs=...) can run them on threads. Without Numba,
+equivalent NumPy implementations are used, so results do not depend on
+the extra.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import numpy as np
+
+# dtype kinds the compiled loops accept (bool, int, uint, float)
+_NUMERIC_KINDS = "biuf"
+
+
+def _binary_codes(y: np.ndarray) -> np.ndarray | None:
+    """Return ``y`` as int8 0/1 codes, or None if it is not binary."""
+    if y.dtype.kind == "b":
+        return y.view(np.int8)
+    if y.dtype.kind not in "iuf":
+        return None
+    with np.errstate(invalid="ignore"):
+        codes = y.astype(np.int8)
+    if codes.min() < 0 or codes.max() > 1 or not np.array_equal(codes, y):
+        return None
+    return codes
+
+
+def _confusion_counts_numpy(
+    y_true: np.ndarray, y_pred: np.ndarray
+) -> np.ndarray | None:
+    """Counts of (t=0,p=0), (0,1), (1,0), (1,1) via a single bincount."""
+    true_codes = _binary_codes(y_true)
+    pred_codes = _binary_codes(y_pred)
+    if true_codes is None or pred_codes is None:
+        return None
+    # (t << 1) | p with a single temporary, viewed as uint8 for bincount
+    codes = np.left_shift(true_codes, 1)
+    codes |= pred_codes
+    return np.bincount(codes.view(np.uint8), minlength=4)
+
+
+def _ternary_codes(y: np.ndarray) -> np.ndarray:
+    """Encode labels as 0, 1, or 2 for any other value."""
+    codes = np.full(len(y), 2, dtype=np.uint8)
+    codes[y == 0] = 0
+    codes[y == 1] = 1
+    return codes
+
+
+def _confusion_counts_loop(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    """
+    Counts of (t=0,p=0), (0,1), (1,0), (1,1) in one pass.
+
+    Returns an array of -1 as soon as a value other than 0/1 is found.
+    """
+    counts = np.zeros(4, dtype=np.int64)
+    for i in range(len(y_true)):
+        t = y_true[i]
+        p = y_pred[i]
+        if (t != 0 and t != 1) or (p != 0 and p != 1):
+            counts[:] = -1
+            return counts
+        counts[2 * int(t) + int(p)] += 1
+    return counts
+
+
+def _error_sums_numpy(y_true: np.ndarray, y_pred: np.ndarray) -> tuple[float, float]:
+    """Sum of absolute and of squared prediction errors."""
+    # float64 so that narrow integer labels cannot overflow
+    diff = np.subtract(y_true, y_pred, dtype=np.float64)
+    # dot() squares and sums without a temporary; abs() then reuses diff
+    sq_sum = float(np.dot(diff, diff))
+    return float(np.add.reduce(np.abs(diff, out=diff))), sq_sum
+
+
+def _error_sums_loop(y_true: np.ndarray, y_pred: np.ndarray) -> tuple[float, float]:
+    """Sum of absolute and of squared prediction errors, in one pass."""
+    abs_sum = 0.0
+    sq_sum = 0.0
+    for i in range(len(y_true)):
+        d = np.float64(y_true[i]) - np.float64(y_pred[i])
+        abs_sum += abs(d)
+        sq_sum += d * d
+    return abs_sum, sq_sum
+
+
+def _regression_sums_numpy(
+    y_true: np.ndarray, y_pred: np.ndarray
+) -> tuple[float, float, float, float]:
+    """Error sums plus sum and sum of squares of ``y_true - y_true[0]``."""
+    abs_sum, sq_sum = _error_sums_numpy(y_true, y_pred)
+    shifted = np.subtract(y_true, y_true[0], dtype=np.float64)
+    return (
+        abs_sum,
+        sq_sum,
+        float(np.add.reduce(shifted)),
+        float(np.dot(shifted, shifted)),
+    )
+
+
+def _regression_sums_loop(
+    y_true: np.ndarray, y_pred: np.ndarray
+) -> tuple[float, float, float, float]:
+    """
+    Error sums plus sum and sum of squares of ``y_true - y_true[0]``,
+    in one pass.
+    """
+    abs_sum = 0.0
+    sq_sum = 0.0
+    y_sum = 0.0
+    y_sq_sum = 0.0
+    shift = np.float64(y_true[0])
+    for i in range(len(y_true)):
+        t = np.float64(y_true[i])
+        d = t - np.float64(y_pred[i])
+        abs_sum += abs(d)
+        sq_sum += d * d
+        s = t - shift
+        y_sum += s
+        y_sq_sum += s * s
+    return abs_sum, sq_sum, y_sum, y_sq_sum
+
+
+def _mape_numpy(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    """Mean absolute percentage error over the non-zero true values."""
+    nonzero = y_true != 0
+    n = int(np.count_nonzero(nonzero))
+    if n == 0:
+        return 0.0
+    ratio = np.zeros(len(y_true))
+    np.divide(
+        np.subtract(y_true, y_pred, dtype=np.float64),
+        y_true,
+        out=ratio,
+        where=nonzero,
+    )
+    return float(np.add.reduce(np.abs(ratio, out=ratio)) / n)
+
+
+def _mape_loop(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    """Mean absolute percentage error over the non-zero true values, in one pass."""
+    total = 0.0
+    n = 0
+    for i in range(len(y_true)):
+        t = np.float64(y_true[i])
+        if t != 0:
+            total += abs((t - np.float64(y_pred[i])) / t)
+            n += 1
+    return total / n if n else 0.0
+
+
+# Compiled loops, set by _load_kernels() on first use: importing Numba
+# takes about 0.3s, which `import driftwatch` should not pay
+_confusion_kernel: Any = None
+_error_kernel: Any = None
+_regression_kernel: Any = None
+_mape_kernel: Any = None
+_kernels_loaded = False
+_load_lock = threading.Lock()
+
+
+def _load_kernels() -> None:
+    """Wrap the loops with Numba when it is installed."""
+    global _kernels_loaded
+    global _confusion_kernel, _error_kernel, _regression_kernel, _mape_kernel
+    with _load_lock:
+        if _kernels_loaded:
+            return
+        try:
+            import numba
+        except ImportError:  # pragma: no cover - depends on the environment
+            pass
+        else:
+            jit = numba.njit(cache=True, nogil=True)
+            _confusion_kernel = jit(_confusion_counts_loop)
+            _error_kernel = jit(_error_sums_loop)
+            _regression_kernel = jit(_regression_sums_loop)
+            _mape_kernel = jit(_mape_loop)
+        _kernels_loaded = True
+
+
+def _compilable(*arrays: np.ndarray) -> bool:
+    if not _kernels_loaded:
+        _load_kernels()
+    return all(a.dtype.kind in _NUMERIC_KINDS for a in arrays)
+
+
+def confusion_counters(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+) -> tuple[int, int, int, int] | None:
+    """
+    Count true/false positives/negatives of binary 0/1 labels.
+
+    Args:
+        y_true: True labels
+        y_pred: Predicted labels
+
+    Returns:
+        (tp, fp, tn, fn), or None if either array is not binary 0/1
+    """
+    if _compilable(y_true, y_pred) and _confusion_kernel is not None:
+        counts = _confusion_kernel(y_true, y_pred)
+        if counts[0] < 0:
+            return None
+    else:
+        counts = _confusion_counts_numpy(y_true, y_pred)
+        if counts is None:
+            return None
+    tn, fp, fn, tp = (int(c) for c in counts)
+    return tp, fp, tn, fn
+
+
+def error_sums(y_true: np.ndarray, y_pred: np.ndarray) -> tuple[float, float]:
+    """
+    Sum the absolute and squared errors ``y_true - y_pred``.
+
+    Args:
+        y_true: True values
+        y_pred: Predicted values
+
+    Returns:
+        (sum of absolute errors, sum of squared errors)
+    """
+    if _compilable(y_true, y_pred) and _error_kernel is not None:
+        abs_sum, sq_sum = _error_kernel(y_true, y_pred)
+        return float(abs_sum), float(sq_sum)
+    return _error_sums_numpy(y_true, y_pred)
+
+
+def regression_sums(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+) -> tuple[float, float, float]:
+    """
+    Sum the absolute and squared errors and the total sum of squares.
+
+    The total sum of squares of ``y_true`` is accumulated in the same
+    pass as the errors, on values shifted by ``y_true[0]`` so that
+    ``sum(s**2) - sum(s)**2 / n`` does not lose precision when the
+    mean is large compared to the spread.
+
+    Args:
+        y_true: Non-empty true values
+        y_pred: Predicted values
+
+    Returns:
+        (sum of absolute errors, sum of squared errors, total sum of squares)
+    """
+    if _compilable(y_true, y_pred) and _regression_kernel is not None:
+        abs_sum, sq_sum, y_sum, y_sq_sum = _regression_kernel(y_true, y_pred)
+    else:
+        abs_sum, sq_sum, y_sum, y_sq_sum = _regression_sums_numpy(y_true, y_pred)
+    ss_tot = max(float(y_sq_sum) - float(y_sum) ** 2 / len(y_true), 0.0)
+    return float(abs_sum), float(sq_sum), ss_tot
+
+
+def mape(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    """
+    Mean absolute percentage error, skipping samples whose true value is 0.
+
+    Args:
+        y_true: True values
+        y_pred: Predicted values
+
+    Returns:
+        Mean of ``|(y_true - y_pred) / y_true|``, or 0.0 if every true
+        value is 0
+    """
+    if _compilable(y_true, y_pred) and _mape_kernel is not None:
+        return float(_mape_kernel(y_true, y_pred))
+    return _mape_numpy(y_true, y_pred)
+
+
+def positive_class_counters(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+) -> tuple[int, int, int]:
+    """
+    Count true positives, false positives and false negatives of label 1.
+
+    Unlike `confusion_counters`, labels other than 0/1 are allowed: a
+    false positive needs a true label of 0 and a false negative a
+    predicted label of 0, as in binary precision and recall.
+
+    Args:
+        y_true: True labels
+        y_pred: Predicted labels
+
+    Returns:
+        (tp, fp, fn)
+    """
+    codes = _ternary_codes(y_true)
+    codes *= 3
+    codes += _ternary_codes(y_pred)
+    counts = np.bincount(codes, minlength=9)
+    # code = 3 * t + p
+    return int(counts[4]), int(counts[1]), int(counts[3])
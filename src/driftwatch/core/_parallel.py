@@ -0,0 +1,23 @@
+"""Thread count selection shared by the monitors."""
+
+from __future__ import annotations
+
+import os
+
+
+def n_threads(n_jobs: int) -> int:
+    """
+    Number of threads requested by an ``n_jobs`` argument.
+
+    Negative values count back from the number of CPUs, as in joblib:
+    -1 uses every CPU, -2 all but one, and so on.
+
+    Args:
+        n_jobs: Requested number of threads
+
+    Returns:
+        Number of threads, at least 1
+    """
+    if n_jobs < 0:
+        n_jobs = (os.cpu_count() or 1) + 1 + n_jobs
+    return max(n_jobs, 1)
@@ -7,16 +7,28 @@ by tracking model performance metrics over time.
 
 from __future__ import annotations
 
+import math
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, ClassVar
+from functools import partial
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, ClassVar
 
 import numpy as np
+from scipy.stats import rankdata
 
+from driftwatch.core import _kernels
+from driftwatch.core._parallel import n_threads
 from driftwatch.core.report import DriftReport, DriftType, FeatureDriftResult
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     import pandas as pd
 
+# Computes one metric, or several fused ones, from (y_true, y_pred)
+_MetricGroup = Callable[[np.ndarray, np.ndarray], dict[str, float]]
+
 
 @dataclass
 class PerformanceResult:
@@ -62,6 +74,10 @@ class ConceptMonitor:
         degradation_mode: How to measure degradation:
             - "absolute": Absolute difference (default)
             - "relative": Relative percentage change
+        n_jobs: Number of threads used to compute metric groups of the
+            reference and production periods concurrently, for inputs of
+            at least PARALLEL_MIN_SAMPLES samples. -1 uses every CPU.
+            Default is 1 (sequential).
 
     Example:
         ```python
@@ -102,21 +118,30 @@ class ConceptMonitor:
     # Metrics where lower is better
     LOWER_IS_BETTER: ClassVar[set[str]] = {"mae", "mse", "rmse", "mape"}
 
+    # Metrics derived from the confusion counters / squared-error sums
+    CONFUSION_METRICS: ClassVar[set[str]] = {"accuracy", "precision", "recall", "f1"}
+    ERROR_METRICS: ClassVar[set[str]] = {"mae", "mse", "rmse", "r2"}
+
+    # Smallest period size for which n_jobs > 1 uses threads
+    PARALLEL_MIN_SAMPLES: ClassVar[int] = 100_000
+
     DEFAULT_CLASSIFICATION_METRICS: ClassVar[list[str]] = ["accuracy", "f1"]
     DEFAULT_REGRESSION_METRICS: ClassVar[list[str]] = ["rmse", "r2"]
 
-    DEFAULT_THRESHOLDS: ClassVar[dict[str, float]] = {
-        "accuracy": 0.05,
-        "f1": 0.05,
-        "precision": 0.05,
-        "recall": 0.05,
-        "auc_roc": 0.05,
-        "mae": 0.1,
-        "mse": 0.1,
-        "rmse": 0.1,
-        "r2": 0.1,
-        "mape": 0.1,
-    }
+    DEFAULT_THRESHOLDS: ClassVar[Mapping[str, float]] = MappingProxyType(
+        {
+            "accuracy": 0.05,
+            "f1": 0.05,
+            "precision": 0.05,
+            "recall": 0.05,
+            "auc_roc": 0.05,
+            "mae": 0.1,
+            "mse": 0.1,
+            "rmse": 0.1,
+            "r2": 0.1,
+            "mape": 0.1,
+        }
+    )
 
     def __init__(
         self,
@@ -124,6 +149,7 @@ class ConceptMonitor:
         metrics: list[str] | None = None,
         thresholds: dict[str, float] | None = None,
         degradation_mode: str = "absolute",
+        n_jobs: int = 1,
     ) -> None:
         if task not in ("classification", "regression"):
             raise ValueError(
@@ -132,7 +158,12 @@ class ConceptMonitor:
 
         self.task = task
         self.degradation_mode = degradation_mode
-        self.thresholds = {**self.DEFAULT_THRESHOLDS, **(thresholds or {})}
+        # Read-only, so the defaults can be shared instead of copied
+        self.thresholds: Mapping[str, float] = (
+            MappingProxyType({**self.DEFAULT_THRESHOLDS, **thresholds})
+            if thresholds
+            else self.DEFAULT_THRESHOLDS
+        )
 
         if metrics is None:
             self.metrics = (
@@ -149,6 +180,16 @@ class ConceptMonitor:
                 )
             self.metrics = metrics
 
+        # Functions computing self.metrics, built on first use
+        self._plan: tuple[_MetricGroup, ...] = ()
+        self._plan_key: tuple[str, ...] | None = None
+
+        # Metric kernels release the GIL, so groups run well on threads
+        n_workers = n_threads(n_jobs)
+        self._pool = (
+            ThreadPoolExecutor(max_workers=n_workers) if n_workers > 1 else None
+        )
+
     def check(
         self,
         y_true_ref: np.ndarray | pd.Series,
@@ -173,10 +214,10 @@ class ConceptMonitor:
             ValueError: If inputs are empty or have mismatched lengths.
         """
         # Validate inputs
-        y_true_ref_arr = np.asarray(y_true_ref)
-        y_pred_ref_arr = np.asarray(y_pred_ref)
-        y_true_prod_arr = np.asarray(y_true_prod)
-        y_pred_prod_arr = np.asarray(y_pred_prod)
+        y_true_ref_arr = self._coerce(y_true_ref)
+        y_pred_ref_arr = self._coerce(y_pred_ref)
+        y_true_prod_arr = self._coerce(y_true_prod)
+        y_pred_prod_arr = self._coerce(y_pred_prod)
 
         if len(y_true_ref_arr) == 0 or len(y_pred_ref_arr) == 0:
             raise ValueError("Reference data cannot be empty")
@@ -188,8 +229,9 @@ class ConceptMonitor:
             raise ValueError("Production y_true and y_pred must have the same length")
 
         # Compute metrics for both periods
-        ref_metrics = self._compute_metrics(y_true_ref_arr, y_pred_ref_arr)
-        prod_metrics = self._compute_metrics(y_true_prod_arr, y_pred_prod_arr)
+        ref_metrics, prod_metrics = self._compute_period_metrics(
+            [(y_true_ref_arr, y_pred_ref_arr), (y_true_prod_arr, y_pred_prod_arr)]
+        )
 
         # Compare and build results
         feature_results: list[FeatureDriftResult] = []
@@ -253,96 +295,237 @@ class ConceptMonitor:
             production_size=len(y_true_prod_arr),
         )
 
+    def close(self) -> None:
+        """
+        Shut down the thread pool created for ``n_jobs > 1``.
+
+        The monitor stays usable and computes metrics sequentially
+        afterwards. The pool is also released when the monitor is
+        garbage collected.
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _coerce(self, values: np.ndarray | pd.Series) -> np.ndarray:
+        """
+        Convert labels or predictions to a contiguous array, once per check.
+
+        Regression values become float64. Classification values that are
+        whole numbers fitting in int8 (e.g. 0/1 labels stored as int64 or
+        float) become int8; other values, such as probability scores or
+        string labels, only lose their container.
+        """
+        if self.task == "regression":
+            return np.ascontiguousarray(self._to_numpy(values, np.float64))
+
+        arr = np.ascontiguousarray(self._to_numpy(values))
+        if arr.dtype.kind == "b":
+            return arr.view(np.int8)
+        if arr.dtype.kind in "iuf" and arr.dtype != np.int8 and len(arr):
+            with np.errstate(invalid="ignore"):
+                codes = arr.astype(np.int8)
+            if np.array_equal(codes, arr):
+                return codes
+        return arr
+
+    @staticmethod
+    def _to_numpy(
+        values: np.ndarray | pd.Series,
+        dtype: type[np.floating[Any]] | None = None,
+    ) -> np.ndarray:
+        """
+        Extract the values of a Series without falling back to object arrays.
+
+        Nullable and Arrow-backed Series are converted to their NumPy
+        counterpart dtype (float64 with NaN when values are missing)
+        rather than to an object array of Python scalars. NumPy-backed
+        Series are returned without a copy when the dtype already matches.
+        """
+        if isinstance(values, np.ndarray) or not hasattr(values, "to_numpy"):
+            return np.asarray(values, dtype=dtype)
+        if dtype is None:
+            numpy_dtype = getattr(values.dtype, "numpy_dtype", None)
+            if numpy_dtype is None or numpy_dtype.kind not in "biuf":
+                return values.to_numpy(copy=False)
+            dtype = np.float64 if values.hasnans else numpy_dtype
+        if np.dtype(dtype).kind == "f":
+            return values.to_numpy(dtype=dtype, na_value=np.nan, copy=False)
+        return values.to_numpy(dtype=dtype, copy=False)
+
     def _compute_metrics(
         self,
         y_true: np.ndarray,
         y_pred: np.ndarray,
     ) -> dict[str, float]:
-        """Compute all requested metrics."""
+        """
+        Compute all requested metrics.
+
+        Metrics that share intermediate values (confusion counters,
+        prediction errors) are computed together in one pass; the others
+        are computed one by one. Which functions to call is resolved once
+        per metric list, see `_metric_plan`.
+        """
         results: dict[str, float] = {}
+        for compute in self._metric_plan():
+            results.update(compute(y_true, y_pred))
+        return results
 
-        for metric in self.metrics:
-            results[metric] = self._compute_single_metric(metric, y_true, y_pred)
+    def _compute_period_metrics(
+        self,
+        periods: list[tuple[np.ndarray, np.ndarray]],
+    ) -> list[dict[str, float]]:
+        """
+        Compute all requested metrics for several (y_true, y_pred) periods.
 
+        With a thread pool and large enough inputs, every metric group of
+        every period is submitted as its own task.
+        """
+        largest = max(len(y_true) for y_true, _ in periods)
+        if self._pool is None or largest < self.PARALLEL_MIN_SAMPLES:
+            return [self._compute_metrics(y_true, y_pred) for y_true, y_pred in periods]
+
+        pool = self._pool
+        plan = self._metric_plan()
+        futures = [
+            [pool.submit(compute, y_true, y_pred) for compute in plan]
+            for y_true, y_pred in periods
+        ]
+        results: list[dict[str, float]] = []
+        for period_futures in futures:
+            metrics: dict[str, float] = {}
+            for future in period_futures:
+                metrics.update(future.result())
+            results.append(metrics)
         return results
 
-    def _compute_single_metric(
-        self,
+    def _metric_plan(self) -> tuple[_MetricGroup, ...]:
+        """
+        Return the functions computing ``self.metrics``, building them once.
+
+        The plan is rebuilt only if ``self.metrics`` has been reassigned
+        or modified since it was last built.
+        """
+        key = tuple(self.metrics)
+        if self._plan_key != key:
+            self._plan = self._build_metric_plan(key)
+            self._plan_key = key
+        return self._plan
+
+    def _build_metric_plan(self, metrics: tuple[str, ...]) -> tuple[_MetricGroup, ...]:
+        """Bind each requested metric, or group of fused metrics, to a function."""
+        requested = frozenset(metrics)
+        plan: list[_MetricGroup] = []
+
+        if requested & self.CONFUSION_METRICS:
+            plan.append(self._confusion_metrics)
+        if requested & self.ERROR_METRICS:
+            plan.append(partial(self._error_metrics, requested=requested))
+
+        standalone: dict[str, Callable[[np.ndarray, np.ndarray], float]] = {
+            "auc_roc": self._auc_roc,
+            "mape": _kernels.mape,
+        }
+        fused = self.CONFUSION_METRICS | self.ERROR_METRICS
+        for metric in dict.fromkeys(metrics):
+            if metric in fused:
+                continue
+            compute = standalone.get(metric)
+            if compute is None:
+                raise ValueError(f"Unknown metric: {metric}")
+            plan.append(partial(self._single_metric_group, metric, compute))
+
+        return tuple(plan)
+
+    @staticmethod
+    def _single_metric_group(
         metric_name: str,
+        compute: Callable[[np.ndarray, np.ndarray], float],
         y_true: np.ndarray,
         y_pred: np.ndarray,
-    ) -> float:
-        """Compute a single metric value."""
-        if metric_name == "accuracy":
-            return float(np.mean(y_true == y_pred))
-
-        if metric_name == "precision":
-            return self._precision(y_true, y_pred)
-
-        if metric_name == "recall":
-            return self._recall(y_true, y_pred)
-
-        if metric_name == "f1":
-            p = self._precision(y_true, y_pred)
-            r = self._recall(y_true, y_pred)
-            if p + r == 0:
-                return 0.0
-            return 2 * p * r / (p + r)
-
-        if metric_name == "auc_roc":
-            from scipy import stats
-
-            # Simple AUC approximation using Mann-Whitney U statistic
-            positives = y_pred[y_true == 1]
-            negatives = y_pred[y_true == 0]
-            if len(positives) == 0 or len(negatives) == 0:
-                return 0.5
-            u_stat = stats.mannwhitneyu(
-                positives, negatives, alternative="greater"
-            ).statistic
-            return float(u_stat / (len(positives) * len(negatives)))
-
-        if metric_name == "mae":
-            return float(np.mean(np.abs(y_true - y_pred)))
-
-        if metric_name == "mse":
-            return float(np.mean((y_true - y_pred) ** 2))
-
-        if metric_name == "rmse":
-            return float(np.sqrt(np.mean((y_true - y_pred) ** 2)))
-
-        if metric_name == "r2":
-            ss_res: float = float(np.sum((y_true - y_pred) ** 2))
-            ss_tot: float = float(np.sum((y_true - np.mean(y_true)) ** 2))
-            if ss_tot == 0:
-                return 1.0 if ss_res == 0 else 0.0
-            return float(1 - ss_res / ss_tot)
+    ) -> dict[str, float]:
+        """Compute one metric that is not part of a fused group."""
+        return {metric_name: compute(y_true, y_pred)}
 
-        if metric_name == "mape":
-            mask = y_true != 0
-            if not np.any(mask):
-                return 0.0
-            return float(np.mean(np.abs((y_true[mask] - y_pred[mask]) / y_true[mask])))
+    def _confusion_metrics(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+    ) -> dict[str, float]:
+        """Compute accuracy, precision, recall and F1 from shared counters."""
+        counters = _kernels.confusion_counters(y_true, y_pred)
+        if counters is None:
+            # Multi-class or non 0/1 labels: accuracy is still exact and
+            # precision/recall treat label 1 as the positive class.
+            tp, fp, fn = _kernels.positive_class_counters(y_true, y_pred)
+            accuracy = float(np.mean(y_true == y_pred))
+        else:
+            tp, fp, tn, fn = counters
+            accuracy = (tp + tn) / len(y_true)
 
-        raise ValueError(f"Unknown metric: {metric_name}")
+        precision = tp / (tp + fp) if tp + fp else 0.0
+        recall = tp / (tp + fn) if tp + fn else 0.0
+        f1 = (
+            2 * precision * recall / (precision + recall) if precision + recall else 0.0
+        )
+        return {
+            "accuracy": accuracy,
+            "precision": precision,
+            "recall": recall,
+            "f1": f1,
+        }
 
     @staticmethod
-    def _precision(y_true: np.ndarray, y_pred: np.ndarray) -> float:
-        """Compute binary precision."""
-        tp = float(np.sum((y_pred == 1) & (y_true == 1)))
-        fp = float(np.sum((y_pred == 1) & (y_true == 0)))
-        if tp + fp == 0:
-            return 0.0
-        return tp / (tp + fp)
+    def _error_metrics(
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        requested: frozenset[str],
+    ) -> dict[str, float]:
+        """Compute MAE, MSE, RMSE and R² from one pass over the errors."""
+        n = len(y_true)
+        if "r2" in requested:
+            abs_sum, ss_res, ss_tot = _kernels.regression_sums(y_true, y_pred)
+        else:
+            abs_sum, ss_res = _kernels.error_sums(y_true, y_pred)
+        results: dict[str, float] = {
+            "mae": abs_sum / n,
+            "mse": ss_res / n,
+            "rmse": math.sqrt(ss_res / n),
+        }
+
+        if "r2" in requested:
+            if ss_tot == 0:
+                results["r2"] = 1.0 if ss_res == 0 else 0.0
+            else:
+                results["r2"] = float(1 - ss_res / ss_tot)
+
+        return results
 
     @staticmethod
-    def _recall(y_true: np.ndarray, y_pred: np.ndarray) -> float:
-        """Compute binary recall."""
-        tp = float(np.sum((y_pred == 1) & (y_true == 1)))
-        fn = float(np.sum((y_pred == 0) & (y_true == 1)))
-        if tp + fn == 0:
-            return 0.0
-        return tp / (tp + fn)
+    def _auc_roc(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        """
+        Compute binary AUC-ROC from score ranks.
+
+        This is the Mann-Whitney U statistic of the positive scores,
+        normalized by n_pos * n_neg, computed directly from the rank sum
+        (ties get average ranks) without the test's p-value.
+        """
+        pos_mask = y_true == 1
+        neg_mask = y_true == 0
+        n_pos = int(np.count_nonzero(pos_mask))
+        n_neg = int(np.count_nonzero(neg_mask))
+        if n_pos == 0 or n_neg == 0:
+            return 0.5
+
+        if n_pos + n_neg < len(y_true):
+            # Ignore samples whose label is neither 0 nor 1
+            labelled = pos_mask | neg_mask
+            y_pred = y_pred[labelled]
+            pos_mask = pos_mask[labelled]
+
+        rank_sum = float(rankdata(y_pred)[pos_mask].sum())
+        u_stat = rank_sum - n_pos * (n_pos + 1) / 2
+        return float(u_stat / (n_pos * n_neg))
 
     @property
     def performance_details(self) -> list[PerformanceResult]:
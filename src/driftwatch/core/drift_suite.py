@@ -7,8 +7,11 @@ into a single monitoring interface with clear separation.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable
 
+from driftwatch.core._parallel import n_threads
 from driftwatch.core.concept_monitor import ConceptMonitor
 from driftwatch.core.monitor import Monitor
 from driftwatch.core.prediction_monitor import PredictionMonitor
@@ -18,6 +21,8 @@ if TYPE_CHECKING:
     import numpy as np
     import pandas as pd
 
+    from driftwatch.core.report import DriftReport
+
 
 class DriftSuite:
     """
@@ -36,6 +41,10 @@ class DriftSuite:
         thresholds: Dict of threshold values shared across monitors.
         performance_metrics: Metrics to monitor for concept drift.
         model_version: Optional model version identifier.
+        n_jobs: Number of threads used by the feature and concept drift
+            monitors, see ``Monitor`` and ``ConceptMonitor``. With
+            n_jobs > 1 the drift types of a check also run concurrently.
+            Default is 1.
 
     Example:
         ```python
@@ -82,6 +91,7 @@ class DriftSuite:
         thresholds: dict[str, float] | None = None,
         performance_metrics: list[str] | None = None,
         model_version: str | None = None,
+        n_jobs: int = 1,
     ) -> None:
         self.model_version = model_version
         self.task = task
@@ -91,6 +101,7 @@ class DriftSuite:
             reference_data=reference_data,
             features=features,
             thresholds=thresholds,
+            n_jobs=n_jobs,
         )
 
         # Prediction drift monitor (optional)
@@ -108,6 +119,12 @@ class DriftSuite:
             task=task,
             metrics=performance_metrics,
             thresholds=thresholds,
+            n_jobs=n_jobs,
+        )
+
+        # One thread per drift type; the monitors use their own pools
+        self._pool = (
+            ThreadPoolExecutor(max_workers=3) if n_threads(n_jobs) > 1 else None
         )
 
     def check(
@@ -139,36 +156,58 @@ class DriftSuite:
         Returns:
             ComprehensiveDriftReport with clear separation by drift type
         """
-        feature_report = None
-        prediction_report = None
-        concept_report = None
+        checks: dict[str, Callable[[], DriftReport]] = {}
 
         # Feature Drift
         if production_data is not None:
-            feature_report = self._feature_monitor.check(production_data)
+            checks["feature_report"] = partial(
+                self._feature_monitor.check, production_data
+            )
 
         # Prediction Drift
         if production_predictions is not None and self._prediction_monitor is not None:
-            prediction_report = self._prediction_monitor.check(production_predictions)
+            checks["prediction_report"] = partial(
+                self._prediction_monitor.check, production_predictions
+            )
 
         # Concept Drift
         if all(
             x is not None for x in [y_true_ref, y_pred_ref, y_true_prod, y_pred_prod]
         ):
-            concept_report = self._concept_monitor.check(
+            checks["concept_report"] = partial(
+                self._concept_monitor.check,
                 y_true_ref=y_true_ref,  # type: ignore[arg-type]
                 y_pred_ref=y_pred_ref,  # type: ignore[arg-type]
                 y_true_prod=y_true_prod,  # type: ignore[arg-type]
                 y_pred_prod=y_pred_prod,  # type: ignore[arg-type]
             )
 
+        # The drift types read disjoint inputs, so they can run side by side
+        if self._pool is not None and len(checks) > 1:
+            futures = {name: self._pool.submit(run) for name, run in checks.items()}
+            reports = {name: future.result() for name, future in futures.items()}
+        else:
+            reports = {name: run() for name, run in checks.items()}
+
         return ComprehensiveDriftReport(
-            feature_report=feature_report,
-            prediction_report=prediction_report,
-            concept_report=concept_report,
+            feature_report=reports.get("feature_report"),
+            prediction_report=reports.get("prediction_report"),
+            concept_report=reports.get("concept_report"),
             model_version=self.model_version,
         )
 
+    def close(self) -> None:
+        """
+        Shut down the thread pools created for ``n_jobs > 1``.
+
+        The suite stays usable and runs sequentially afterwards.
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self._feature_monitor.close()
+        self._concept_monitor.close()
+
     @property
     def feature_monitor(self) -> Monitor:
         """Access the underlying feature drift monitor."""
@@ -191,7 +230,7 @@ class DriftSuite:
             "task": self.task,
             "feature_monitor": {
                 "features": self._feature_monitor.monitored_features,
-                "thresholds": self._feature_monitor.thresholds,
+                "thresholds": dict(self._feature_monitor.thresholds),
             },
             "prediction_monitor": (
                 self._prediction_monitor.get_config()
@@ -4,15 +4,29 @@ Monitor class for detecting drift between reference and production data.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, ClassVar
 
+from driftwatch.core._parallel import n_threads
 from driftwatch.core.report import DriftReport, FeatureDriftResult
-from driftwatch.detectors import get_detector
+from driftwatch.detectors import get_detector, get_detector_factory
+from driftwatch.detectors.registry import THRESHOLD_KEYS
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping, Sequence
+
+    import numpy as np
     import pandas as pd
 
-    from driftwatch.detectors.base import BaseDetector
+    from driftwatch.detectors.base import (
+        BaseDetector,
+        DetectionResult,
+        StreamAccumulator,
+    )
+
+    # Positions of features in the monitored list, and their detectors
+    _Batch = tuple[list[int], list[BaseDetector]]
 
 
 class Monitor:
@@ -29,6 +43,11 @@ class Monitor:
         model: Optional ML model for prediction drift detection
         thresholds: Dictionary of threshold values for drift detection.
             Supported keys: "psi", "ks_pvalue", "wasserstein", "chi2_pvalue"
+        n_jobs: Number of threads used to test features concurrently when
+            at least PARALLEL_MIN_FEATURES features are monitored. The
+            detectors spend most of their time in NumPy/SciPy code and
+            compiled loops that release the GIL. -1 uses every CPU.
+            Default is 1 (sequential).
 
     Example:
         >>> monitor = Monitor(
@@ -40,12 +59,18 @@ class Monitor:
         >>> print(report.has_drift())
     """
 
-    DEFAULT_THRESHOLDS: ClassVar[dict[str, float]] = {
-        "psi": 0.2,
-        "ks_pvalue": 0.05,
-        "wasserstein": 0.1,
-        "chi2_pvalue": 0.05,
-    }
+    DEFAULT_THRESHOLDS: ClassVar[Mapping[str, float]] = MappingProxyType(
+        {
+            "psi": 0.2,
+            "ks_pvalue": 0.05,
+            "wasserstein": 0.1,
+            "chi2_pvalue": 0.05,
+        }
+    )
+
+    # Below this many features, handing work to threads costs more than
+    # it saves
+    PARALLEL_MIN_FEATURES: ClassVar[int] = 4
 
     def __init__(
         self,
@@ -53,6 +78,7 @@ class Monitor:
         features: list[str] | None = None,
         model: Any | None = None,
         thresholds: dict[str, float] | None = None,
+        n_jobs: int = 1,
     ) -> None:
         """
         Initialize the monitor with reference data and configuration
@@ -63,6 +89,8 @@ class Monitor:
                 If None, all columns are monitored.
            model: Optional machine learning model
                 thresholds: optional dictionary overriding default drift detection thresholds.
+           n_jobs: number of threads used to test features concurrently,
+                -1 for every CPU.
 
         Raises:
             ValueError: if reference data is empty.
@@ -70,14 +98,114 @@ class Monitor:
         """
         self._validate_reference_data(reference_data)
 
-        self.reference_data = reference_data
+        self._reference_data = reference_data
         self.features = features or list(reference_data.columns)
+        # Kept in sync with self.features, for membership tests per check
+        self._feature_set = frozenset(self.features)
         self.model = model
-        self.thresholds = {**self.DEFAULT_THRESHOLDS, **(thresholds or {})}
+        # Read-only, so the defaults can be shared instead of copied
+        self.thresholds: Mapping[str, float] = (
+            MappingProxyType({**self.DEFAULT_THRESHOLDS, **thresholds})
+            if thresholds
+            else self.DEFAULT_THRESHOLDS
+        )
 
         self._detectors: dict[str, BaseDetector] = {}
         self._setup_detectors()
 
+        # Batches of detectors run by check(), see _batches()
+        self._batch_plan: tuple[int, list[_Batch]] | None = None
+
+        # Running state of a chunked check, see update() / finalize()
+        self._accumulators: dict[str, StreamAccumulator] | None = None
+        self._stream_size = 0
+
+        # Detectors only read their fitted reference state, so features can
+        # be tested from several threads without locking.
+        self._n_workers = min(n_threads(n_jobs), max(len(self.features), 1))
+        self._pool = (
+            ThreadPoolExecutor(max_workers=self._n_workers)
+            if self._n_workers > 1
+            else None
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        feature_names: Sequence[str],
+        reference: np.ndarray,
+        model: Any | None = None,
+        thresholds: dict[str, float] | None = None,
+        n_jobs: int = 1,
+    ) -> Monitor:
+        """
+        Create a monitor from a 2-D reference matrix.
+
+        Column ``i`` of ``reference`` holds the values of ``feature_names[i]``.
+        The matrix is copied once into column-contiguous, read-only storage,
+        so later mutations of the caller's array cannot alter the baseline.
+
+        Args:
+            feature_names: Names of the columns of ``reference``
+            reference: Array of shape (n_samples, n_features)
+            model: Optional machine learning model
+            thresholds: Optional dictionary overriding default thresholds
+            n_jobs: Number of threads used to test features concurrently
+
+        Returns:
+            Monitor watching every column of ``reference``
+
+        Raises:
+            ValueError: If the matrix shape does not match ``feature_names``
+
+        Example:
+            >>> monitor = Monitor.from_arrays(["age", "income"], X_train)
+            >>> report = monitor.check(production_df)
+        """
+        import numpy as np
+        import pandas as pd
+
+        reference = np.asarray(reference)
+        if reference.ndim != 2 or reference.shape[1] != len(feature_names):
+            raise ValueError(
+                f"Reference array of shape {reference.shape} does not match "
+                f"{len(feature_names)} feature names"
+            )
+
+        # One contiguous row per feature; the transpose seen by pandas keeps
+        # every column a contiguous read-only view of this buffer.
+        columns = np.array(reference.T, order="C")
+        columns.flags.writeable = False
+        reference_data = pd.DataFrame(
+            columns.T, columns=list(feature_names), copy=False
+        )
+
+        return cls(
+            reference_data=reference_data,
+            model=model,
+            thresholds=thresholds,
+            n_jobs=n_jobs,
+        )
+
+    @property
+    def reference_data(self) -> pd.DataFrame:
+        """
+        Reference DataFrame the detectors are fitted on.
+
+        Assigning a new DataFrame refits every detector, so cached
+        reference state never goes stale.
+        """
+        return self._reference_data
+
+    @reference_data.setter
+    def reference_data(self, data: pd.DataFrame) -> None:
+        self._validate_reference_data(data)
+        self._reference_data = data
+        self._detectors = {}
+        self._setup_detectors()
+        self._batch_plan = None
+        self._accumulators = None
+
     def _validate_reference_data(self, data: pd.DataFrame) -> None:
         """
         Validate reference data is not empty.
@@ -89,26 +217,37 @@ class Monitor:
             ValueError: if reference data is empty.
         """
 
-        if data.empty:
+        # Row and column counts rather than DataFrame.empty, which is
+        # slower and runs on every check
+        if len(data.index) == 0 or len(data.columns) == 0:
             raise ValueError("Reference data cannot be empty")
 
     def _setup_detectors(self) -> None:
         """
         Initialize detectors for each feature based on dtype.
 
-        Detectors are selected based on the data type of each feature
-        and configured using provided threshold values.
+        Detectors are selected based on the data type of each feature,
+        configured using provided threshold values and fitted on the
+        reference column so that reference-side work is done only once.
 
         Raises:
             ValueError: if a feature in not present in reference dataset.
         """
+        # Wide tables usually have few distinct dtypes: select the detector
+        # once per dtype rather than once per feature
+        factories: dict[Any, Callable[[], BaseDetector]] = {}
         for feature in self.features:
             if feature not in self.reference_data.columns:
                 raise ValueError(f"Feature '{feature}' not found in reference data")
 
-            dtype = self.reference_data[feature].dtype
-            detector = get_detector(dtype, self.thresholds)
-            self._detectors[feature] = detector
+            ref_series = self.reference_data[feature]
+            dtype = ref_series.dtype
+            factory = factories.get(dtype)
+            if factory is None:
+                factory = factories[dtype] = get_detector_factory(
+                    dtype, self.thresholds
+                )
+            self._detectors[feature] = factory().fit(ref_series)
 
     def check(self, production_data: pd.DataFrame) -> DriftReport:
         """
@@ -129,30 +268,247 @@ class Monitor:
 
         self._validate_production_data(production_data)
 
-        feature_results: list[FeatureDriftResult] = []
+        columns = self._production_columns(production_data, self.features)
+        return self._run(columns, len(production_data))
 
-        for feature in self.features:
-            ref_series = self.reference_data[feature]
-            prod_series = production_data[feature]
-
-            detector = self._detectors[feature]
-            result = detector.detect(ref_series, prod_series)
-
-            feature_results.append(
-                FeatureDriftResult(
-                    feature_name=feature,
-                    has_drift=result.has_drift,
-                    score=result.score,
-                    method=result.method,
-                    threshold=result.threshold,
-                    p_value=result.p_value,
-                )
+    def check_arrays(
+        self,
+        production: np.ndarray,
+        feature_names: Sequence[str],
+    ) -> DriftReport:
+        """
+        Check for drift on a 2-D production matrix without going through pandas.
+
+        Column ``i`` of ``production`` holds the values of ``feature_names[i]``.
+        Columns are handed to the fitted detectors as array views.
+
+        Args:
+            production: Array of shape (n_samples, n_features)
+            feature_names: Names of the columns of ``production``
+
+        Returns:
+            DriftReport containing per-feature and aggregate drift results
+
+        Raises:
+            ValueError: If production data is empty, does not match
+                ``feature_names`` or is missing monitored features
+        """
+        if production.ndim != 2 or production.shape[1] != len(feature_names):
+            raise ValueError(
+                f"Production array of shape {production.shape} does not match "
+                f"{len(feature_names)} feature names"
+            )
+        if production.shape[0] == 0:
+            raise ValueError("Production data cannot be empty")
+
+        index = {name: i for i, name in enumerate(feature_names)}
+        missing = self._feature_set.difference(index)
+        if missing:
+            raise ValueError(f"Missing features in production data: {set(missing)}")
+
+        columns = [production[:, index[feature]] for feature in self.features]
+        return self._run(columns, production.shape[0])
+
+    def _run(
+        self,
+        columns: Sequence[pd.Series | np.ndarray],
+        production_size: int,
+    ) -> DriftReport:
+        """
+        Run the fitted detectors on production columns.
+
+        Args:
+            columns: One production column per monitored feature, in order
+            production_size: Number of production rows
+
+        Returns:
+            DriftReport containing per-feature and aggregate drift results
+        """
+
+        features = self.features
+        pool = self._parallel_pool()
+        batches = self._batches(self._n_workers if pool is not None else 1)
+
+        def check_batch(batch: _Batch) -> list[DetectionResult]:
+            indices, detectors = batch
+            return type(detectors[0]).detect_batch(
+                detectors, [columns[i] for i in indices]
             )
 
+        # Columns are extracted by the caller so worker threads never touch
+        # the production container itself.
+        if pool is not None:
+            batch_results = list(pool.map(check_batch, batches))
+        else:
+            batch_results = list(map(check_batch, batches))
+
+        results: dict[int, DetectionResult] = {}
+        for (indices, _), batch in zip(batches, batch_results):
+            results.update(zip(indices, batch))
+        feature_results = [
+            self._feature_result(feature, results[i])
+            for i, feature in enumerate(features)
+        ]
+
+        return DriftReport(
+            feature_results=feature_results,
+            reference_size=len(self.reference_data),
+            production_size=production_size,
+        )
+
+    def update(self, production_data: pd.DataFrame) -> None:
+        """
+        Add a chunk of production data to a running drift check.
+
+        Call ``finalize`` once every chunk has been added. Only running
+        summaries are kept between chunks: exact bucket counts for PSI,
+        counts between distinct reference values for KS and category
+        counts for Chi-Squared, and a uniform sample of at most
+        ``STREAM_SAMPLE_SIZE`` values per feature for the other detectors,
+        so memory does not grow with the production data. Changing the
+        reference data or the monitored features discards a running check.
+
+        Args:
+            production_data: Next chunk of production data
+
+        Raises:
+            ValueError: If the chunk is empty or missing features
+        """
+        self._validate_production_data(production_data)
+
+        if self._accumulators is None:
+            self._accumulators = {
+                feature: self._detectors[feature].accumulator()
+                for feature in self.features
+            }
+            self._stream_size = 0
+        accumulators = self._accumulators
+
+        def update_feature(feature: str, values: pd.Series | np.ndarray) -> None:
+            accumulators[feature].update(values)
+
+        columns = self._production_columns(production_data, accumulators)
+        pool = self._parallel_pool()
+        if pool is not None:
+            list(pool.map(update_feature, accumulators, columns))
+        else:
+            list(map(update_feature, accumulators, columns))
+        self._stream_size += len(production_data)
+
+    def finalize(self) -> DriftReport:
+        """
+        Finish a running drift check started with ``update``.
+
+        The running state is cleared, so the next ``update`` starts a new
+        check.
+
+        Returns:
+            DriftReport over every chunk added since the last finalize
+
+        Raises:
+            ValueError: If no chunk has been added
+        """
+        if self._accumulators is None:
+            raise ValueError("No production data, call update() first")
+        accumulators = self._accumulators
+        self._accumulators = None
+
+        feature_results = [
+            self._feature_result(feature, accumulator.result())
+            for feature, accumulator in accumulators.items()
+        ]
         return DriftReport(
             feature_results=feature_results,
             reference_size=len(self.reference_data),
-            production_size=len(production_data),
+            production_size=self._stream_size,
+        )
+
+    def _batches(self, n_workers: int) -> list[_Batch]:
+        """
+        Group the monitored features into detect_batch calls.
+
+        Features are grouped by detector class so that each group runs
+        as one vectorized detect_batch call. With several workers, groups
+        are split into one contiguous slice per worker. The grouping only
+        depends on the monitored features, so it is computed once and
+        reused by every check until they change.
+        """
+        if self._batch_plan is not None and self._batch_plan[0] == n_workers:
+            return self._batch_plan[1]
+
+        detectors = [self._detectors[feature] for feature in self.features]
+        groups: dict[type[BaseDetector], list[int]] = {}
+        for i, detector in enumerate(detectors):
+            groups.setdefault(type(detector), []).append(i)
+        batches: list[_Batch] = []
+        for indices in groups.values():
+            size = -(-len(indices) // n_workers)
+            for start in range(0, len(indices), size):
+                chunk = indices[start : start + size]
+                batches.append((chunk, [detectors[i] for i in chunk]))
+
+        self._batch_plan = (n_workers, batches)
+        return batches
+
+    def _parallel_pool(self) -> ThreadPoolExecutor | None:
+        """Return the thread pool if the monitored features should use it."""
+        if len(self.features) < self.PARALLEL_MIN_FEATURES:
+            return None
+        return self._pool
+
+    def close(self) -> None:
+        """
+        Shut down the thread pool created for ``n_jobs > 1``.
+
+        The monitor stays usable and tests features sequentially
+        afterwards. The pool is also released when the monitor is
+        garbage collected.
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    @staticmethod
+    def _production_columns(
+        data: pd.DataFrame,
+        features: Iterable[str],
+    ) -> list[pd.Series | np.ndarray]:
+        """
+        Extract the production column of each feature.
+
+        Numeric columns backed by a NumPy dtype are handed over as arrays,
+        so the detectors drop NaNs and bin them without pandas overhead.
+        They are extracted as one column-major matrix per dtype, whose
+        columns are contiguous views. Other columns stay Series for value
+        counting.
+        """
+        import numpy as np
+
+        features = list(features)
+        dtypes = dict(zip(data.columns, data.dtypes))
+        columns: dict[str, pd.Series | np.ndarray] = {}
+        numeric: dict[np.dtype, list[str]] = {}
+        for feature in features:
+            dtype = dtypes[feature]
+            if isinstance(dtype, np.dtype) and dtype.kind in "iuf":
+                numeric.setdefault(dtype, []).append(feature)
+            else:
+                columns[feature] = data[feature]
+        for names in numeric.values():
+            matrix = np.asfortranarray(data[names].to_numpy())
+            columns.update(zip(names, matrix.T))
+        return [columns[feature] for feature in features]
+
+    @staticmethod
+    def _feature_result(feature: str, result: DetectionResult) -> FeatureDriftResult:
+        """Wrap a detector result into the report's per-feature result."""
+        return FeatureDriftResult(
+            feature_name=feature,
+            has_drift=result.has_drift,
+            score=result.score,
+            method=result.method,
+            threshold=result.threshold,
+            p_value=result.p_value,
         )
 
     def _validate_production_data(self, data: pd.DataFrame) -> None:
@@ -166,12 +522,30 @@ class Monitor:
             ValueError: if production data is empty or
                required features are missing in the production data
         """
-        if data.empty:
+        if len(data.index) == 0 or len(data.columns) == 0:
             raise ValueError("Production data cannot be empty")
 
-        missing = set(self.features) - set(data.columns)
+        missing = self._feature_set.difference(data.columns)
         if missing:
-            raise ValueError(f"Missing features in production data: {missing}")
+            raise ValueError(f"Missing features in production data: {set(missing)}")
+
+    def set_thresholds(self, thresholds: dict[str, float]) -> None:
+        """
+        Change drift thresholds without refitting the reference.
+
+        Thresholds only decide ``has_drift`` from a score, so the fitted
+        detectors are kept and only their thresholds are updated; the
+        next check reuses all reference-side work.
+
+        Args:
+            thresholds: threshold values to change, other thresholds
+                keep their current value.
+        """
+        self.thresholds = MappingProxyType({**self.thresholds, **thresholds})
+        for detector in self._detectors.values():
+            key = THRESHOLD_KEYS.get(detector.name)
+            if key in thresholds:
+                detector.threshold = thresholds[key]
 
     def add_feature(self, feature: str) -> None:
         """
@@ -190,8 +564,12 @@ class Monitor:
             raise ValueError(f"Feature '{feature}' not found in reference data")
 
         self.features.append(feature)
-        dtype = self.reference_data[feature].dtype
-        self._detectors[feature] = get_detector(dtype, self.thresholds)
+        self._feature_set |= {feature}
+        ref_series = self.reference_data[feature]
+        detector = get_detector(ref_series.dtype, self.thresholds)
+        self._detectors[feature] = detector.fit(ref_series)
+        self._batch_plan = None
+        self._accumulators = None
 
     def remove_feature(self, feature: str) -> None:
         """
@@ -202,7 +580,10 @@ class Monitor:
         """
         if feature in self.features:
             self.features.remove(feature)
+            self._feature_set -= {feature}
             del self._detectors[feature]
+            self._batch_plan = None
+            self._accumulators = None
 
     @property
     def monitored_features(self) -> list[str]:
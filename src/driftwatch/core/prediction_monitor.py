@@ -7,6 +7,7 @@ between reference (validation) and production data.
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, ClassVar
 
 import numpy as np
@@ -14,6 +15,8 @@ import numpy as np
 from driftwatch.core.report import DriftReport, DriftType, FeatureDriftResult
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
     import pandas as pd
 
     from driftwatch.detectors.base import BaseDetector
@@ -57,11 +60,13 @@ class PredictionMonitor:
         ```
     """
 
-    DEFAULT_THRESHOLDS: ClassVar[dict[str, float]] = {
-        "psi": 0.2,
-        "ks_pvalue": 0.05,
-        "jensen_shannon": 0.1,
-    }
+    DEFAULT_THRESHOLDS: ClassVar[Mapping[str, float]] = MappingProxyType(
+        {
+            "psi": 0.2,
+            "ks_pvalue": 0.05,
+            "jensen_shannon": 0.1,
+        }
+    )
 
     def __init__(
         self,
@@ -73,38 +78,54 @@ class PredictionMonitor:
     ) -> None:
         import pandas as pd
 
-        self.thresholds = {**self.DEFAULT_THRESHOLDS, **(thresholds or {})}
+        # Read-only, so the defaults can be shared instead of copied
+        self.thresholds: Mapping[str, float] = (
+            MappingProxyType({**self.DEFAULT_THRESHOLDS, **thresholds})
+            if thresholds
+            else self.DEFAULT_THRESHOLDS
+        )
         self.detector_name = detector
 
-        # Convert to DataFrame for consistent handling
-        if isinstance(reference_predictions, np.ndarray):
-            if reference_predictions.ndim == 1:
-                self._ref_df = pd.DataFrame({"prediction": reference_predictions})
-            else:
-                cols = class_names or [
-                    f"class_{i}" for i in range(reference_predictions.shape[1])
-                ]
-                self._ref_df = pd.DataFrame(reference_predictions, columns=cols)
-        elif isinstance(reference_predictions, pd.Series):
-            self._ref_df = pd.DataFrame({"prediction": reference_predictions.values})
-        else:
-            self._ref_df = reference_predictions.copy()
+        # Split the reference into one column per output, slicing arrays
+        # directly instead of wrapping them in a DataFrame. The columns may
+        # still be views of the caller's data, so each one is copied once
+        # when its detector is fitted below.
+        names = None
+        if (
+            isinstance(reference_predictions, np.ndarray)
+            and reference_predictions.ndim == 2
+        ):
+            names = class_names or [
+                f"class_{i}" for i in range(reference_predictions.shape[1])
+            ]
+        columns, self._reference_size = self._split_columns(
+            reference_predictions, names
+        )
 
         # Auto-detect task type
         if task is None:
-            self.task = (
-                "classification" if len(self._ref_df.columns) > 1 else "regression"
-            )
+            self.task = "classification" if len(columns) > 1 else "regression"
         else:
             self.task = task
 
-        self.class_names = class_names or list(self._ref_df.columns)
-        self._detector = self._create_detector()
+        self.class_names = class_names or list(columns)
 
         # Validate
-        if self._ref_df.empty:
+        if self._reference_size == 0 or not columns:
             raise ValueError("Reference predictions cannot be empty")
 
+        # One detector per output, fitted once on its own copy of the
+        # reference column: detectors keep the series they are fitted on,
+        # which must not change if the caller later mutates their array
+        self._detectors: dict[str, BaseDetector] = {
+            col: self._create_detector().fit(pd.Series(values, copy=True))
+            for col, values in columns.items()
+        }
+        # Output names in reference order, and as a set for batches whose
+        # columns come in another order
+        self._outputs = tuple(self._detectors)
+        self._output_set = frozenset(self._outputs)
+
     def _create_detector(self) -> BaseDetector:
         """Create the appropriate detector based on configuration."""
         from driftwatch.detectors.registry import get_detector_by_name
@@ -128,35 +149,23 @@ class PredictionMonitor:
         Raises:
             ValueError: If predictions are empty or shape mismatch.
         """
-        import pandas as pd
-
-        # Convert production predictions
-        if isinstance(production_predictions, np.ndarray):
-            if production_predictions.ndim == 1:
-                prod_df = pd.DataFrame({"prediction": production_predictions})
-            else:
-                prod_df = pd.DataFrame(
-                    production_predictions, columns=self._ref_df.columns
-                )
-        elif isinstance(production_predictions, pd.Series):
-            prod_df = pd.DataFrame({"prediction": production_predictions.values})
-        else:
-            prod_df = production_predictions.copy()
+        columns, n_rows = self._split_columns(production_predictions, self._outputs)
 
-        if prod_df.empty:
+        if n_rows == 0 or not columns:
             raise ValueError("Production predictions cannot be empty")
 
-        if set(prod_df.columns) != set(self._ref_df.columns):
+        names = tuple(columns)
+        if names != self._outputs and frozenset(names) != self._output_set:
             raise ValueError(
-                f"Production prediction columns {list(prod_df.columns)} "
-                f"don't match reference columns {list(self._ref_df.columns)}"
+                f"Production prediction columns {list(names)} "
+                f"don't match reference columns {list(self._outputs)}"
             )
 
         # Run drift detection on each prediction column
         feature_results: list[FeatureDriftResult] = []
 
-        for col in self._ref_df.columns:
-            result = self._detector.detect(self._ref_df[col], prod_df[col])
+        for col, detector in self._detectors.items():
+            result = detector.detect_fitted(columns[col])
 
             feature_results.append(
                 FeatureDriftResult(
@@ -172,21 +181,73 @@ class PredictionMonitor:
 
         return DriftReport(
             feature_results=feature_results,
-            reference_size=len(self._ref_df),
-            production_size=len(prod_df),
+            reference_size=self._reference_size,
+            production_size=n_rows,
         )
 
+    @staticmethod
+    def _split_columns(
+        predictions: pd.Series | pd.DataFrame | np.ndarray,
+        names: Sequence[str] | None,
+    ) -> tuple[dict[str, pd.Series | np.ndarray], int]:
+        """
+        Split predictions into one column per output.
+
+        Arrays and Series are sliced directly, without building a
+        DataFrame; 2-D arrays are first laid out column by column, as
+        row-major arrays would make every column a strided view. Numeric
+        DataFrame columns are handed over as arrays.
+
+        Args:
+            predictions: Predictions to split
+            names: Output names of the columns of a 2-D array
+
+        Returns:
+            Column of each output by name, and the number of rows
+
+        Raises:
+            ValueError: If a 2-D array does not have one column per name
+        """
+        if isinstance(predictions, np.ndarray):
+            if predictions.ndim == 1:
+                return {"prediction": predictions}, len(predictions)
+            if (
+                predictions.ndim != 2
+                or names is None
+                or predictions.shape[1] != len(names)
+            ):
+                raise ValueError(
+                    f"Predictions of shape {predictions.shape} don't "
+                    f"match reference columns {list(names or [])}"
+                )
+            # Column-major, so that each output is read contiguously
+            by_column = np.asfortranarray(predictions).T
+            return dict(zip(names, by_column)), predictions.shape[0]
+
+        if predictions.ndim == 1:
+            return {"prediction": predictions.to_numpy()}, len(predictions)
+
+        columns: dict[str, pd.Series | np.ndarray] = {}
+        for col in predictions.columns:
+            series = predictions[col]
+            dtype = series.dtype
+            if isinstance(dtype, np.dtype) and dtype.kind in "iuf":
+                columns[col] = series.to_numpy()
+            else:
+                columns[col] = series
+        return columns, len(predictions)
+
     @property
     def monitored_outputs(self) -> list[str]:
         """Return list of monitored prediction outputs."""
-        return list(self._ref_df.columns)
+        return list(self._outputs)
 
     def get_config(self) -> dict[str, Any]:
         """Get monitor configuration."""
         return {
             "task": self.task,
             "detector": self.detector_name,
-            "thresholds": self.thresholds,
+            "thresholds": dict(self.thresholds),
             "monitored_outputs": self.monitored_outputs,
-            "reference_size": len(self._ref_df),
+            "reference_size": self._reference_size,
         }
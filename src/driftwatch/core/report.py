@@ -6,10 +6,60 @@ Utilities for summarizing and representation of DriftReport
 from __future__ import annotations
 
 import json
+import math
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+# Reports are created per check and per feature: without a __dict__,
+# instances are smaller and attribute reads faster. Slotted dataclasses
+# need Python 3.10; on 3.9 instances keep their __dict__.
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Default report timestamp: calls datetime.now directly, without going
+# through a Python-level function
+_now_utc = partial(datetime.now, timezone.utc)
+
+
+def _json_float(value: float | None) -> float | None:
+    """
+    Score or p-value as written to report dictionaries: NaN and infinities
+    become None, which orjson and the standard library both write as null.
+    The standard library would otherwise write NaN or Infinity, which are
+    not valid JSON.
+    """
+    if value is None or not math.isfinite(value):
+        return None
+    return value
+
+
+def _dumps(data: dict[str, Any], indent: int | None) -> str:
+    """
+    Serialize a report dictionary to JSON.
+
+    Uses orjson when it is installed (``pip install driftwatch[fast]``)
+    and the indentation is one it supports (2 spaces or none), and the
+    standard library otherwise. NumPy scalars, e.g. scores computed by
+    custom detectors, are encoded as numbers like the standard library
+    does for np.float64, rather than through the ``str`` fallback.
+    """
+    if orjson is not None and indent in (2, None):
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=option).decode()
+    return json.dumps(data, indent=indent, default=str)
 
 
 class DriftType(str, Enum):
@@ -25,6 +75,11 @@ class DriftType(str, Enum):
     CONCEPT = "CONCEPT"
 
 
+# Enum.value is a descriptor call, several times slower than these
+# lookups; drift types are looked up once per feature in every to_dict()
+_DRIFT_TYPE_VALUES: dict[str, str] = {t: t.value for t in DriftType}
+
+
 class DriftStatus(str, Enum):
     """Overall drift status levels."""
 
@@ -33,7 +88,32 @@ class DriftStatus(str, Enum):
     CRITICAL = "CRITICAL"
 
 
-@dataclass
+_STATUS_VALUES: dict[str, str] = {s: s.value for s in DriftStatus}
+# Severity order, to find the worst of several statuses
+_STATUS_RANKS: dict[str, int] = {
+    DriftStatus.OK: 0,
+    DriftStatus.WARNING: 1,
+    DriftStatus.CRITICAL: 2,
+}
+# Header lines and missing-report line of each section of
+# ComprehensiveDriftReport.summary()
+_SECTIONS: dict[str, tuple[tuple[str, str, str], str]] = {
+    DriftType.FEATURE: (
+        ("-" * 60, "📊 FEATURE DRIFT (Data Distribution)", "-" * 60),
+        "  Not analyzed",
+    ),
+    DriftType.PREDICTION: (
+        ("-" * 60, "🎯 PREDICTION DRIFT (Model Output Distribution)", "-" * 60),
+        "  Not analyzed",
+    ),
+    DriftType.CONCEPT: (
+        ("-" * 60, "🧠 CONCEPT DRIFT (Model Performance Degradation)", "-" * 60),
+        "  Not analyzed (requires ground truth labels)",
+    ),
+}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class FeatureDriftResult:
     """
     Result of drift detection for a single feature.
@@ -71,34 +151,76 @@ class FeatureDriftResult:
         return {
             "feature_name": self.feature_name,
             "has_drift": self.has_drift,
-            "score": self.score,
+            "score": _json_float(self.score),
             "method": self.method,
             "threshold": self.threshold,
-            "p_value": self.p_value,
-            "drift_type": self.drift_type.value,
+            "p_value": _json_float(self.p_value),
+            "drift_type": _DRIFT_TYPE_VALUES[self.drift_type],
         }
 
+    def to_dict_into(self, out: dict[str, Any]) -> None:
+        """
+        Write the ``to_dict()`` entries into an existing dictionary.
 
-@dataclass
+        Args:
+            out: Dictionary to fill, reused across calls
+        """
+        out["feature_name"] = self.feature_name
+        out["has_drift"] = self.has_drift
+        out["score"] = _json_float(self.score)
+        out["method"] = self.method
+        out["threshold"] = self.threshold
+        out["p_value"] = _json_float(self.p_value)
+        out["drift_type"] = _DRIFT_TYPE_VALUES[self.drift_type]
+
+
+@dataclass(frozen=True, **_SLOTS)
 class DriftReport:
     """
     Comprehensive report of drift detection results.
 
-    Contains per-feature metrics and aggregate status.
+    Contains per-feature metrics and aggregate status. Reports are
+    immutable: the drifted features, drift ratio and status are computed
+    once, when the report is created, and reused by every aggregate.
 
     Attributes:
-        feature_results: List of per-feature drift results
+        feature_results: Per-feature drift results, stored as a tuple
         reference_size: Number of samples in reference data
         production_size: Number of samples in production data
         timestamp: When the check was performed
         model_version: Optional model version identifier
     """
 
-    feature_results: list[FeatureDriftResult]
+    feature_results: Sequence[FeatureDriftResult]
     reference_size: int
     production_size: int
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = field(default_factory=_now_utc)
     model_version: str | None = None
+    _drifted: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _drift_ratio: float = field(init=False, repr=False, compare=False)
+    _status: DriftStatus = field(init=False, repr=False, compare=False)
+    # Built on first use, by feature_drift() and _isoformat()
+    _by_name: dict[str, FeatureDriftResult] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _timestamp_iso: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # A tuple, so the results can't change under the cached aggregates
+        object.__setattr__(self, "feature_results", tuple(self.feature_results))
+        drifted = tuple(r.feature_name for r in self.feature_results if r.has_drift)
+        ratio = len(drifted) / len(self.feature_results) if drifted else 0.0
+        if ratio == 0:
+            status = DriftStatus.OK
+        elif ratio < 0.5:
+            status = DriftStatus.WARNING
+        else:
+            status = DriftStatus.CRITICAL
+        object.__setattr__(self, "_drifted", drifted)
+        object.__setattr__(self, "_drift_ratio", ratio)
+        object.__setattr__(self, "_status", status)
 
     def has_drift(self) -> bool:
         """
@@ -110,7 +232,7 @@ class DriftReport:
             >>> report.has_drift()
             False
         """
-        return any(r.has_drift for r in self.feature_results)
+        return bool(self._drifted)
 
     def drifted_features(self) -> list[str]:
         """
@@ -123,7 +245,7 @@ class DriftReport:
             >>> report.drifted_features()
             ["age", "income"]
         """
-        return [r.feature_name for r in self.feature_results if r.has_drift]
+        return list(self._drifted)
 
     def drift_ratio(self) -> float:
         """
@@ -136,9 +258,17 @@ class DriftReport:
             >>> report.drift_ratio()
             0.25
         """
-        if not self.feature_results:
-            return 0.0
-        return len(self.drifted_features()) / len(self.feature_results)
+        return self._drift_ratio
+
+    @property
+    def n_drifted(self) -> int:
+        """Number of features with detected drift."""
+        return len(self._drifted)
+
+    @property
+    def n_features(self) -> int:
+        """Number of features checked."""
+        return len(self.feature_results)
 
     @property
     def status(self) -> DriftStatus:
@@ -161,13 +291,7 @@ class DriftReport:
 
         """
 
-        ratio = self.drift_ratio()
-        if ratio == 0:
-            return DriftStatus.OK
-        elif ratio < 0.5:
-            return DriftStatus.WARNING
-        else:
-            return DriftStatus.CRITICAL
+        return self._status
 
     def feature_drift(self, feature_name: str) -> FeatureDriftResult | None:
         """
@@ -184,10 +308,12 @@ class DriftReport:
             >>> result.has_drift
             True
         """
-        for result in self.feature_results:
-            if result.feature_name == feature_name:
-                return result
-        return None
+        by_name = self._by_name
+        if by_name is None:
+            # Reversed, so that the first result of a repeated name wins
+            by_name = {r.feature_name: r for r in reversed(self.feature_results)}
+            object.__setattr__(self, "_by_name", by_name)
+        return by_name.get(feature_name)
 
     def summary(self) -> str:
         """
@@ -204,30 +330,40 @@ class DriftReport:
             "=" * 50,
             "DRIFT REPORT",
             "=" * 50,
-            f"Status: {self.status.value}",
-            f"Timestamp: {self.timestamp.isoformat()}",
+            f"Status: {_STATUS_VALUES[self._status]}",
+            f"Timestamp: {self._isoformat()}",
             f"Reference samples: {self.reference_size:,}",
             f"Production samples: {self.production_size:,}",
             "",
-            f"Features analyzed: {len(self.feature_results)}",
-            f"Features with drift: {len(self.drifted_features())}",
-            f"Drift ratio: {self.drift_ratio():.1%}",
+            f"Features analyzed: {self.n_features}",
+            f"Features with drift: {self.n_drifted}",
+            f"Drift ratio: {self._drift_ratio:.1%}",
             "",
         ]
 
-        if self.drifted_features():
+        if self._drifted:
             lines.append("Drifted features:")
-            for result in self.feature_results:
-                if result.has_drift:
-                    lines.append(
-                        f"  - {result.feature_name}: "
-                        f"{result.method}={result.score:.4f} "
-                        f"(threshold={result.threshold})"
-                    )
+            lines.extend(
+                f"  - {result.feature_name}: "
+                f"{result.method}={result.score:.4f} "
+                f"(threshold={result.threshold})"
+                for result in self.feature_results
+                if result.has_drift
+            )
 
         lines.append("=" * 50)
+        # Collecting lines and joining once is about twice as fast as
+        # writing them to an io.StringIO; "=" * 50 is folded at compile time
         return "\n".join(lines)
 
+    def _isoformat(self) -> str:
+        """ISO 8601 timestamp, formatted once per report."""
+        iso = self._timestamp_iso
+        if iso is None:
+            iso = self.timestamp.isoformat()
+            object.__setattr__(self, "_timestamp_iso", iso)
+        return iso
+
     def to_dict(self) -> dict[str, Any]:
         """
         Convert report to dictionary.
@@ -239,18 +375,64 @@ class DriftReport:
             >>> report.to_dict()["status"]
             'OK'
         """
+        # A fresh list, as callers may edit the returned dictionary
+        return self._fields(list(self._drifted))
+
+    def _fields(self, drifted: Sequence[str]) -> dict[str, Any]:
+        """Dictionary representation, with the given drifted feature names."""
         return {
-            "status": self.status.value,
-            "timestamp": self.timestamp.isoformat(),
+            "status": _STATUS_VALUES[self._status],
+            "timestamp": self._isoformat(),
             "reference_size": self.reference_size,
             "production_size": self.production_size,
             "model_version": self.model_version,
-            "has_drift": self.has_drift(),
-            "drift_ratio": self.drift_ratio(),
-            "drifted_features": self.drifted_features(),
+            "has_drift": bool(self._drifted),
+            "drift_ratio": self._drift_ratio,
+            "drifted_features": drifted,
             "feature_results": [r.to_dict() for r in self.feature_results],
         }
 
+    def to_dict_into(
+        self, out: dict[str, Any], feature_buf: list[dict[str, Any]]
+    ) -> None:
+        """
+        Write the ``to_dict()`` entries into existing containers.
+
+        Meant for serializing a report per time window: reusing the same
+        dictionaries on every call avoids allocating a new dictionary per
+        feature. ``feature_buf`` is resized to the number of features,
+        adding dictionaries only when there are more features than before,
+        and becomes ``out["feature_results"]``. ``out["drifted_features"]``
+        is a tuple, which JSON encoders write as a list.
+
+        Args:
+            out: Dictionary to fill with the report entries
+            feature_buf: Dictionaries to fill with the feature results
+
+        Example:
+            >>> out, feature_buf = {}, []
+            >>> report.to_dict_into(out, feature_buf)
+            >>> out["status"]
+            'OK'
+        """
+        n_features = len(self.feature_results)
+        if len(feature_buf) < n_features:
+            feature_buf.extend({} for _ in range(n_features - len(feature_buf)))
+        else:
+            del feature_buf[n_features:]
+        for result, result_out in zip(self.feature_results, feature_buf):
+            result.to_dict_into(result_out)
+
+        out["status"] = _STATUS_VALUES[self._status]
+        out["timestamp"] = self._isoformat()
+        out["reference_size"] = self.reference_size
+        out["production_size"] = self.production_size
+        out["model_version"] = self.model_version
+        out["has_drift"] = bool(self._drifted)
+        out["drift_ratio"] = self._drift_ratio
+        out["drifted_features"] = self._drifted
+        out["feature_results"] = feature_buf
+
     def to_json(self, indent: int = 2) -> str:
         """
         Convert report to JSON string.
@@ -267,17 +449,44 @@ class DriftReport:
             True
 
         """
-        return json.dumps(self.to_dict(), indent=indent, default=str)
+        # The dictionary is only serialized, so the cached tuple of
+        # drifted names is encoded as is, like a list
+        return _dumps(self._fields(self._drifted), indent)
 
     def __repr__(self) -> str:
         return (
-            f"DriftReport(status={self.status.value}, "
-            f"features={len(self.feature_results)}, "
-            f"drifted={len(self.drifted_features())})"
+            f"DriftReport(status={_STATUS_VALUES[self._status]}, "
+            f"features={self.n_features}, "
+            f"drifted={self.n_drifted})"
         )
 
 
-@dataclass
+def _drifted_lines(report: DriftReport) -> Iterator[str]:
+    """Summary line of each drifted result, in one pass over the report."""
+    return (
+        f"    ⚠ {r.feature_name}: {r.method}={r.score:.4f}"
+        for r in report.feature_results
+        if r.has_drift
+    )
+
+
+def _append_section(
+    lines: list[str], drift_type: DriftType, report: DriftReport | None
+) -> None:
+    """Append the summary section of one drift type to ``lines``."""
+    header, missing = _SECTIONS[drift_type]
+    lines.extend(header)
+    if report is None:
+        lines.append(missing)
+        return
+    lines.append(f"  Status: {_STATUS_VALUES[report.status]}")
+    lines.append(f"  Drift Ratio: {report.drift_ratio():.1%}")
+    if drift_type is DriftType.FEATURE:
+        lines.append(f"  Affected: {report.n_drifted}/{report.n_features} features")
+    lines.extend(_drifted_lines(report))
+
+
+@dataclass(frozen=True, **_SLOTS)
 class ComprehensiveDriftReport:
     """Comprehensive drift report combining feature, prediction, and concept drift.
 
@@ -295,23 +504,47 @@ class ComprehensiveDriftReport:
     prediction_report: DriftReport | None = None
     concept_report: DriftReport | None = None
     model_version: str | None = None
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = field(default_factory=_now_utc)
+    _detected: tuple[DriftType, ...] = field(init=False, repr=False, compare=False)
+    _status: DriftStatus = field(init=False, repr=False, compare=False)
+    _drift_types_str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # The drift reports are immutable too, so the aggregates are
+        # computed once
+        detected: list[DriftType] = []
+        status = DriftStatus.OK
+        for drift_type, report in self._reports():
+            if report is None:
+                continue
+            if report.has_drift():
+                detected.append(drift_type)
+            if _STATUS_RANKS[report.status] > _STATUS_RANKS[status]:
+                status = report.status
+        object.__setattr__(self, "_detected", tuple(detected))
+        object.__setattr__(self, "_status", status)
+        # Shared by summary() and repr(), which loggers call on every report
+        object.__setattr__(
+            self,
+            "_drift_types_str",
+            ", ".join(_DRIFT_TYPE_VALUES[d] for d in detected),
+        )
+
+    def _reports(self) -> tuple[tuple[DriftType, DriftReport | None], ...]:
+        """Each drift type with its report, in summary order."""
+        return (
+            (DriftType.FEATURE, self.feature_report),
+            (DriftType.PREDICTION, self.prediction_report),
+            (DriftType.CONCEPT, self.concept_report),
+        )
 
     def has_drift(self) -> bool:
         """Check if any type of drift was detected."""
-        reports = [self.feature_report, self.prediction_report, self.concept_report]
-        return any(r.has_drift() for r in reports if r is not None)
+        return bool(self._detected)
 
     def drift_types_detected(self) -> list[DriftType]:
         """Return list of drift types that were detected."""
-        detected: list[DriftType] = []
-        if self.feature_report and self.feature_report.has_drift():
-            detected.append(DriftType.FEATURE)
-        if self.prediction_report and self.prediction_report.has_drift():
-            detected.append(DriftType.PREDICTION)
-        if self.concept_report and self.concept_report.has_drift():
-            detected.append(DriftType.CONCEPT)
-        return detected
+        return list(self._detected)
 
     @property
     def status(self) -> DriftStatus:
@@ -320,23 +553,7 @@ class ComprehensiveDriftReport:
         Returns the worst status across all reports.
         CONCEPT drift is weighted most heavily.
         """
-        statuses: list[DriftStatus] = []
-        for report in [
-            self.feature_report,
-            self.prediction_report,
-            self.concept_report,
-        ]:
-            if report is not None:
-                statuses.append(report.status)
-
-        if not statuses:
-            return DriftStatus.OK
-
-        if DriftStatus.CRITICAL in statuses:
-            return DriftStatus.CRITICAL
-        if DriftStatus.WARNING in statuses:
-            return DriftStatus.WARNING
-        return DriftStatus.OK
+        return self._status
 
     def summary(self) -> str:
         """Generate a comprehensive summary of all drift types."""
@@ -344,9 +561,9 @@ class ComprehensiveDriftReport:
             "=" * 60,
             "COMPREHENSIVE DRIFT REPORT",
             "=" * 60,
-            f"Overall Status: {self.status.value}",
+            f"Overall Status: {_STATUS_VALUES[self._status]}",
             f"Timestamp: {self.timestamp.isoformat()}",
-            f"Drift Types Detected: {', '.join(d.value for d in self.drift_types_detected()) or 'None'}",
+            f"Drift Types Detected: {self._drift_types_str or 'None'}",
         ]
 
         if self.model_version:
@@ -354,74 +571,21 @@ class ComprehensiveDriftReport:
 
         lines.append("")
 
-        # Feature Drift Section
-        lines.append("-" * 60)
-        lines.append("📊 FEATURE DRIFT (Data Distribution)")
-        lines.append("-" * 60)
-        if self.feature_report:
-            lines.append(f"  Status: {self.feature_report.status.value}")
-            lines.append(f"  Drift Ratio: {self.feature_report.drift_ratio():.1%}")
-            lines.append(
-                f"  Affected: {len(self.feature_report.drifted_features())}"
-                f"/{len(self.feature_report.feature_results)} features"
-            )
-            if self.feature_report.drifted_features():
-                for r in self.feature_report.feature_results:
-                    if r.has_drift:
-                        lines.append(
-                            f"    ⚠ {r.feature_name}: {r.method}={r.score:.4f}"
-                        )
-        else:
-            lines.append("  Not analyzed")
-
-        lines.append("")
-
-        # Prediction Drift Section
-        lines.append("-" * 60)
-        lines.append("🎯 PREDICTION DRIFT (Model Output Distribution)")
-        lines.append("-" * 60)
-        if self.prediction_report:
-            lines.append(f"  Status: {self.prediction_report.status.value}")
-            lines.append(f"  Drift Ratio: {self.prediction_report.drift_ratio():.1%}")
-            if self.prediction_report.drifted_features():
-                for r in self.prediction_report.feature_results:
-                    if r.has_drift:
-                        lines.append(
-                            f"    ⚠ {r.feature_name}: {r.method}={r.score:.4f}"
-                        )
-        else:
-            lines.append("  Not analyzed")
-
-        lines.append("")
-
-        # Concept Drift Section
-        lines.append("-" * 60)
-        lines.append("🧠 CONCEPT DRIFT (Model Performance Degradation)")
-        lines.append("-" * 60)
-        if self.concept_report:
-            lines.append(f"  Status: {self.concept_report.status.value}")
-            lines.append(f"  Drift Ratio: {self.concept_report.drift_ratio():.1%}")
-            if self.concept_report.drifted_features():
-                for r in self.concept_report.feature_results:
-                    if r.has_drift:
-                        lines.append(
-                            f"    ⚠ {r.feature_name}: {r.method}={r.score:.4f}"
-                        )
-        else:
-            lines.append("  Not analyzed (requires ground truth labels)")
+        for drift_type, report in self._reports():
+            _append_section(lines, drift_type, report)
+            lines.append("")
 
-        lines.append("")
         lines.append("=" * 60)
         return "\n".join(lines)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert comprehensive report to dictionary."""
         return {
-            "status": self.status.value,
+            "status": _STATUS_VALUES[self._status],
             "timestamp": self.timestamp.isoformat(),
             "model_version": self.model_version,
             "has_drift": self.has_drift(),
-            "drift_types_detected": [d.value for d in self.drift_types_detected()],
+            "drift_types_detected": [_DRIFT_TYPE_VALUES[d] for d in self._detected],
             "feature_drift": self.feature_report.to_dict()
             if self.feature_report
             else None,
@@ -435,8 +599,9 @@ class ComprehensiveDriftReport:
 
     def to_json(self, indent: int = 2) -> str:
         """Convert comprehensive report to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent, default=str)
+        return _dumps(self.to_dict(), indent)
 
     def __repr__(self) -> str:
-        types = ", ".join(d.value for d in self.drift_types_detected()) or "none"
-        return f"ComprehensiveDriftReport(status={self.status.value}, drift_types=[{types}])"
+        types = self._drift_types_str or "none"
+        status = _STATUS_VALUES[self._status]
+        return f"ComprehensiveDriftReport(status={status}, drift_types=[{types}])"
@@ -1,6 +1,12 @@
 """Drift detectors module."""
 
-from driftwatch.detectors.base import BaseDetector, DetectionResult
-from driftwatch.detectors.registry import get_detector
+from driftwatch.detectors.base import BaseDetector, DetectionResult, StreamAccumulator
+from driftwatch.detectors.registry import get_detector, get_detector_factory
 
-__all__ = ["BaseDetector", "DetectionResult", "get_detector"]
+__all__ = [
+    "BaseDetector",
+    "DetectionResult",
+    "StreamAccumulator",
+    "get_detector",
+    "get_detector_factory",
+]
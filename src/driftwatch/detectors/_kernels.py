@@ -0,0 +1,308 @@
+"""
+Inner loops of the numerical detectors.
+
+The loops are compiled with Numba when it is installed
+(``pip install driftwatch[fast]``), without holding the GIL so that
+Monitor(n_jobs=...) can run them on threads. Without Numba, equivalent
+NumPy implementations are used, so results do not depend on the extra.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import numpy as np
+
+# Smallest bucket proportion, avoids log(0) in PSI
+PSI_EPS = 1e-10
+
+# Largest bucket count for which the compiled loops find a value's bucket
+# by comparing it with every edge. The comparisons do not branch, which is
+# faster than a binary search for the usual 10 buckets; with many buckets
+# np.histogram is faster.
+LINEAR_SCAN_MAX_BINS = 32
+
+
+def _psi_from_bins_numpy(
+    edges: np.ndarray,
+    ref_pct: np.ndarray,
+    production: np.ndarray,
+) -> float:
+    """PSI of production data over fixed buckets, using np.histogram."""
+    prod_counts = np.histogram(production, bins=edges)[0]
+    return psi_from_counts(prod_counts, len(production), ref_pct)
+
+
+def psi_from_counts(counts: np.ndarray, n: int, ref_pct: np.ndarray) -> float:
+    """
+    Calculate PSI from production bucket counts.
+
+    Args:
+        counts: Production count of each reference bucket
+        n: Number of production values, including out-of-range ones
+        ref_pct: Clipped reference proportion of each bucket
+
+    Returns:
+        PSI score
+    """
+    prod_pct = np.clip(counts / n, PSI_EPS, 1)
+    return float(np.sum((prod_pct - ref_pct) * np.log(prod_pct / ref_pct)))
+
+
+def _bucket_counts_loop(edges: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Count values per bucket like np.histogram(values, bins=edges).
+
+    The bucket of a value is the number of inner edges it reaches, so the
+    last bucket also includes the upper edge.
+    """
+    n_bins = len(edges) - 1
+    counts = np.zeros(n_bins, dtype=np.int64)
+    lo = edges[0]
+    hi = edges[n_bins]
+    for value in values:
+        if not (lo <= value <= hi):
+            continue
+        idx = 0
+        for k in range(1, n_bins):
+            idx += value >= edges[k]
+        counts[idx] += 1
+    return counts
+
+
+def _psi_from_bins_loop(
+    edges: np.ndarray,
+    ref_pct: np.ndarray,
+    production: np.ndarray,
+) -> float:
+    """
+    PSI of production data over fixed buckets, as a single loop.
+
+    Bucketing follows np.histogram: buckets are half-open except the last
+    one, which includes the upper edge; values outside the edges are ignored
+    but still count in the total.
+    """
+    n_bins = len(edges) - 1
+    counts = np.zeros(n_bins, dtype=np.int64)
+    lo = edges[0]
+    hi = edges[n_bins]
+    for value in production:
+        if not (lo <= value <= hi):
+            continue
+        idx = 0
+        for k in range(1, n_bins):
+            idx += value >= edges[k]
+        counts[idx] += 1
+
+    n = len(production)
+    psi = 0.0
+    for k in range(n_bins):
+        prod_pct = min(max(counts[k] / n, PSI_EPS), 1.0)
+        psi += (prod_pct - ref_pct[k]) * np.log(prod_pct / ref_pct[k])
+    return psi
+
+
+def _ks_statistic_numpy(reference: np.ndarray, production: np.ndarray) -> float:
+    """Two-sided KS statistic of two sorted samples, via np.searchsorted."""
+    data_all = np.concatenate([reference, production])
+    cdf1 = np.searchsorted(reference, data_all, side="right") / len(reference)
+    cdf2 = np.searchsorted(production, data_all, side="right") / len(production)
+    return float(np.max(np.abs(cdf1 - cdf2)))
+
+
+def _ks_statistic_loop(reference: np.ndarray, production: np.ndarray) -> float:
+    """Two-sided KS statistic of two sorted samples, as a merge walk."""
+    n1 = len(reference)
+    n2 = len(production)
+    i = 0
+    j = 0
+    d = 0.0
+    while i < n1 and j < n2:
+        value = min(reference[i], production[j])
+        while i < n1 and reference[i] <= value:
+            i += 1
+        while j < n2 and production[j] <= value:
+            j += 1
+        d = max(d, abs(i / n1 - j / n2))
+    return d
+
+
+def _wasserstein_numpy(reference: np.ndarray, production: np.ndarray) -> float:
+    """
+    Wasserstein-1 distance of two sorted samples, via np.searchsorted.
+
+    Same formula as scipy.stats.wasserstein_distance, without sorting
+    the samples again: the stable sort of the two concatenated runs
+    merges them.
+    """
+    all_values = np.concatenate([reference, production], dtype=np.float64)
+    all_values.sort(kind="stable")
+    deltas = np.diff(all_values)
+    cdf1 = np.searchsorted(reference, all_values[:-1], side="right") / len(reference)
+    cdf2 = np.searchsorted(production, all_values[:-1], side="right") / len(production)
+    return float(np.sum(np.abs(cdf1 - cdf2) * deltas))
+
+
+def _wasserstein_loop(reference: np.ndarray, production: np.ndarray) -> float:
+    """
+    Wasserstein-1 distance of two sorted samples, as a merge walk.
+
+    Integrates |F_ref - F_prod| between consecutive values of the merged
+    samples, where both empirical CDFs are constant.
+    """
+    n1 = len(reference)
+    n2 = len(production)
+    i = 0
+    j = 0
+    distance = 0.0
+    # Values are widened to float64, so that float32 samples are
+    # subtracted exactly
+    previous = np.float64(min(reference[0], production[0]))
+    while i < n1 or j < n2:
+        if j == n2 or (i < n1 and reference[i] <= production[j]):
+            value = np.float64(reference[i])
+        else:
+            value = np.float64(production[j])
+        distance += abs(i / n1 - j / n2) * (value - previous)
+        previous = value
+        while i < n1 and reference[i] <= value:
+            i += 1
+        while j < n2 and production[j] <= value:
+            j += 1
+    return distance
+
+
+# Compiled loops, set by _load_kernels() on first use: importing Numba
+# takes about 0.3s, which `import driftwatch` should not pay
+_bucket_kernel: Any = None
+_psi_kernel: Any = None
+_ks_kernel: Any = None
+_wasserstein_kernel: Any = None
+_kernels_loaded = False
+_load_lock = threading.Lock()
+
+
+def _load_kernels() -> None:
+    """Wrap the loops with Numba when it is installed."""
+    global _kernels_loaded
+    global _bucket_kernel, _psi_kernel, _ks_kernel, _wasserstein_kernel
+    with _load_lock:
+        if _kernels_loaded:
+            return
+        try:
+            import numba
+        except ImportError:  # pragma: no cover - depends on the environment
+            pass
+        else:
+            jit = numba.njit(cache=True, nogil=True)
+            _bucket_kernel = jit(_bucket_counts_loop)
+            _psi_kernel = jit(_psi_from_bins_loop)
+            _ks_kernel = jit(_ks_statistic_loop)
+            _wasserstein_kernel = jit(_wasserstein_loop)
+        _kernels_loaded = True
+
+
+def _scan_values(values: np.ndarray) -> np.ndarray:
+    """
+    Values as floats for the compiled loops.
+
+    float32 values, such as predicted probabilities, are passed as is
+    rather than widened into a float64 copy: comparing them with the
+    float64 edges, or with each other, gives the same result, and the
+    loops read half as much memory.
+    """
+    values = np.asarray(values)
+    if values.dtype == np.float32 or values.dtype == np.float64:
+        return values
+    return values.astype(np.float64)
+
+
+def _use_scan(edges: np.ndarray, values: np.ndarray) -> bool:
+    """Whether the compiled bucket loops should count ``values``."""
+    if not _kernels_loaded:
+        _load_kernels()
+    return (
+        _bucket_kernel is not None
+        and len(values) > 0
+        and len(edges) - 1 <= LINEAR_SCAN_MAX_BINS
+    )
+
+
+def bucket_counts(edges: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Count values per bucket, as ``np.histogram(values, bins=edges)[0]``.
+
+    Used to accumulate production histograms chunk by chunk, so that
+    only one count per reference bucket is kept in memory.
+
+    Args:
+        edges: Sorted bucket edges (at least two)
+        values: Values to count; NaNs fall in no bucket
+
+    Returns:
+        Count of each bucket
+    """
+    counts: np.ndarray
+    if _use_scan(edges, values):
+        counts = _bucket_kernel(edges, _scan_values(values))
+    else:
+        counts = np.histogram(values, bins=edges)[0]
+    return counts
+
+
+def psi_from_bins(
+    edges: np.ndarray,
+    ref_pct: np.ndarray,
+    production: np.ndarray,
+) -> float:
+    """
+    Calculate PSI of production data over precomputed reference buckets.
+
+    Args:
+        edges: Sorted bucket edges (at least two)
+        ref_pct: Clipped reference proportion of each bucket
+        production: NaN-free production values
+
+    Returns:
+        PSI score
+    """
+    if not _use_scan(edges, production):
+        return _psi_from_bins_numpy(edges, ref_pct, production)
+    return float(_psi_kernel(edges, ref_pct, _scan_values(production)))
+
+
+def ks_statistic(reference: np.ndarray, production: np.ndarray) -> float:
+    """
+    Calculate the two-sided two-sample KS statistic.
+
+    Args:
+        reference: Sorted, non-empty, NaN-free reference values
+        production: Sorted, non-empty, NaN-free production values
+
+    Returns:
+        Maximum absolute distance between the two empirical CDFs
+    """
+    if not _kernels_loaded:
+        _load_kernels()
+    if _ks_kernel is None:
+        return _ks_statistic_numpy(reference, production)
+    return float(_ks_kernel(_scan_values(reference), _scan_values(production)))
+
+
+def wasserstein(reference: np.ndarray, production: np.ndarray) -> float:
+    """
+    Calculate the Wasserstein-1 distance between two samples.
+
+    Args:
+        reference: Sorted, non-empty, NaN-free reference values
+        production: Sorted, non-empty, NaN-free production values
+
+    Returns:
+        Area between the two empirical CDFs
+    """
+    if not _kernels_loaded:
+        _load_kernels()
+    if _wasserstein_kernel is None:
+        return _wasserstein_numpy(reference, production)
+    return float(_wasserstein_kernel(_scan_values(reference), _scan_values(production)))
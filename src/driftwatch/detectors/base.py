@@ -6,9 +6,16 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     import pandas as pd
 
+# Production values kept by the default streaming accumulator
+STREAM_SAMPLE_SIZE = 100_000
+
 
 @dataclass
 class DetectionResult:
@@ -28,6 +35,11 @@ class BaseDetector(ABC):
     All drift detection methods should inherit from this class
     and implement the `detect` method.
 
+    Detectors can also be fitted once on a reference series with `fit`
+    and then compared against many production batches with
+    `detect_fitted`. Subclasses override these to precompute
+    reference-side state (bin edges, sorted values, ...).
+
     Args:
         threshold: Threshold value for determining drift
         name: Human-readable name for the detector
@@ -36,6 +48,7 @@ class BaseDetector(ABC):
     def __init__(self, threshold: float, name: str) -> None:
         self.threshold = threshold
         self.name = name
+        self._reference: pd.Series | None = None
 
     @abstractmethod
     def detect(
@@ -55,6 +68,98 @@ class BaseDetector(ABC):
         """
         ...
 
+    def fit(self, reference: pd.Series) -> BaseDetector:
+        """
+        Store the reference series for subsequent `detect_fitted` calls.
+
+        Args:
+            reference: Reference data series
+
+        Returns:
+            The fitted detector (self)
+
+        Raises:
+            ValueError: If reference series is empty
+        """
+        if reference.empty:
+            raise ValueError("Reference series cannot be empty")
+        self._reference = reference
+        return self
+
+    def detect_fitted(self, production: pd.Series | np.ndarray) -> DetectionResult:
+        """
+        Detect drift between the fitted reference and production data.
+
+        Args:
+            production: Production data series or 1-D array
+
+        Returns:
+            DetectionResult with drift status and metrics
+
+        Raises:
+            RuntimeError: If the detector has not been fitted
+        """
+        if self._reference is None:
+            raise RuntimeError("Detector is not fitted. Call fit() first.")
+        if isinstance(production, np.ndarray):
+            import pandas as pd
+
+            return self.detect(self._reference, pd.Series(production))
+        return self.detect(self._reference, production)
+
+    @classmethod
+    def detect_batch(
+        cls,
+        detectors: Sequence[BaseDetector],
+        columns: Sequence[pd.Series | np.ndarray],
+    ) -> list[DetectionResult]:
+        """
+        Run several fitted detectors of this class, one column each.
+
+        The default runs ``detect_fitted`` column by column. Subclasses
+        override it to process all columns with shared vectorized calls.
+
+        Args:
+            detectors: Fitted detectors, instances of this class
+            columns: Production column for each detector
+
+        Returns:
+            One DetectionResult per detector, in order
+        """
+        return [
+            detector.detect_fitted(column)
+            for detector, column in zip(detectors, columns)
+        ]
+
+    def accumulator(self) -> StreamAccumulator:
+        """
+        Create an accumulator that tests production data arriving in chunks.
+
+        Feed chunks with ``update`` and get the result with ``result``.
+        The default accumulator keeps a uniform sample of at most
+        ``STREAM_SAMPLE_SIZE`` values and runs ``detect_fitted`` on it, so
+        it is exact until that many values have been seen. Subclasses
+        return accumulators that keep exact running summaries instead.
+
+        Returns:
+            A new, empty accumulator bound to this detector
+        """
+        return StreamAccumulator(self)
+
+    @staticmethod
+    def _dropna(values: pd.Series | np.ndarray) -> np.ndarray:
+        """Return the non-missing values of a series or 1-D array."""
+        if not isinstance(values, np.ndarray):
+            return np.asarray(values.dropna().values)
+        if values.dtype.kind == "f":
+            mask = np.isnan(values)
+            return values[~mask] if mask.any() else values
+        if values.dtype.kind == "O":
+            import pandas as pd
+
+            return values[pd.notna(values)]
+        return values
+
     def _validate_inputs(
         self,
         reference: pd.Series,
@@ -65,3 +170,71 @@ class BaseDetector(ABC):
             raise ValueError("Reference series cannot be empty")
         if production.empty:
             raise ValueError("Production series cannot be empty")
+
+
+class StreamAccumulator:
+    """
+    Running summary of production chunks for one fitted detector.
+
+    Keeps a uniform reservoir sample of the production values seen so far
+    and runs the detector's ``detect_fitted`` on it.
+
+    Args:
+        detector: Fitted detector producing the final result
+        sample_size: Maximum number of values kept
+        seed: Seed of the reservoir sampling, for reproducible results
+    """
+
+    def __init__(
+        self,
+        detector: BaseDetector,
+        sample_size: int = STREAM_SAMPLE_SIZE,
+        seed: int = 0,
+    ) -> None:
+        self.detector = detector
+        self.sample_size = sample_size
+        self.n_seen = 0
+        self._sample: np.ndarray | None = None
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, production: pd.Series | np.ndarray) -> None:
+        """
+        Add a chunk of production values.
+
+        Args:
+            production: Production data series or 1-D array
+        """
+        values = np.asarray(production)
+        if self._sample is None:
+            self._sample = values[: self.sample_size].copy()
+            free = len(self._sample)
+        else:
+            dtype = np.result_type(self._sample, values)
+            free = max(self.sample_size - len(self._sample), 0)
+            self._sample = np.concatenate(
+                [self._sample.astype(dtype, copy=False), values[:free]]
+            )
+
+        # Reservoir sampling (algorithm R): the value at overall position i
+        # replaces a random slot with probability sample_size / (i + 1).
+        rest = values[free:]
+        if len(rest):
+            positions = self.n_seen + free + np.arange(len(rest))
+            slots = self._rng.integers(0, positions + 1)
+            keep = slots < self.sample_size
+            self._sample[slots[keep]] = rest[keep]
+        self.n_seen += len(values)
+
+    def result(self) -> DetectionResult:
+        """
+        Test the production values seen so far against the reference.
+
+        Returns:
+            DetectionResult with drift status and metrics
+
+        Raises:
+            ValueError: If no production values have been added
+        """
+        if self._sample is None or self.n_seen == 0:
+            raise ValueError("Production series cannot be empty")
+        return self.detector.detect_fitted(self._sample)
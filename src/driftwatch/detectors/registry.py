@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -17,10 +18,23 @@ from driftwatch.detectors.numerical import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
     from driftwatch.detectors.base import BaseDetector
 
+# Key of the thresholds mapping read by each detector, by detector name
+THRESHOLD_KEYS: dict[str, str] = {
+    "ks_test": "ks_pvalue",
+    "psi": "psi",
+    "wasserstein": "wasserstein",
+    "chi_squared": "chi2_pvalue",
+    "jensen_shannon": "jensen_shannon",
+    "anderson_darling": "anderson_darling_pvalue",
+    "cramer_von_mises": "cramer_von_mises_pvalue",
+}
+
 
-def get_detector(dtype: np.dtype[Any], thresholds: dict[str, float]) -> BaseDetector:
+def get_detector(dtype: np.dtype[Any], thresholds: Mapping[str, float]) -> BaseDetector:
     """
     Get appropriate detector based on data type.
 
@@ -35,40 +49,62 @@ def get_detector(dtype: np.dtype[Any], thresholds: dict[str, float]) -> BaseDete
         - Numerical types use PSI by default
         - Categorical/object types use Chi-Squared
     """
+    return get_detector_factory(dtype, thresholds)()
+
+
+def get_detector_factory(
+    dtype: np.dtype[Any],
+    thresholds: Mapping[str, float],
+) -> Callable[[], BaseDetector]:
+    """
+    Get a factory of the detector ``get_detector`` selects for a dtype.
+
+    Detectors hold fitted reference state, so each feature needs its own
+    instance; the factory lets features sharing a dtype resolve it once.
+
+    Args:
+        dtype: NumPy dtype of the feature
+        thresholds: Dictionary of threshold values
+
+    Returns:
+        Callable creating a new, unfitted detector
+    """
     import pandas as pd
 
+    chi2 = partial(ChiSquaredDetector, threshold=thresholds.get("chi2_pvalue", 0.05))
+
     # Handle pandas CategoricalDtype explicitly
     if isinstance(dtype, pd.CategoricalDtype):
-        return ChiSquaredDetector(threshold=thresholds.get("chi2_pvalue", 0.05))
+        return chi2
 
     # Handle pandas StringDtype explicitly
     if isinstance(dtype, pd.StringDtype):
-        return ChiSquaredDetector(threshold=thresholds.get("chi2_pvalue", 0.05))
+        return chi2
 
     # Handle object dtype (strings, mixed types)
     if dtype == np.object_ or dtype.name == "object":
-        return ChiSquaredDetector(threshold=thresholds.get("chi2_pvalue", 0.05))
+        return chi2
 
     # Handle string-like dtype names (e.g., 'string', 'String')
     if hasattr(dtype, "name") and dtype.name.lower().startswith("string"):
-        return ChiSquaredDetector(threshold=thresholds.get("chi2_pvalue", 0.05))
+        return chi2
 
     # Handle numerical types
     try:
         if np.issubdtype(dtype, np.number):
             # Use PSI for numerical features by default
-            return PSIDetector(threshold=thresholds.get("psi", 0.2))
+            return partial(PSIDetector, threshold=thresholds.get("psi", 0.2))
     except TypeError:
         # If issubdtype fails, treat as categorical
         pass
 
     # Default to categorical for any other type
-    return ChiSquaredDetector(threshold=thresholds.get("chi2_pvalue", 0.05))
+    return chi2
 
 
 def get_detector_by_name(
     name: str,
-    thresholds: dict[str, float],
+    thresholds: Mapping[str, float],
 ) -> BaseDetector:
     """
     Get detector by explicit name.
@@ -11,10 +11,15 @@ import contextlib
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    import numpy as np
     import pandas as pd
 
     from driftwatch.core.report import DriftReport
 
+    # Reference values, production values, bin edges, reference counts,
+    # production counts
+    _Histograms = tuple[pd.Series, pd.Series, np.ndarray, np.ndarray, np.ndarray]
+
 
 class DriftVisualizer:
     """
@@ -37,6 +42,9 @@ class DriftVisualizer:
         >>> # Or plot all features
         >>> fig = viz.plot_all()
         >>> plt.savefig("drift_report.png")
+
+    The histogram of a feature is computed once per bin count and reused
+    by later plots, so the data should not be modified in between.
     """
 
     def __init__(
@@ -72,6 +80,39 @@ class DriftVisualizer:
         if colors:
             self.colors.update(colors)
 
+        # (feature, bins) -> reference and production values, shared bin
+        # edges and the counts of both sides
+        self._histograms: dict[tuple[str, int], _Histograms] = {}
+
+    def _histogram(self, feature_name: str, bins: int) -> _Histograms:
+        """
+        Bin a feature on edges shared by reference and production data.
+
+        Plots draw the counts as weights on the bin edges rather than
+        rebinning the raw values, so redrawing a feature (e.g. plot_feature
+        after plot_all, or save) does not scan its data again.
+        """
+        key = (feature_name, bins)
+        cached = self._histograms.get(key)
+        if cached is not None:
+            return cached
+
+        import numpy as np
+
+        ref_data = self.reference_data[feature_name].dropna()
+        prod_data = self.production_data[feature_name].dropna()
+        all_data = np.concatenate([ref_data.values, prod_data.values])
+        bin_edges = np.histogram_bin_edges(all_data, bins=bins)
+        histogram = (
+            ref_data,
+            prod_data,
+            bin_edges,
+            np.histogram(ref_data, bins=bin_edges)[0],
+            np.histogram(prod_data, bins=bin_edges)[0],
+        )
+        self._histograms[key] = histogram
+        return histogram
+
     def plot_feature(
         self,
         feature_name: str,
@@ -125,11 +166,8 @@ class DriftVisualizer:
         if feature_name not in self.production_data.columns:
             raise ValueError(f"Feature '{feature_name}' not found in production data")
 
-        ref_data = self.reference_data[feature_name].dropna()
-        prod_data = self.production_data[feature_name].dropna()
-
         # Check if numeric
-        if not np.issubdtype(ref_data.dtype, np.number):
+        if not np.issubdtype(self.reference_data[feature_name].dtype, np.number):
             raise ValueError(
                 f"Feature '{feature_name}' is not numeric. "
                 "Visualization only supports numeric features."
@@ -152,9 +190,9 @@ class DriftVisualizer:
 
         fig, ax = plt.subplots(figsize=figsize)
 
-        # Compute common bin edges
-        all_data = np.concatenate([ref_data.values, prod_data.values])
-        bin_edges = np.histogram_bin_edges(all_data, bins=bins)
+        ref_data, prod_data, bin_edges, ref_counts, prod_counts = self._histogram(
+            feature_name, bins
+        )
 
         # Prepare hist kwargs
         default_hist_kwargs = {
@@ -167,8 +205,9 @@ class DriftVisualizer:
 
         # Plot histograms
         ax.hist(
-            ref_data,
+            bin_edges[:-1],
             bins=bin_edges,
+            weights=ref_counts,
             alpha=alpha,
             label=f"Reference (n={len(ref_data):,})",
             color=plot_colors["reference"],
@@ -176,8 +215,9 @@ class DriftVisualizer:
         )
 
         ax.hist(
-            prod_data,
+            bin_edges[:-1],
             bins=bin_edges,
+            weights=prod_counts,
             alpha=alpha,
             label=f"Production (n={len(prod_data):,})",
             color=plot_colors["production"],
@@ -354,19 +394,12 @@ class DriftVisualizer:
         hist_kwargs: dict[str, Any] | None = None,
     ) -> None:
         """Plot a single feature on the given axes."""
-        import numpy as np
-
-        ref_data = self.reference_data[feature_name].dropna()
-        prod_data = self.production_data[feature_name].dropna()
+        _, _, bin_edges, ref_counts, prod_counts = self._histogram(feature_name, bins)
 
         feature_result = self.report.feature_drift(feature_name)
         has_drift = feature_result.has_drift if feature_result else False
         drift_score = feature_result.score if feature_result else 0.0
 
-        # Compute common bin edges
-        all_data = np.concatenate([ref_data.values, prod_data.values])
-        bin_edges = np.histogram_bin_edges(all_data, bins=bins)
-
         # Prepare hist kwargs
         default_hist_kwargs = {
             "density": True,
@@ -378,8 +411,9 @@ class DriftVisualizer:
 
         # Plot histograms
         ax.hist(
-            ref_data,
+            bin_edges[:-1],
             bins=bin_edges,
+            weights=ref_counts,
             alpha=alpha,
             label="Reference",
             color=colors["reference"],
@@ -387,8 +421,9 @@ class DriftVisualizer:
         )
 
         ax.hist(
-            prod_data,
+            bin_edges[:-1],
             bins=bin_edges,
+            weights=prod_counts,
             alpha=alpha,
             label="Production",
             color=colors["production"],
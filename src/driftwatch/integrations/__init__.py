@@ -1,18 +1,37 @@
 """DriftWatch integrations for external services."""
 
-from driftwatch.integrations.fastapi import DriftMiddleware, add_drift_routes
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from driftwatch.integrations.email import EmailAlerter
+    from driftwatch.integrations.fastapi import DriftMiddleware, add_drift_routes
+    from driftwatch.integrations.mlflow import MLflowDriftTracker
 
 __all__ = ["DriftMiddleware", "EmailAlerter", "MLflowDriftTracker", "add_drift_routes"]
 
+# Every integration needs an optional dependency (Starlette, MLflow, ...),
+# so each is imported on first access (PEP 562): importing one integration
+# module, e.g. driftwatch.integrations.alerting, does not load the others.
+_LAZY_IMPORTS = {
+    "DriftMiddleware": "driftwatch.integrations.fastapi",
+    "EmailAlerter": "driftwatch.integrations.email",
+    "MLflowDriftTracker": "driftwatch.integrations.mlflow",
+    "add_drift_routes": "driftwatch.integrations.fastapi",
+}
+
 
 def __getattr__(name: str) -> object:
     """Lazy-load optional integrations to avoid hard import errors."""
-    if name == "MLflowDriftTracker":
-        from driftwatch.integrations.mlflow import MLflowDriftTracker
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
 
-        return MLflowDriftTracker
-    if name == "EmailAlerter":
-        from driftwatch.integrations.email import EmailAlerter
 
-        return EmailAlerter
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -136,7 +136,7 @@ class SlackAlerter:
             },
             {
                 "type": "mrkdwn",
-                "text": f"*Affected Features:*\n{len(report.drifted_features())}/{len(report.feature_results)}",
+                "text": f"*Affected Features:*\n{report.n_drifted}/{report.n_features}",
             },
             {
                 "type": "mrkdwn",
@@ -150,7 +150,7 @@ class SlackAlerter:
         blocks.append({"type": "divider"})
 
         # Feature details (only drifted features)
-        if report.drifted_features():
+        if report.has_drift():
             blocks.append(
                 {
                     "type": "section",
@@ -150,7 +150,7 @@ class EmailAlerter:
         )
         subject = custom_subject or (
             f"{self.subject_prefix} {status_emoji} Drift {report.status.value} "
-            f"— {len(report.drifted_features())}/{len(report.feature_results)} "
+            f"— {report.n_drifted}/{report.n_features} "
             f"features affected"
         )
         msg["Subject"] = subject
@@ -175,8 +175,7 @@ class EmailAlerter:
             f"Status: {report.status.value}",
             f"Timestamp: {self._format_timestamp(report.timestamp)}",
             f"Drift Ratio: {report.drift_ratio():.1%}",
-            f"Affected Features: {len(report.drifted_features())}"
-            f"/{len(report.feature_results)}",
+            f"Affected Features: {report.n_drifted}/{report.n_features}",
             "",
         ]
 
@@ -184,7 +183,7 @@ class EmailAlerter:
             lines.append(f"Model Version: {report.model_version}")
             lines.append("")
 
-        if report.drifted_features():
+        if report.has_drift():
             lines.append("Drifted Features:")
             for result in report.feature_results:
                 if result.has_drift:
@@ -289,7 +288,7 @@ class EmailAlerter:
                                         color: #999; letter-spacing: 0.5px;">Affected</div>
                             <div style="font-size: 20px; font-weight: 700;
                                         color: #333; margin-top: 4px;">
-                                {len(report.drifted_features())}/{len(report.feature_results)}
+                                {report.n_drifted}/{report.n_features}
                             </div>
                         </div>
                     </div>
@@ -37,6 +37,10 @@ class DriftState:
     last_check_time: datetime | None = None
     request_count: int = 0
     lock: threading.Lock = field(default_factory=threading.Lock)
+    # Bumped on every change of the samples buffer; the DataFrame built
+    # from the buffer is kept with the version it was built from
+    _version: int = field(default=0, repr=False)
+    _samples_df: tuple[int, pd.DataFrame] | None = field(default=None, repr=False)
 
     def add_prediction(self, prediction: dict[str, Any]) -> None:
         """Add a prediction to the buffer."""
@@ -48,11 +52,42 @@ class DriftState:
         with self.lock:
             self.samples.append(sample)
             self.request_count += 1
+            self._version += 1
+
+    def clear_samples(self) -> None:
+        """Empty the samples buffer and reset the request count."""
+        with self.lock:
+            self.samples.clear()
+            self.request_count = 0
+            self._version += 1
 
     def get_samples_df(self) -> pd.DataFrame:
-        """Get samples as DataFrame."""
+        """
+        Get samples as DataFrame.
+
+        The DataFrame is reused until a sample is added or the buffer is
+        cleared, so repeated checks of unchanged samples do not rebuild
+        it. It is built outside the lock, which only guards the copy of
+        the buffer, so requests are not blocked meanwhile.
+
+        The returned DataFrame is shared by every caller until the buffer
+        changes and must be treated as read-only; copy it before
+        modifying it.
+        """
+        with self.lock:
+            cached = self._samples_df
+            if cached is not None and cached[0] == self._version:
+                return cached[1]
+            version = self._version
+            samples = list(self.samples)
+
+        samples_df = pd.DataFrame(samples)
         with self.lock:
-            return pd.DataFrame(list(self.samples))
+            # A concurrent call may have cached a newer buffer meanwhile
+            cached = self._samples_df
+            if cached is None or cached[0] < version:
+                self._samples_df = (version, samples_df)
+        return samples_df
 
     def update_report(self, report: DriftReport) -> None:
         """Update the last drift report."""
@@ -290,8 +325,6 @@ def add_drift_routes(app: Any, middleware: DriftMiddleware) -> None:
     @app.post("/drift/reset")
     async def reset_samples() -> dict[str, Any]:
         """Reset collected samples."""
-        with middleware.state.lock:
-            middleware.state.samples.clear()
-            middleware.state.request_count = 0
+        middleware.state.clear_samples()
 
         return {"message": "Samples reset successfully"}
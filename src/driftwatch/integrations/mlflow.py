@@ -206,8 +206,8 @@ class MLflowDriftTracker:
             {
                 f"{self.prefix}.has_drift": float(report.has_drift()),
                 f"{self.prefix}.drift_ratio": report.drift_ratio(),
-                f"{self.prefix}.num_features": float(len(report.feature_results)),
-                f"{self.prefix}.num_drifted": float(len(report.drifted_features())),
+                f"{self.prefix}.num_features": float(report.n_features),
+                f"{self.prefix}.num_drifted": float(report.n_drifted),
             }
         )
 
@@ -0,0 +1,167 @@
+"""Tests for the command line interface."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+import pytest
+from typer.testing import CliRunner
+
+from driftwatch.cli.main import app
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+runner = CliRunner()
+
+
+class TestReportCommand:
+    """Tests for `driftwatch report`."""
+
+    def test_null_score_shown_as_unknown(self, tmp_path: Path) -> None:
+        """A null score is not finite, but its value is unknown."""
+        report_path = tmp_path / "report.json"
+        report_path.write_text(
+            json.dumps(
+                {
+                    "status": "WARNING",
+                    "feature_results": [
+                        {
+                            "feature_name": "age",
+                            "method": "psi",
+                            "score": None,
+                            "threshold": 0.2,
+                            "has_drift": False,
+                        },
+                        {
+                            "feature_name": "income",
+                            "method": "psi",
+                            "score": 0.5,
+                            "threshold": 0.2,
+                            "has_drift": True,
+                        },
+                    ],
+                }
+            )
+        )
+
+        result = runner.invoke(app, ["report", str(report_path)])
+
+        assert result.exit_code == 0
+        assert "n/a" in result.output
+        assert "inf" not in result.output
+        assert "0.5000" in result.output
+
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    def test_check_then_report_nan_score(self, tmp_path: Path) -> None:
+        """An all-NaN production column should round-trip as an unknown score."""
+        rng = np.random.default_rng(0)
+        ref_path, prod_path = tmp_path / "ref.csv", tmp_path / "prod.csv"
+        out_path = tmp_path / "out.json"
+        pd.DataFrame({"age": rng.normal(40, 5, 200)}).to_csv(ref_path, index=False)
+        pd.DataFrame({"age": [np.nan] * 100}).to_csv(prod_path, index=False)
+
+        runner.invoke(
+            app,
+            ["check", "-r", str(ref_path), "-p", str(prod_path), "-o", str(out_path)],
+        )
+        result = runner.invoke(app, ["report", str(out_path)])
+
+        assert json.loads(out_path.read_text())["feature_results"][0]["score"] is None
+        assert "n/a" in result.output
+
+
+class TestCheckCommand:
+    """Tests for `driftwatch check`."""
+
+    @pytest.fixture
+    def csv_files(self, tmp_path: Path) -> tuple[Path, Path]:
+        """Reference and drifted production CSV files."""
+        rng = np.random.default_rng(42)
+        ref_path, prod_path = tmp_path / "ref.csv", tmp_path / "prod.csv"
+        pd.DataFrame(
+            {
+                "age": rng.normal(40, 5, 500),
+                "income": rng.normal(50_000, 5_000, 500),
+                "city": rng.choice(["Paris", "Lyon"], 500),
+            }
+        ).to_csv(ref_path, index=False)
+        pd.DataFrame(
+            {
+                "age": rng.normal(50, 5, 300),
+                "income": rng.normal(50_000, 5_000, 300),
+                "city": rng.choice(["Paris", "Lyon"], 300),
+            }
+        ).to_csv(prod_path, index=False)
+        return ref_path, prod_path
+
+    def _check(self, *args: str | Path) -> tuple[int, str]:
+        result = runner.invoke(app, ["check", *map(str, args)])
+        return result.exit_code, result.output
+
+    def test_feature_selects_columns(
+        self, csv_files: tuple[Path, Path], tmp_path: Path
+    ) -> None:
+        """Only the selected features should be checked."""
+        ref_path, prod_path = csv_files
+        out_path = tmp_path / "out.json"
+
+        self._check(
+            "-r", ref_path, "-p", prod_path, "-f", "age", "-f", "city", "-o", out_path
+        )
+
+        results = json.loads(out_path.read_text())["feature_results"]
+        assert sorted(r["feature_name"] for r in results) == ["age", "city"]
+
+    def test_unknown_feature_rejected(
+        self, csv_files: tuple[Path, Path], tmp_path: Path
+    ) -> None:
+        """Unknown feature names should be a usage error naming them."""
+        ref_path, prod_path = csv_files
+        out_path = tmp_path / "out.json"
+
+        exit_code, output = self._check(
+            "-r", ref_path, "-p", prod_path, "-f", "age", "-f", "height", "-o", out_path
+        )
+
+        assert exit_code == 2
+        assert "height" in output
+        assert not out_path.exists()
+
+    def test_unknown_feature_rejected_parquet(self, tmp_path: Path) -> None:
+        """Parquet files should be checked against their schema first."""
+        pytest.importorskip("pyarrow")
+        ref_path = tmp_path / "ref.parquet"
+        pd.DataFrame({"age": [30.0, 40.0, 50.0]}).to_parquet(ref_path)
+
+        exit_code, output = self._check("-r", ref_path, "-p", ref_path, "-f", "height")
+
+        assert exit_code == 2
+        assert "height" in output
+
+    def test_chunk_size_matches_full_load(
+        self, csv_files: tuple[Path, Path], tmp_path: Path
+    ) -> None:
+        """Streaming production data in chunks should give the same report."""
+        ref_path, prod_path = csv_files
+        full_path, chunked_path = tmp_path / "full.json", tmp_path / "chunked.json"
+
+        full_code, _ = self._check("-r", ref_path, "-p", prod_path, "-o", full_path)
+        chunked_code, output = self._check(
+            "-r", ref_path, "-p", prod_path, "--chunk-size", "64", "-o", chunked_path
+        )
+
+        full = json.loads(full_path.read_text())
+        chunked = json.loads(chunked_path.read_text())
+        assert chunked_code == full_code
+        assert "Processed 300 samples" in output
+        assert chunked["production_size"] == full["production_size"] == 300
+        assert [r["feature_name"] for r in chunked["feature_results"]] == [
+            r["feature_name"] for r in full["feature_results"]
+        ]
+        assert [r["score"] for r in chunked["feature_results"]] == pytest.approx(
+            [r["score"] for r in full["feature_results"]]
+        )
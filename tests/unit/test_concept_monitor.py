@@ -90,6 +90,89 @@ class TestConceptMonitorClassification:
         assert "recall" in metric_names
         assert "f1" in metric_names
 
+    @pytest.mark.parametrize(
+        ("y_true", "y_pred"),
+        [
+            ([1, 0, 1, 1, 0, 0, 1, 0], [1, 1, 0, 1, 0, 0, 1, 1]),
+            ([True, False, True, True], [True, True, False, True]),
+            ([1.0, 0.0, 1.0, 1.0], [1.0, 1.0, 0.0, 0.0]),
+            ([0, 1, 2, 1, 0, 2], [0, 2, 2, 1, 1, 0]),  # multi-class
+        ],
+    )
+    def test_fused_metrics_match_single_metrics(
+        self, y_true: list[float], y_pred: list[float]
+    ) -> None:
+        """Shared-counter metrics should equal the per-metric computation."""
+        metrics = ["accuracy", "precision", "recall", "f1"]
+        monitor = ConceptMonitor(task="classification", metrics=metrics)
+        y_true_arr, y_pred_arr = np.asarray(y_true), np.asarray(y_pred)
+
+        fused = monitor._compute_metrics(y_true_arr, y_pred_arr)
+
+        # Label 1 is the positive class, other labels count as neither
+        tp = np.sum((y_pred_arr == 1) & (y_true_arr == 1))
+        fp = np.sum((y_pred_arr == 1) & (y_true_arr == 0))
+        fn = np.sum((y_pred_arr == 0) & (y_true_arr == 1))
+        precision = tp / (tp + fp) if tp + fp else 0.0
+        recall = tp / (tp + fn) if tp + fn else 0.0
+        expected = {
+            "accuracy": np.mean(y_true_arr == y_pred_arr),
+            "precision": precision,
+            "recall": recall,
+            "f1": (
+                2 * precision * recall / (precision + recall)
+                if precision + recall
+                else 0.0
+            ),
+        }
+        for metric in metrics:
+            assert fused[metric] == pytest.approx(expected[metric])
+
+    def test_auc_roc_matches_mann_whitney(self) -> None:
+        """Rank-based AUC should equal the normalized Mann-Whitney U statistic."""
+        from scipy import stats
+
+        rng = np.random.default_rng(42)
+        y_true = rng.integers(0, 2, 300)
+        # Rounded scores create ties
+        y_score = np.round(0.3 * y_true + rng.random(300), 1)
+
+        positives, negatives = y_score[y_true == 1], y_score[y_true == 0]
+        u_stat = stats.mannwhitneyu(positives, negatives, alternative="greater")
+        expected = u_stat.statistic / (len(positives) * len(negatives))
+
+        assert ConceptMonitor._auc_roc(y_true, y_score) == pytest.approx(expected)
+
+    def test_coerce_keeps_scores_and_narrows_labels(self) -> None:
+        """Whole-number labels become int8; scores and strings are untouched."""
+        monitor = ConceptMonitor(task="classification")
+
+        assert monitor._coerce(np.array([0.0, 1.0, 1.0])).dtype == np.int8
+        assert monitor._coerce(np.array([True, False])).dtype == np.int8
+        assert monitor._coerce(np.array([0, 300])).dtype == np.int64
+        scores = monitor._coerce(np.array([0.1, 0.9]))
+        np.testing.assert_array_equal(scores, [0.1, 0.9])
+        assert monitor._coerce(np.array(["a", "b"])).dtype.kind == "U"
+
+    def test_nullable_series_avoid_object_arrays(self) -> None:
+        """Nullable Series become numeric arrays, NumPy Series are not copied."""
+        import pandas as pd
+
+        classifier = ConceptMonitor(task="classification")
+        regressor = ConceptMonitor(task="regression")
+
+        labels = pd.Series([1, 0, 1], dtype="Int64")
+        assert classifier._coerce(labels).dtype == np.int8
+        flags = pd.Series([True, False], dtype="boolean")
+        assert classifier._coerce(flags).dtype == np.int8
+
+        with_na = regressor._coerce(pd.Series([1, None, 3], dtype="Int64"))
+        assert with_na.dtype == np.float64
+        assert np.isnan(with_na[1])
+
+        values = pd.Series([0.5, 1.5, 2.5])
+        assert np.shares_memory(regressor._coerce(values), values.to_numpy())
+
 
 class TestConceptMonitorRegression:
     """Tests for concept drift in regression."""
@@ -160,6 +243,67 @@ class TestConceptMonitorRegression:
 
         assert report.has_drift()
 
+    def test_fused_metrics_match_single_metrics(self) -> None:
+        """Shared-error metrics should equal the per-metric computation."""
+        rng = np.random.default_rng(42)
+        y_true = rng.normal(100, 10, 500)
+        y_pred = y_true + rng.normal(0, 2, 500)
+        metrics = ["mae", "mse", "rmse", "r2"]
+        monitor = ConceptMonitor(task="regression", metrics=metrics)
+
+        fused = monitor._compute_metrics(y_true, y_pred)
+
+        errors = y_true - y_pred
+        mse = np.mean(errors**2)
+        expected = {
+            "mae": np.mean(np.abs(errors)),
+            "mse": mse,
+            "rmse": np.sqrt(mse),
+            "r2": 1 - np.sum(errors**2) / np.sum((y_true - np.mean(y_true)) ** 2),
+        }
+        for metric in metrics:
+            assert fused[metric] == pytest.approx(expected[metric])
+
+    def test_threads_match_sequential(self) -> None:
+        """Large inputs computed on threads should give the same metrics."""
+        rng = np.random.default_rng(42)
+        n = ConceptMonitor.PARALLEL_MIN_SAMPLES
+        y_true = rng.normal(0, 1, n)
+        y_pred = y_true + rng.normal(0, 0.3, n)
+        metrics = ["mae", "rmse", "r2", "mape"]
+
+        expected = ConceptMonitor(task="regression", metrics=metrics).check(
+            y_true, y_pred, y_true, y_pred + 0.1
+        )
+        report = ConceptMonitor(task="regression", metrics=metrics, n_jobs=3).check(
+            y_true, y_pred, y_true, y_pred + 0.1
+        )
+
+        assert [r.score for r in report.feature_results] == pytest.approx(
+            [r.score for r in expected.feature_results]
+        )
+
+    def test_close_shuts_down_pool(self) -> None:
+        """Should shut down the pool and keep checking sequentially."""
+        rng = np.random.default_rng(0)
+        n = ConceptMonitor.PARALLEL_MIN_SAMPLES
+        y_true = rng.normal(0, 1, n)
+        y_pred = y_true + rng.normal(0, 0.3, n)
+        monitor = ConceptMonitor(task="regression", metrics=["mae"], n_jobs=2)
+        pool = monitor._pool
+        assert pool is not None
+
+        expected = monitor.check(y_true, y_pred, y_true, y_pred + 0.1)
+        monitor.close()
+        monitor.close()
+        report = monitor.check(y_true, y_pred, y_true, y_pred + 0.1)
+
+        assert pool._shutdown
+        assert monitor._pool is None
+        assert [r.score for r in report.feature_results] == pytest.approx(
+            [r.score for r in expected.feature_results]
+        )
+
 
 class TestConceptMonitorEdgeCases:
     """Edge case tests."""
@@ -231,3 +375,26 @@ class TestConceptMonitorEdgeCases:
         assert config["task"] == "classification"
         assert "accuracy" in config["metrics"]
         assert config["thresholds"]["accuracy"] == 0.1
+
+    def test_metric_plan_follows_metrics_changes(self) -> None:
+        """Reassigning metrics should rebuild the bound metric functions."""
+        y_true = np.array([1.0, 2.0, 4.0, 5.0])
+        y_pred = np.array([1.5, 2.0, 3.0, 5.5])
+        monitor = ConceptMonitor(task="regression", metrics=["rmse"])
+        assert set(monitor._compute_metrics(y_true, y_pred)) >= {"rmse"}
+
+        monitor.metrics = ["mape"]
+        results = monitor._compute_metrics(y_true, y_pred)
+
+        assert set(results) == {"mape"}
+        assert results["mape"] == pytest.approx(
+            np.mean(np.abs((y_true - y_pred) / y_true))
+        )
+
+    def test_unknown_metric_raises_on_check(self) -> None:
+        """Metrics reassigned to an unknown name should fail when computed."""
+        monitor = ConceptMonitor(task="regression", metrics=["mae"])
+        monitor.metrics = ["bogus"]
+
+        with pytest.raises(ValueError, match="Unknown metric: bogus"):
+            monitor._compute_metrics(np.array([1.0]), np.array([1.0]))
@@ -0,0 +1,109 @@
+"""Tests for the compiled ConceptMonitor kernels and their NumPy fallbacks."""
+
+import numpy as np
+import pytest
+
+from driftwatch.core import _kernels
+
+
+class TestConfusionCounters:
+    """The one-pass counter loop should match the bincount fallback."""
+
+    @pytest.mark.parametrize("dtype", [bool, np.int64, np.float64])
+    def test_loop_matches_numpy(self, dtype: type) -> None:
+        rng = np.random.default_rng(42)
+        y_true = rng.integers(0, 2, 1000).astype(dtype)
+        y_pred = rng.integers(0, 2, 1000).astype(dtype)
+
+        expected = _kernels._confusion_counts_numpy(y_true, y_pred)
+
+        np.testing.assert_array_equal(
+            _kernels._confusion_counts_loop(y_true, y_pred), expected
+        )
+        tn, fp, fn, tp = expected
+        assert _kernels.confusion_counters(y_true, y_pred) == (tp, fp, tn, fn)
+
+    @pytest.mark.parametrize("y_pred", [[0, 1, 2, 1], [0.0, 1.0, 0.5, 1.0]])
+    def test_non_binary_returns_none(self, y_pred: list[float]) -> None:
+        y_true = np.array([0, 1, 1, 0])
+
+        assert _kernels.confusion_counters(y_true, np.array(y_pred)) is None
+        assert _kernels._confusion_counts_loop(y_true, np.array(y_pred))[0] == -1
+
+
+class TestErrorSums:
+    """The one-pass error loop should match the NumPy fallback."""
+
+    def test_loop_matches_numpy(self) -> None:
+        rng = np.random.default_rng(42)
+        y_true = rng.normal(50, 10, 1000)
+        y_pred = y_true + rng.normal(0, 3, 1000)
+
+        expected = _kernels._error_sums_numpy(y_true, y_pred)
+
+        assert _kernels._error_sums_loop(y_true, y_pred) == pytest.approx(expected)
+        assert _kernels.error_sums(y_true, y_pred) == pytest.approx(expected)
+
+    def test_regression_sums_total_sum_of_squares(self) -> None:
+        """One-pass ss_tot should match the two-pass value, even off-center."""
+        rng = np.random.default_rng(42)
+        y_true = rng.normal(1e6, 1.0, 1000)
+        y_pred = y_true + rng.normal(0, 0.5, 1000)
+        expected_ss_tot = float(np.sum((y_true - np.mean(y_true)) ** 2))
+
+        assert _kernels._regression_sums_loop(y_true, y_pred) == pytest.approx(
+            _kernels._regression_sums_numpy(y_true, y_pred)
+        )
+        abs_sum, sq_sum, ss_tot = _kernels.regression_sums(y_true, y_pred)
+        assert (abs_sum, sq_sum) == pytest.approx(
+            _kernels._error_sums_numpy(y_true, y_pred)
+        )
+        assert ss_tot == pytest.approx(expected_ss_tot, rel=1e-9)
+
+
+class TestPositiveClassCounters:
+    """Label-1 counters should match boolean masks for any labels."""
+
+    def test_matches_masks(self) -> None:
+        rng = np.random.default_rng(42)
+        y_true = rng.integers(0, 4, 1000)
+        y_pred = rng.integers(0, 4, 1000)
+
+        expected = (
+            int(np.sum((y_pred == 1) & (y_true == 1))),
+            int(np.sum((y_pred == 1) & (y_true == 0))),
+            int(np.sum((y_pred == 0) & (y_true == 1))),
+        )
+
+        assert _kernels.positive_class_counters(y_true, y_pred) == expected
+
+
+class TestMape:
+    """The one-pass MAPE loop should match the masked NumPy computation."""
+
+    def test_matches_masked_mean(self) -> None:
+        rng = np.random.default_rng(42)
+        y_true = rng.integers(0, 5, 1000).astype(np.float64)
+        y_pred = y_true + rng.normal(0, 0.5, 1000)
+        mask = y_true != 0
+        expected = np.mean(np.abs((y_true[mask] - y_pred[mask]) / y_true[mask]))
+
+        assert _kernels._mape_loop(y_true, y_pred) == pytest.approx(expected)
+        assert _kernels._mape_numpy(y_true, y_pred) == pytest.approx(expected)
+        assert _kernels.mape(y_true, y_pred) == pytest.approx(expected)
+
+    def test_all_zero_true_values(self) -> None:
+        zeros = np.zeros(10)
+
+        assert _kernels.mape(zeros, np.ones(10)) == 0.0
+        assert _kernels._mape_numpy(zeros, np.ones(10)) == 0.0
+
+
+def test_narrow_integer_labels_do_not_overflow() -> None:
+    """int8 inputs (as produced for classification labels) use float math."""
+    y_true = np.array([100, -100, 12], dtype=np.int8)
+    y_pred = np.array([-100, 100, 0], dtype=np.int8)
+    expected = (412.0, 200.0**2 * 2 + 144.0)
+
+    assert _kernels.error_sums(y_true, y_pred) == expected
+    assert _kernels._error_sums_numpy(y_true, y_pred) == expected
@@ -3,8 +3,13 @@
 import numpy as np
 import pandas as pd
 import pytest
+from scipy import stats
 
-from driftwatch.detectors.categorical import ChiSquaredDetector, FrequencyPSIDetector
+from driftwatch.detectors.categorical import (
+    ChiSquaredDetector,
+    FrequencyPSIDetector,
+    _align_counts,
+)
 
 
 class TestChiSquaredDetector:
@@ -60,6 +65,17 @@ class TestChiSquaredDetector:
         # Should complete without error
         assert result.method == "chi_squared"
 
+    def test_statistic_matches_scipy(self, detector: ChiSquaredDetector) -> None:
+        """Statistic and p-value should match scipy.stats.chisquare."""
+        reference = pd.Series(["A"] * 50 + ["B"] * 30 + ["C"] * 20)
+        production = pd.Series(["A"] * 40 + ["B"] * 35 + ["C"] * 25)
+
+        result = detector.fit(reference).detect_fitted(production)
+        expected = stats.chisquare([40, 35, 25], f_exp=[50, 30, 20])
+
+        assert result.score == pytest.approx(expected.statistic)
+        assert result.p_value == pytest.approx(expected.pvalue)
+
     def test_missing_category_in_production(self, detector: ChiSquaredDetector) -> None:
         """Should handle categories missing in production."""
         reference = pd.Series(["A", "B", "C"] * 100)
@@ -69,6 +85,97 @@ class TestChiSquaredDetector:
 
         assert result.method == "chi_squared"
 
+    @pytest.mark.parametrize("dtype", ["object", "category"])
+    def test_detect_fitted_matches_detect(
+        self, detector: ChiSquaredDetector, dtype: str
+    ) -> None:
+        """Fitted detection should match detect(), including unseen categories."""
+        rng = np.random.default_rng(42)
+        categories = ["A", "B", "C", "D"]
+        reference = pd.Series(
+            rng.choice(categories[:3], 500, p=[0.6, 0.3, 0.1]), dtype=dtype
+        )
+        production = pd.Series(
+            rng.choice(categories, 300, p=[0.4, 0.3, 0.2, 0.1]), dtype=dtype
+        )
+
+        expected = detector.detect(reference, production)
+        result = detector.fit(reference).detect_fitted(production)
+
+        assert result.score == pytest.approx(expected.score)
+        assert result.p_value == pytest.approx(expected.p_value)
+
+    def test_detect_fitted_on_array_with_missing_values(
+        self, detector: ChiSquaredDetector
+    ) -> None:
+        """Arrays should be counted like Series, ignoring missing values."""
+        reference = pd.Series(["A", "B", "C"] * 100)
+        production = np.array(["A", None, "B", "D", "A", np.nan] * 50, dtype=object)
+
+        expected = detector.detect(reference, pd.Series(production))
+        result = detector.fit(reference).detect_fitted(production)
+
+        assert result.score == pytest.approx(expected.score)
+        assert result.p_value == pytest.approx(expected.p_value)
+
+    def test_accumulator_matches_detect_fitted(
+        self, detector: ChiSquaredDetector
+    ) -> None:
+        """Chunked counts should match a single pass, including unseen categories."""
+        reference = pd.Series(["A", "B", "C"] * 100)
+        production = pd.Series(["A", "B", "B", None] * 50 + ["D", "E"] * 20)
+        detector.fit(reference)
+
+        accumulator = detector.accumulator()
+        for start in range(0, len(production), 70):
+            accumulator.update(production.iloc[start : start + 70])
+        result = accumulator.result()
+        expected = detector.detect_fitted(production)
+
+        assert result.score == pytest.approx(expected.score)
+        assert result.p_value == pytest.approx(expected.p_value)
+
+    def test_categorical_dtype_matches_object(
+        self, detector: ChiSquaredDetector
+    ) -> None:
+        """Unobserved categories of a categorical dtype should not add bins."""
+        reference = pd.Series(["A", "B", "A", "C"] * 50)
+        production = pd.Series(["A", "B", "B", "D"] * 50)
+        categories = ["A", "B", "C", "D", "E"]
+
+        expected = detector.detect(reference, production)
+        result = detector.detect(
+            reference.astype(pd.CategoricalDtype(categories)),
+            production.astype(pd.CategoricalDtype(categories)),
+        )
+
+        assert result.score == pytest.approx(expected.score)
+        assert result.p_value == pytest.approx(expected.p_value)
+
+    def test_align_counts_appends_unseen_categories(self) -> None:
+        """Reference categories keep their order, new ones follow with 0."""
+        ref_counts = pd.Series([5, 3, 2], index=["b", "a", "c"])
+        prod_counts = pd.Series([4, 1, 6], index=["d", "a", "e"])
+
+        ref_freq, prod_freq = _align_counts(ref_counts, prod_counts)
+
+        np.testing.assert_array_equal(ref_freq, [5, 3, 2, 0, 0])
+        np.testing.assert_array_equal(prod_freq, [0, 1, 0, 4, 6])
+
+    def test_detect_fitted_on_categorical_codes(
+        self, detector: ChiSquaredDetector
+    ) -> None:
+        """Categorical production should be counted like the same objects."""
+        reference = pd.Series(["A", "B", "A", "C", None] * 50)
+        production = pd.Series(["B", "A", "D", None, "E"] * 40)
+        detector.fit(reference)
+
+        expected = detector.detect_fitted(production)
+        result = detector.detect_fitted(production.astype("category"))
+
+        assert result.score == expected.score
+        assert result.p_value == expected.p_value
+
 
 class TestFrequencyPSIDetector:
     """Tests for Frequency PSI detector."""
@@ -114,3 +221,47 @@ class TestFrequencyPSIDetector:
 
         # Small shift should have small PSI
         assert result.score < 0.1
+
+    @pytest.mark.parametrize("dtype", ["object", "category"])
+    def test_detect_fitted_matches_detect(
+        self, detector: FrequencyPSIDetector, dtype: str
+    ) -> None:
+        """Fitted detection should match detect(), including unseen categories."""
+        rng = np.random.default_rng(42)
+        categories = ["A", "B", "C", "D"]
+        reference = pd.Series(
+            rng.choice(categories[:3], 500, p=[0.6, 0.3, 0.1]), dtype=dtype
+        )
+        production = pd.Series(
+            rng.choice(categories, 300, p=[0.4, 0.3, 0.2, 0.1]), dtype=dtype
+        )
+
+        expected = detector.detect(reference, production)
+        result = detector.fit(reference).detect_fitted(production)
+
+        assert result.score == pytest.approx(expected.score)
+
+    def test_detect_fitted_on_array_with_missing_values(
+        self, detector: FrequencyPSIDetector
+    ) -> None:
+        """Proportions should ignore missing values, like value_counts()."""
+        reference = pd.Series(["A", "B", "C"] * 100)
+        production = np.array(["A", None, "B", "D", "A", np.nan] * 50, dtype=object)
+
+        expected = detector.detect(reference, pd.Series(production))
+        result = detector.fit(reference).detect_fitted(production)
+
+        assert result.score == pytest.approx(expected.score)
+
+    def test_score_with_unseen_categories(self, detector: FrequencyPSIDetector) -> None:
+        """Categories missing from one side should count with a tiny share."""
+        reference = pd.Series(["A", "A", "B", "B"])
+        production = pd.Series(["A", "C", "C", "C"])
+        ref_pct = np.array([0.5, 0.5, 1e-10])
+        prod_pct = np.array([0.25, 1e-10, 0.75])
+
+        result = detector.detect(reference, production)
+
+        assert result.score == pytest.approx(
+            np.sum((prod_pct - ref_pct) * np.log(prod_pct / ref_pct))
+        )
@@ -0,0 +1,139 @@
+"""Tests for the compiled detector kernels and their NumPy fallbacks."""
+
+import numpy as np
+import pytest
+
+from driftwatch.detectors import _kernels
+
+
+@pytest.fixture
+def samples() -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(42)
+    reference = np.sort(rng.normal(0, 1, 2000))
+    # Rounded values create ties, which the KS merge walk must handle
+    production = np.sort(np.round(rng.normal(0.2, 1.3, 1500), 1))
+    return reference, production
+
+
+def _psi_bins(reference: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    edges = np.unique(np.percentile(reference, np.linspace(0, 100, 11)))
+    counts = np.histogram(reference, bins=edges)[0]
+    return edges, np.clip(counts / len(reference), _kernels.PSI_EPS, 1)
+
+
+class TestPSIKernel:
+    """The PSI loop should bucket exactly like np.histogram."""
+
+    def test_loop_matches_numpy(self, samples: tuple[np.ndarray, np.ndarray]) -> None:
+        reference, production = samples
+        edges, ref_pct = _psi_bins(reference)
+
+        expected = _kernels._psi_from_bins_numpy(edges, ref_pct, production)
+
+        assert _kernels._psi_from_bins_loop(edges, ref_pct, production) == (
+            pytest.approx(expected)
+        )
+        assert _kernels.psi_from_bins(edges, ref_pct, production) == (
+            pytest.approx(expected)
+        )
+
+    def test_edges_and_out_of_range_values(self) -> None:
+        edges = np.array([0.0, 1.0, 2.0])
+        ref_pct = np.array([0.5, 0.5])
+        # Upper edge belongs to the last bucket, -1 and 3 are dropped
+        production = np.array([-1.0, 0.0, 1.0, 2.0, 2.0, 3.0])
+
+        expected = _kernels._psi_from_bins_numpy(edges, ref_pct, production)
+
+        assert _kernels._psi_from_bins_loop(edges, ref_pct, production) == (
+            pytest.approx(expected)
+        )
+
+    def test_bucket_counts_match_histogram(self) -> None:
+        edges = np.array([0.0, 1.0, 2.0])
+        values = np.array([-1.0, 0.0, 0.5, np.nan, 1.0, 2.0, 2.0, 3.0])
+
+        expected = np.histogram(values, bins=edges)[0]
+
+        np.testing.assert_array_equal(
+            _kernels._bucket_counts_loop(edges, values), expected
+        )
+        np.testing.assert_array_equal(_kernels.bucket_counts(edges, values), expected)
+
+    def test_many_buckets_match_histogram(
+        self, samples: tuple[np.ndarray, np.ndarray]
+    ) -> None:
+        reference, production = samples
+        edges = np.unique(np.percentile(reference, np.linspace(0, 100, 101)))
+
+        np.testing.assert_array_equal(
+            _kernels.bucket_counts(edges, production),
+            np.histogram(production, bins=edges)[0],
+        )
+
+    def test_float32_values_match_float64(
+        self, samples: tuple[np.ndarray, np.ndarray]
+    ) -> None:
+        reference, production = samples
+        edges, ref_pct = _psi_bins(reference)
+        narrow = production.astype(np.float32)
+        wide = narrow.astype(np.float64)
+
+        np.testing.assert_array_equal(
+            _kernels.bucket_counts(edges, narrow), _kernels.bucket_counts(edges, wide)
+        )
+        assert _kernels.psi_from_bins(edges, ref_pct, narrow) == (
+            _kernels.psi_from_bins(edges, ref_pct, wide)
+        )
+
+
+class TestKSKernel:
+    """The KS merge walk should match the searchsorted formulation."""
+
+    def test_loop_matches_numpy(self, samples: tuple[np.ndarray, np.ndarray]) -> None:
+        reference, production = samples
+
+        expected = _kernels._ks_statistic_numpy(reference, production)
+
+        assert _kernels._ks_statistic_loop(reference, production) == (
+            pytest.approx(expected)
+        )
+        assert _kernels.ks_statistic(reference, production) == pytest.approx(expected)
+
+    def test_float32_values_match_float64(
+        self, samples: tuple[np.ndarray, np.ndarray]
+    ) -> None:
+        reference, production = (s.astype(np.float32) for s in samples)
+
+        assert _kernels.ks_statistic(reference, production) == (
+            _kernels.ks_statistic(reference.astype(np.float64), production)
+        )
+
+
+class TestWassersteinKernel:
+    """The Wasserstein merge walk should match scipy."""
+
+    def test_loop_matches_numpy(self, samples: tuple[np.ndarray, np.ndarray]) -> None:
+        reference, production = samples
+
+        expected = _kernels._wasserstein_numpy(reference, production)
+
+        assert _kernels._wasserstein_loop(reference, production) == (
+            pytest.approx(expected)
+        )
+        assert _kernels.wasserstein(reference, production) == pytest.approx(expected)
+
+    def test_float32_values_match_float64(
+        self, samples: tuple[np.ndarray, np.ndarray]
+    ) -> None:
+        reference, production = (s.astype(np.float32) for s in samples)
+
+        assert _kernels.wasserstein(reference, production) == _kernels.wasserstein(
+            reference.astype(np.float64), production.astype(np.float64)
+        )
+
+    def test_single_values(self) -> None:
+        reference = np.array([1.0])
+        production = np.array([1.0, 3.0])
+
+        assert _kernels._wasserstein_loop(reference, production) == pytest.approx(1.0)
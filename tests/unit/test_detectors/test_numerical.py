@@ -3,7 +3,9 @@
 import numpy as np
 import pandas as pd
 import pytest
+from scipy import stats
 
+from driftwatch.detectors.base import StreamAccumulator
 from driftwatch.detectors.numerical import KSDetector, PSIDetector, WassersteinDetector
 
 
@@ -47,6 +49,111 @@ class TestKSDetector:
         with pytest.raises(ValueError, match="Production series cannot be empty"):
             detector.detect(pd.Series([1, 2, 3]), pd.Series(dtype=float))
 
+    @pytest.mark.parametrize("size", [1000, 20000])
+    def test_detect_fitted_matches_detect(
+        self, detector: KSDetector, size: int
+    ) -> None:
+        """detect() and fitted detection should match scipy in both modes."""
+        rng = np.random.default_rng(42)
+        reference = pd.Series(rng.normal(0, 1, size))
+        production = pd.Series(rng.normal(0.03, 1, size // 2))
+
+        expected = stats.ks_2samp(reference, production)
+        unfitted = detector.detect(reference, production)
+        result = detector.fit(reference).detect_fitted(production)
+
+        for r in (unfitted, result):
+            assert r.score == pytest.approx(expected.statistic)
+            assert r.p_value == pytest.approx(expected.pvalue)
+
+    def test_asymptotic_method_matches_scipy(self) -> None:
+        """method="asymp" should use scipy's asymptotic p-value on small samples."""
+        rng = np.random.default_rng(42)
+        reference = pd.Series(rng.normal(0, 1, 1000))
+        production = pd.Series(rng.normal(0.1, 1, 700))
+        detector = KSDetector(method="asymp")
+
+        expected = stats.ks_2samp(reference, production, method="asymp")
+        result = detector.fit(reference).detect_fitted(production)
+
+        assert result.score == pytest.approx(expected.statistic)
+        assert result.p_value == pytest.approx(expected.pvalue)
+        assert detector.detect(reference, production).p_value == pytest.approx(
+            expected.pvalue
+        )
+
+    def test_unknown_method_raises(self) -> None:
+        """Should raise ValueError for an unknown p-value method."""
+        with pytest.raises(ValueError, match="Unknown KS method"):
+            KSDetector(method="fast")
+
+    def test_accumulator_keeps_bounded_sample(self, detector: KSDetector) -> None:
+        """The default accumulator is exact below its sample size, bounded above."""
+        rng = np.random.default_rng(42)
+        reference = pd.Series(rng.normal(0, 1, 1000))
+        production = rng.normal(0.5, 1, 3000)
+        detector.fit(reference)
+
+        exact = detector.accumulator()
+        exact.update(production[:1000])
+        exact.update(production[1000:])
+        expected = detector.detect_fitted(production)
+        assert exact.result().score == pytest.approx(expected.score)
+
+        sampled = StreamAccumulator(detector, sample_size=500)
+        for chunk in np.array_split(production, 7):
+            sampled.update(chunk)
+        assert sampled.n_seen == 3000
+        assert sampled._sample is not None
+        assert len(sampled._sample) == 500
+        assert np.isin(sampled._sample, production).all()
+        assert sampled.result().has_drift
+
+    def test_detect_batch_matches_detect_fitted(self) -> None:
+        """Batched KS should match per-column KS in exact and asymptotic modes."""
+        rng = np.random.default_rng(42)
+        detectors = [
+            KSDetector().fit(pd.Series(rng.normal(0, 1, 20000))),
+            KSDetector().fit(pd.Series(rng.normal(0, 1, 500))),
+            KSDetector(method="asymp").fit(pd.Series(rng.exponential(2, 800))),
+            KSDetector().fit(pd.Series(rng.normal(0, 1, 15000))),
+        ]
+        productions = [
+            pd.Series(np.append(rng.normal(0.02, 1, 12000), np.nan)),
+            rng.normal(0.1, 1, 300),
+            pd.Series(rng.exponential(2.2, 600)),
+            rng.normal(0.5, 1, 11000),
+        ]
+
+        results = KSDetector.detect_batch(detectors, productions)
+
+        for detector, production, result in zip(detectors, productions, results):
+            expected = detector.detect_fitted(production)
+            assert result.score == pytest.approx(expected.score)
+            assert result.p_value == pytest.approx(expected.p_value)
+
+    @pytest.mark.parametrize("shift", [0.0, 0.05, 3.0])
+    def test_accumulator_counts_match_detect_fitted(
+        self, detector: KSDetector, shift: float
+    ) -> None:
+        """Large streams should get the exact statistic from rank counts."""
+        rng = np.random.default_rng(42)
+        # Rounded values create ties between and within both samples
+        reference = pd.Series(np.round(rng.normal(0, 1, 2000), 1))
+        production = np.round(rng.normal(shift, 1.2, 30000), 2)
+        production[::97] = np.nan
+        detector.fit(reference)
+
+        accumulator = detector.accumulator()
+        for chunk in np.array_split(production, 9):
+            accumulator.update(chunk)
+        result = accumulator.result()
+        expected = detector.detect_fitted(production)
+
+        assert result.score == pytest.approx(expected.score)
+        assert result.p_value == pytest.approx(expected.p_value)
+        assert result.has_drift == expected.has_drift
+
 
 class TestPSIDetector:
     """Tests for Population Stability Index detector."""
@@ -86,6 +193,81 @@ class TestPSIDetector:
         result_small = detector.detect(reference, small_shift)
         assert result_small.score < 0.1, "Small shift should have PSI < 0.1"
 
+    def test_detect_fitted_matches_detect(self, detector: PSIDetector) -> None:
+        """Fitted detection should reuse reference buckets with the same result."""
+        rng = np.random.default_rng(42)
+        reference = pd.Series(rng.normal(0, 1, 1000))
+        production = pd.Series(rng.normal(0.5, 1.5, 800))
+
+        expected = detector.detect(reference, production)
+        result = detector.fit(reference).detect_fitted(production)
+
+        assert result.score == expected.score
+
+    def test_detect_fitted_accepts_ndarray(self, detector: PSIDetector) -> None:
+        """Should accept a raw array with NaNs like a Series."""
+        rng = np.random.default_rng(42)
+        reference = pd.Series(rng.normal(0, 1, 1000))
+        production = rng.normal(0.5, 1.5, 800)
+        production[::10] = np.nan
+
+        detector.fit(reference)
+
+        assert (
+            detector.detect_fitted(production).score
+            == detector.detect_fitted(pd.Series(production)).score
+        )
+
+    @pytest.mark.parametrize(
+        "reference",
+        [
+            np.random.default_rng(0).normal(0, 1, 1001),
+            np.random.default_rng(1).integers(0, 5, 700),  # tied quantiles
+            np.round(np.random.default_rng(2).exponential(1, 500), 1),
+        ],
+    )
+    def test_reference_bins_match_percentile_and_histogram(
+        self, reference: np.ndarray
+    ) -> None:
+        """Bins from the sorted reference should equal the NumPy recipe."""
+        detector = PSIDetector(buckets=10)
+        breakpoints = np.unique(np.percentile(reference, np.linspace(0, 100, 11)))
+        counts = np.histogram(reference, bins=breakpoints)[0]
+
+        edges, ref_pct = detector._reference_bins(reference)
+
+        np.testing.assert_array_equal(edges, breakpoints)
+        np.testing.assert_array_equal(
+            ref_pct, np.clip(counts / len(reference), 1e-10, 1)
+        )
+
+    def test_detect_fitted_requires_fit(self, detector: PSIDetector) -> None:
+        """Should raise RuntimeError when used before fit()."""
+        with pytest.raises(RuntimeError, match="not fitted"):
+            detector.detect_fitted(pd.Series([1.0, 2.0]))
+
+    def test_detect_batch_matches_detect_fitted(self) -> None:
+        """Batched PSI should match per-column PSI, including edge cases."""
+        rng = np.random.default_rng(42)
+        references = [
+            pd.Series(rng.normal(0, 1, 1000)),
+            pd.Series(rng.exponential(2, 500)),
+            pd.Series(np.full(100, 3.0)),  # a single edge, PSI is 0
+        ]
+        productions = [
+            pd.Series(np.append(rng.normal(0.5, 1.5, 800), [np.nan, 50.0, -50.0])),
+            rng.exponential(2, 300),
+            pd.Series(np.full(50, 4.0)),
+        ]
+        detectors = [PSIDetector().fit(reference) for reference in references]
+
+        results = PSIDetector.detect_batch(detectors, productions)
+
+        for detector, production, result in zip(detectors, productions, results):
+            expected = detector.detect_fitted(production)
+            assert result.score == pytest.approx(expected.score)
+            assert result.has_drift == expected.has_drift
+
 
 class TestWassersteinDetector:
     """Tests for Wasserstein distance detector."""
@@ -112,3 +294,39 @@ class TestWassersteinDetector:
         result = detector.detect(reference, production)
 
         assert result.has_drift
+
+    def test_detect_fitted_matches_detect(self, detector: WassersteinDetector) -> None:
+        """Fitted detection should reuse the reference std with the same result."""
+        rng = np.random.default_rng(42)
+        reference = pd.Series(rng.normal(0, 2, 1000))
+        production = pd.Series(rng.normal(1, 2, 500))
+
+        expected = detector.detect(reference, production)
+        result = detector.fit(reference).detect_fitted(production)
+
+        assert result.score == pytest.approx(expected.score)
+        assert expected.score == pytest.approx(
+            stats.wasserstein_distance(reference, production) / np.std(reference)
+        )
+
+
+class TestSortedSamples:
+    """Samples are sorted with the fastest NumPy sort for their dtype."""
+
+    @pytest.mark.parametrize(
+        "detector_cls", [KSDetector, PSIDetector, WassersteinDetector]
+    )
+    def test_one_byte_integers_match_int64(
+        self,
+        detector_cls: type[KSDetector | PSIDetector | WassersteinDetector],
+    ) -> None:
+        """Radix-sorted uint8 samples should give the int64 results."""
+        rng = np.random.default_rng(42)
+        reference = pd.Series(rng.integers(0, 100, 1000), dtype=np.uint8)
+        production = pd.Series(rng.integers(10, 120, 800), dtype=np.uint8)
+
+        expected = detector_cls().detect(reference.astype(np.int64), production)
+        fitted = detector_cls().fit(reference)
+
+        assert detector_cls().detect(reference, production).score == expected.score
+        assert fitted.detect_fitted(production).score == pytest.approx(expected.score)
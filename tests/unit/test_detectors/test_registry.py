@@ -5,7 +5,11 @@ import pytest
 
 from driftwatch.detectors.categorical import ChiSquaredDetector
 from driftwatch.detectors.numerical import KSDetector, PSIDetector, WassersteinDetector
-from driftwatch.detectors.registry import get_detector, get_detector_by_name
+from driftwatch.detectors.registry import (
+    get_detector,
+    get_detector_by_name,
+    get_detector_factory,
+)
 
 
 class TestGetDetector:
@@ -45,6 +49,16 @@ class TestGetDetector:
 
         assert isinstance(detector, ChiSquaredDetector)
 
+    def test_factory_creates_separate_detectors(self) -> None:
+        """The factory should create a new detector on every call."""
+        factory = get_detector_factory(np.dtype("float64"), {"psi": 0.3})
+
+        first, second = factory(), factory()
+
+        assert isinstance(first, PSIDetector)
+        assert first is not second
+        assert first.threshold == second.threshold == 0.3
+
     def test_default_thresholds(self) -> None:
         """Should use default thresholds when not specified."""
         detector = get_detector(np.dtype("float64"), {})
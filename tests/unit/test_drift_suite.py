@@ -175,6 +175,63 @@ class TestDriftSuiteFullCheck:
         assert report.concept_report is not None
         assert report.status in [DriftStatus.WARNING, DriftStatus.CRITICAL]
 
+    def test_concurrent_checks_match_sequential(
+        self,
+        reference_data: pd.DataFrame,
+        production_data_drift: pd.DataFrame,
+    ) -> None:
+        """Running the drift types on threads should not change the report."""
+        np.random.seed(42)
+        ref_preds = np.random.normal(0.5, 0.1, 1000)
+        prod_preds = np.random.normal(0.8, 0.1, 500)
+        y_true = np.random.randint(0, 2, 500)
+        y_pred_prod = np.random.randint(0, 2, 500)
+        kwargs = {
+            "production_data": production_data_drift,
+            "production_predictions": prod_preds,
+            "y_true_ref": y_true,
+            "y_pred_ref": y_true,
+            "y_true_prod": y_true,
+            "y_pred_prod": y_pred_prod,
+        }
+
+        sequential = DriftSuite(reference_data, reference_predictions=ref_preds)
+        threaded = DriftSuite(reference_data, reference_predictions=ref_preds, n_jobs=2)
+        expected = sequential.check(**kwargs).to_dict()
+        report = threaded.check(**kwargs).to_dict()
+        pools = [
+            threaded._pool,
+            threaded.feature_monitor._pool,
+            threaded.concept_monitor._pool,
+        ]
+        threaded.close()
+
+        for key in ("feature_drift", "prediction_drift", "concept_drift"):
+            assert report[key]["feature_results"] == expected[key]["feature_results"]
+        assert all(pool is not None and pool._shutdown for pool in pools)
+        assert threaded._pool is None
+        assert threaded.feature_monitor._pool is None
+        assert threaded.concept_monitor._pool is None
+
+    def test_n_jobs_matches_sequential(
+        self,
+        reference_data: pd.DataFrame,
+        production_data_drift: pd.DataFrame,
+    ) -> None:
+        """Threaded monitors should produce the same feature report."""
+        sequential = DriftSuite(reference_data=reference_data)
+        threaded = DriftSuite(reference_data=reference_data, n_jobs=2)
+
+        expected = sequential.check(production_data=production_data_drift)
+        report = threaded.check(production_data=production_data_drift)
+
+        assert threaded.feature_monitor._pool is not None
+        assert report.feature_report is not None
+        assert expected.feature_report is not None
+        assert [r.score for r in report.feature_report.feature_results] == [
+            r.score for r in expected.feature_report.feature_results
+        ]
+
 
 class TestComprehensiveDriftReport:
     """Test comprehensive report features."""
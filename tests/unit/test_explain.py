@@ -312,3 +312,36 @@ class TestDriftVisualizer:
 
         with pytest.raises(ValueError, match="not found"):
             viz.plot_feature("nonexistent")
+
+    @pytest.mark.skipif(
+        not _matplotlib_available(),
+        reason="matplotlib not installed",
+    )
+    def test_plot_feature_bar_heights(
+        self,
+        reference_data: pd.DataFrame,
+        production_data_with_drift: pd.DataFrame,
+    ) -> None:
+        """Bars should be the density histogram on shared edges, when redrawn too."""
+        monitor = Monitor(reference_data=reference_data)
+        report = monitor.check(production_data_with_drift)
+        viz = DriftVisualizer(reference_data, production_data_with_drift, report)
+
+        import matplotlib.pyplot as plt
+
+        ref = reference_data["age"].dropna()
+        prod = production_data_with_drift["age"].dropna()
+        edges = np.histogram_bin_edges(np.concatenate([ref, prod]), bins=20)
+        expected = np.concatenate(
+            [
+                np.histogram(ref, bins=edges, density=True)[0],
+                np.histogram(prod, bins=edges, density=True)[0],
+            ]
+        )
+
+        plt.close(viz.plot_all(bins=20))
+        fig = viz.plot_feature("age", bins=20)
+        heights = [patch.get_height() for patch in fig.axes[0].patches]
+        plt.close(fig)
+
+        np.testing.assert_allclose(heights, expected)
@@ -1,5 +1,6 @@
 """Tests for the Monitor class."""
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -110,6 +111,25 @@ class TestMonitor:
 
         assert "income" not in monitor.monitored_features
 
+    def test_check_after_changing_features(
+        self, sample_numerical_df: pd.DataFrame
+    ) -> None:
+        """Checks should follow features added or removed after a check."""
+        monitor = Monitor(
+            reference_data=sample_numerical_df,
+            features=["age", "income"],
+        )
+        monitor.check(sample_numerical_df)
+
+        monitor.add_feature("score")
+        monitor.remove_feature("age")
+        report = monitor.check(sample_numerical_df)
+
+        assert [r.feature_name for r in report.feature_results] == [
+            "income",
+            "score",
+        ]
+
     def test_custom_thresholds(self, sample_numerical_df: pd.DataFrame) -> None:
         """Should use custom thresholds."""
         monitor = Monitor(
@@ -119,3 +139,231 @@ class TestMonitor:
 
         assert monitor.thresholds["psi"] == 0.1
         assert monitor.thresholds["ks_pvalue"] == 0.05  # Default preserved
+
+    def test_thresholds_are_read_only(self, sample_numerical_df: pd.DataFrame) -> None:
+        """Default thresholds should be shared and neither should be mutable."""
+        default = Monitor(reference_data=sample_numerical_df)
+        custom = Monitor(reference_data=sample_numerical_df, thresholds={"psi": 0.1})
+
+        assert default.thresholds is Monitor.DEFAULT_THRESHOLDS
+        for monitor in (default, custom):
+            with pytest.raises(TypeError):
+                monitor.thresholds["psi"] = 0.5  # type: ignore[index]
+        assert Monitor.DEFAULT_THRESHOLDS["psi"] == 0.2
+
+    def test_set_thresholds_matches_new_monitor(
+        self,
+        sample_numerical_df: pd.DataFrame,
+        drifted_numerical_df: pd.DataFrame,
+    ) -> None:
+        """Changed thresholds should apply without refitting the reference."""
+        monitor = Monitor(reference_data=sample_numerical_df)
+        detector = monitor._detectors["age"]
+        expected = Monitor(
+            reference_data=sample_numerical_df, thresholds={"psi": 5.0}
+        ).check(drifted_numerical_df)
+
+        monitor.set_thresholds({"psi": 5.0})
+        report = monitor.check(drifted_numerical_df)
+
+        assert monitor._detectors["age"] is detector
+        assert monitor.thresholds["psi"] == 5.0
+        assert monitor.thresholds["ks_pvalue"] == 0.05
+        results = report.to_dict()["feature_results"]
+        assert results == expected.to_dict()["feature_results"]
+
+    def test_from_arrays_matches_dataframe(
+        self,
+        sample_numerical_df: pd.DataFrame,
+        drifted_numerical_df: pd.DataFrame,
+    ) -> None:
+        """Should produce the same report as the DataFrame constructor."""
+        features = list(sample_numerical_df.columns)
+        from_df = Monitor(reference_data=sample_numerical_df)
+        from_arrays = Monitor.from_arrays(features, sample_numerical_df.to_numpy())
+
+        expected = from_df.check(drifted_numerical_df)
+        report = from_arrays.check(drifted_numerical_df)
+
+        assert from_arrays.monitored_features == features
+        assert [r.score for r in report.feature_results] == [
+            r.score for r in expected.feature_results
+        ]
+
+    def test_from_arrays_copies_reference(self) -> None:
+        """Should keep a read-only copy of the reference matrix."""
+        reference = np.random.default_rng(0).normal(size=(100, 2))
+        monitor = Monitor.from_arrays(["a", "b"], reference)
+
+        reference[:] = 0.0
+
+        assert monitor.reference_data["a"].std() > 0
+        assert not monitor.reference_data["a"].to_numpy().flags.writeable
+
+    def test_from_arrays_shape_mismatch_raises(self) -> None:
+        """Should raise ValueError when names do not match the columns."""
+        with pytest.raises(ValueError, match="does not match 3 feature names"):
+            Monitor.from_arrays(["a", "b", "c"], np.zeros((10, 2)))
+
+    def test_check_with_threads_matches_sequential(
+        self,
+        sample_numerical_df: pd.DataFrame,
+        drifted_numerical_df: pd.DataFrame,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Should give the same report, in feature order, when using threads."""
+        monkeypatch.setattr(Monitor, "PARALLEL_MIN_FEATURES", 1)
+        sequential = Monitor(reference_data=sample_numerical_df)
+        threaded = Monitor(reference_data=sample_numerical_df, n_jobs=3)
+
+        expected = sequential.check(drifted_numerical_df)
+        report = threaded.check(drifted_numerical_df)
+
+        assert [r.feature_name for r in report.feature_results] == [
+            r.feature_name for r in expected.feature_results
+        ]
+        assert [r.score for r in report.feature_results] == [
+            r.score for r in expected.feature_results
+        ]
+
+    @pytest.mark.parametrize(("n_jobs", "expected"), [(-1, 3), (-3, 2), (-8, 1)])
+    def test_negative_n_jobs_counts_from_cpus(
+        self,
+        sample_numerical_df: pd.DataFrame,
+        monkeypatch: pytest.MonkeyPatch,
+        n_jobs: int,
+        expected: int,
+    ) -> None:
+        """Negative n_jobs should count back from the CPUs, capped by features."""
+        monkeypatch.setattr("os.cpu_count", lambda: 4)
+        monitor = Monitor(reference_data=sample_numerical_df, n_jobs=n_jobs)
+
+        assert monitor._n_workers == expected
+        monitor.close()
+
+    def test_close_falls_back_to_sequential(
+        self,
+        sample_numerical_df: pd.DataFrame,
+        drifted_numerical_df: pd.DataFrame,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Should keep checking without threads once the pool is closed."""
+        monkeypatch.setattr(Monitor, "PARALLEL_MIN_FEATURES", 1)
+        monitor = Monitor(reference_data=sample_numerical_df, n_jobs=2)
+
+        expected = monitor.check(drifted_numerical_df)
+        monitor.close()
+        monitor.close()
+        report = monitor.check(drifted_numerical_df)
+
+        assert [r.score for r in report.feature_results] == [
+            r.score for r in expected.feature_results
+        ]
+
+    def test_check_arrays_matches_check(
+        self,
+        sample_numerical_df: pd.DataFrame,
+        drifted_numerical_df: pd.DataFrame,
+    ) -> None:
+        """Should match check() and map columns by name, not position."""
+        monitor = Monitor(reference_data=sample_numerical_df, features=["age", "score"])
+        names = ["score", "income", "age"]
+
+        expected = monitor.check(drifted_numerical_df)
+        report = monitor.check_arrays(drifted_numerical_df[names].to_numpy(), names)
+
+        assert report.production_size == len(drifted_numerical_df)
+        assert [r.feature_name for r in report.feature_results] == ["age", "score"]
+        assert [r.score for r in report.feature_results] == [
+            r.score for r in expected.feature_results
+        ]
+
+    def test_check_arrays_missing_features_raises(
+        self, sample_numerical_df: pd.DataFrame
+    ) -> None:
+        """Should raise ValueError when a monitored feature has no column."""
+        monitor = Monitor(reference_data=sample_numerical_df)
+
+        with pytest.raises(ValueError, match="Missing features"):
+            monitor.check_arrays(np.ones((10, 2)), ["age", "income"])
+
+    def test_check_matches_detectors_on_series(
+        self, sample_numerical_df: pd.DataFrame
+    ) -> None:
+        """Columns handed over as arrays should score like the original Series."""
+        production = sample_numerical_df.copy()
+        production["age"] = production["age"].round().astype("Int64")
+        production["score"] = production["score"].round().astype(np.int64)
+        production.loc[::7, "income"] = np.nan
+        monitor = Monitor(reference_data=sample_numerical_df)
+
+        report = monitor.check(production)
+
+        for result in report.feature_results:
+            detector = monitor._detectors[result.feature_name]
+            expected = detector.detect(
+                sample_numerical_df[result.feature_name],
+                production[result.feature_name],
+            )
+            assert result.score == pytest.approx(expected.score)
+
+    def test_reassigning_reference_refits_detectors(
+        self,
+        sample_numerical_df: pd.DataFrame,
+        drifted_numerical_df: pd.DataFrame,
+    ) -> None:
+        """Should compare against the new reference after reassignment."""
+        monitor = Monitor(reference_data=sample_numerical_df)
+
+        monitor.reference_data = drifted_numerical_df
+        report = monitor.check(drifted_numerical_df)
+
+        assert not report.has_drift()
+        assert report.reference_size == len(drifted_numerical_df)
+
+    @pytest.mark.parametrize(
+        ("reference", "production"),
+        [
+            ("sample_numerical_df", "drifted_numerical_df"),
+            ("sample_categorical_df", "drifted_categorical_df"),
+        ],
+    )
+    def test_update_finalize_matches_check(
+        self,
+        reference: str,
+        production: str,
+        request: pytest.FixtureRequest,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Chunked checks should give the same report as a single check."""
+        monkeypatch.setattr(Monitor, "PARALLEL_MIN_FEATURES", 1)
+        ref_df = request.getfixturevalue(reference)
+        prod_df = request.getfixturevalue(production)
+        monitor = Monitor(reference_data=ref_df, n_jobs=2)
+
+        expected = monitor.check(prod_df)
+        for start in range(0, len(prod_df), 300):
+            monitor.update(prod_df.iloc[start : start + 300])
+        report = monitor.finalize()
+
+        assert report.production_size == len(prod_df)
+        assert [r.score for r in report.feature_results] == pytest.approx(
+            [r.score for r in expected.feature_results]
+        )
+        assert [r.has_drift for r in report.feature_results] == [
+            r.has_drift for r in expected.feature_results
+        ]
+
+    def test_finalize_without_update_raises(
+        self, sample_numerical_df: pd.DataFrame
+    ) -> None:
+        """Should raise ValueError when no chunk was added, also after a finalize."""
+        monitor = Monitor(reference_data=sample_numerical_df)
+
+        with pytest.raises(ValueError, match="call update"):
+            monitor.finalize()
+
+        monitor.update(sample_numerical_df)
+        monitor.finalize()
+        with pytest.raises(ValueError, match="call update"):
+            monitor.finalize()
@@ -64,6 +64,20 @@ class TestPredictionMonitorRegression:
 
         assert not report.has_drift()
 
+    @pytest.mark.parametrize("detector", ["ks", "jensen_shannon"])
+    def test_reference_state_fitted_at_init(self, detector: str) -> None:
+        """Later changes to the caller's reference array should not matter."""
+        np.random.seed(42)
+        ref_preds = np.random.normal(0, 1, 1000)
+        prod_preds = np.random.normal(0.5, 1, 1000)
+
+        monitor = PredictionMonitor(reference_predictions=ref_preds, detector=detector)
+        expected = monitor.check(prod_preds)
+        ref_preds += 10
+        report = monitor.check(prod_preds)
+
+        assert report.feature_results[0].score == expected.feature_results[0].score
+
     def test_empty_reference_raises(self) -> None:
         """Should raise for empty reference predictions."""
         with pytest.raises(ValueError, match="cannot be empty"):
@@ -114,6 +128,62 @@ class TestPredictionMonitorClassification:
 
         assert report.has_drift()
 
+    def test_array_and_dataframe_inputs_match(self) -> None:
+        """Array columns should be matched to outputs like DataFrame columns."""
+        np.random.seed(42)
+        ref_proba = np.column_stack(
+            [np.random.beta(2, 5, 1000), np.random.beta(5, 2, 1000)]
+        )
+        prod_proba = np.column_stack(
+            [np.random.beta(3, 4, 800), np.random.beta(4, 3, 800)]
+        )
+        names = ["negative", "positive"]
+        monitor = PredictionMonitor(reference_predictions=ref_proba, class_names=names)
+
+        expected = monitor.check(pd.DataFrame(prod_proba[:, ::-1], columns=names[::-1]))
+        report = monitor.check(prod_proba)
+
+        assert report.production_size == 800
+        assert [r.score for r in report.feature_results] == [
+            r.score for r in expected.feature_results
+        ]
+
+    def test_array_and_dataframe_references_match(self) -> None:
+        """An array reference should be fitted like the equivalent DataFrame."""
+        np.random.seed(42)
+        ref_proba = np.random.dirichlet([2, 3, 5], 1000)
+        prod_proba = np.random.dirichlet([3, 3, 4], 500)
+        names = ["a", "b", "c"]
+
+        from_array = PredictionMonitor(
+            reference_predictions=ref_proba, class_names=names
+        )
+        from_frame = PredictionMonitor(
+            reference_predictions=pd.DataFrame(ref_proba, columns=names)
+        )
+
+        assert from_array.monitored_outputs == from_frame.monitored_outputs == names
+        assert from_array.get_config() == from_frame.get_config()
+        assert [r.score for r in from_array.check(prod_proba).feature_results] == [
+            r.score for r in from_frame.check(prod_proba).feature_results
+        ]
+
+    def test_array_shape_mismatch_raises(self) -> None:
+        """Should raise when a 2-D array has the wrong number of columns."""
+        monitor = PredictionMonitor(reference_predictions=np.ones((10, 3)))
+
+        with pytest.raises(ValueError, match="don't match"):
+            monitor.check(np.ones((10, 2)))
+
+    def test_column_mismatch_raises(self) -> None:
+        """Should raise when DataFrame columns differ from the outputs."""
+        monitor = PredictionMonitor(
+            reference_predictions=np.ones((10, 2)), class_names=["a", "b"]
+        )
+
+        with pytest.raises(ValueError, match="don't match"):
+            monitor.check(pd.DataFrame(np.ones((10, 2)), columns=["a", "c"]))
+
     def test_auto_detect_classification(self) -> None:
         """Should auto-detect classification from 2D input."""
         proba = np.array([[0.7, 0.3], [0.4, 0.6]])
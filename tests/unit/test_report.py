@@ -1,11 +1,24 @@
 """Tests for DriftReport class."""
 
+from __future__ import annotations
+
+import dataclasses
 import json
-from datetime import datetime
+import pickle
+import sys
+from datetime import datetime, timezone
 
+import numpy as np
 import pytest
 
-from driftwatch.core.report import DriftReport, DriftStatus, FeatureDriftResult
+from driftwatch.core import report as report_module
+from driftwatch.core.report import (
+    ComprehensiveDriftReport,
+    DriftReport,
+    DriftStatus,
+    DriftType,
+    FeatureDriftResult,
+)
 
 
 class TestFeatureDriftResult:
@@ -30,6 +43,9 @@ class TestFeatureDriftResult:
         assert d["method"] == "psi"
         assert d["threshold"] == 0.2
         assert d["p_value"] is None
+        # Plain string rather than the enum member, for any JSON encoder
+        assert type(d["drift_type"]) is str
+        assert d["drift_type"] == "FEATURE"
 
     def test_to_dict_with_p_value(self) -> None:
         """Should include p_value when present."""
@@ -46,6 +62,31 @@ class TestFeatureDriftResult:
 
         assert d["p_value"] == 0.23
 
+    @pytest.mark.parametrize("p_value", [float("nan"), float("inf"), -np.inf])
+    def test_to_dict_non_finite_p_value(self, p_value: float) -> None:
+        """Non-finite p-values should be written as null, not NaN."""
+        result = FeatureDriftResult("age", True, 0.5, "ks_test", 0.05, p_value)
+        report = DriftReport([result], reference_size=10, production_size=10)
+
+        assert result.to_dict()["p_value"] is None
+        assert "NaN" not in report.to_json(indent=4)
+        assert "Infinity" not in report.to_json(indent=4)
+
+    @pytest.mark.parametrize("score", [float("nan"), np.inf, -np.inf])
+    def test_to_dict_non_finite_score(self, score: float) -> None:
+        """Non-finite scores should be null with either JSON backend."""
+        result = FeatureDriftResult("age", True, score, "psi", 0.2)
+        report = DriftReport([result], reference_size=10, production_size=10)
+        out: dict[str, object] = {}
+        result.to_dict_into(out)
+
+        assert result.to_dict()["score"] is None
+        assert out["score"] is None
+        # indent=2 goes through orjson when it is installed, indent=4 never
+        for indent in (2, 4):
+            parsed = json.loads(report.to_json(indent=indent))
+            assert parsed["feature_results"][0]["score"] is None
+
 
 class TestDriftReport:
     """Tests for DriftReport class."""
@@ -112,6 +153,11 @@ class TestDriftReport:
         )
         assert report.drift_ratio() == 0.0
 
+    def test_counts(self, partial_drift_report: DriftReport) -> None:
+        """Should count drifted and checked features."""
+        assert partial_drift_report.n_drifted == 1
+        assert partial_drift_report.n_features == 3
+
     def test_status_ok(self, no_drift_report: DriftReport) -> None:
         """Should return OK status when no drift."""
         assert no_drift_report.status == DriftStatus.OK
@@ -136,6 +182,19 @@ class TestDriftReport:
         result = partial_drift_report.feature_drift("nonexistent")
         assert result is None
 
+    def test_feature_drift_repeated_name_returns_first(self) -> None:
+        """A repeated feature name should resolve to its first result."""
+        first = FeatureDriftResult("age", True, 0.4, "psi", 0.2)
+        second = FeatureDriftResult("age", False, 0.1, "psi", 0.2)
+        report = DriftReport(
+            feature_results=[first, second],
+            reference_size=10,
+            production_size=10,
+        )
+
+        assert report.feature_drift("age") is first
+        assert report.feature_drift("age") is first
+
     def test_summary_contains_key_info(self, partial_drift_report: DriftReport) -> None:
         """Summary should contain key information."""
         summary = partial_drift_report.summary()
@@ -159,6 +218,52 @@ class TestDriftReport:
         assert d["drifted_features"] == ["age"]
         assert len(d["feature_results"]) == 3
 
+    def test_to_json_numpy_scores(self) -> None:
+        """NumPy scalar scores should be written as JSON numbers."""
+        report = DriftReport(
+            feature_results=[
+                FeatureDriftResult("age", True, np.float64(0.25), "psi", 0.2),
+                FeatureDriftResult("income", False, np.float64(0.5), "psi", 0.2),
+            ],
+            reference_size=10,
+            production_size=10,
+        )
+
+        parsed = json.loads(report.to_json())
+
+        assert [r["score"] for r in parsed["feature_results"]] == [0.25, 0.5]
+
+    def test_to_dict_repeated_calls(self, partial_drift_report: DriftReport) -> None:
+        """Repeated calls should give equal, independent dictionaries."""
+        first = partial_drift_report.to_dict()
+        first["drifted_features"].append("income")
+
+        second = partial_drift_report.to_dict()
+
+        assert second["drifted_features"] == ["age"]
+        assert second["timestamp"] == partial_drift_report.timestamp.isoformat()
+        assert second["status"] == "WARNING"
+
+    def test_to_dict_into_reuses_buffers(
+        self,
+        partial_drift_report: DriftReport,
+        critical_drift_report: DriftReport,
+    ) -> None:
+        """Should fill the given containers with the to_dict() entries."""
+        out: dict[str, object] = {}
+        feature_buf: list[dict[str, object]] = []
+
+        partial_drift_report.to_dict_into(out, feature_buf)
+        first_result = feature_buf[0]
+        assert json.loads(json.dumps(out)) == partial_drift_report.to_dict()
+        assert len(feature_buf) == 3
+
+        critical_drift_report.to_dict_into(out, feature_buf)
+        assert json.loads(json.dumps(out)) == critical_drift_report.to_dict()
+        assert out["feature_results"] is feature_buf
+        assert feature_buf[0] is first_result
+        assert len(feature_buf) == 2
+
     def test_to_json(self, partial_drift_report: DriftReport) -> None:
         """Should produce valid JSON."""
         json_str = partial_drift_report.to_json()
@@ -166,6 +271,21 @@ class TestDriftReport:
         # Should be valid JSON
         parsed = json.loads(json_str)
         assert parsed["status"] == "WARNING"
+        assert parsed == partial_drift_report.to_dict()
+
+    @pytest.mark.parametrize("indent", [2, 4, None])
+    def test_to_json_without_orjson(
+        self,
+        partial_drift_report: DriftReport,
+        monkeypatch: pytest.MonkeyPatch,
+        indent: int | None,
+    ) -> None:
+        """The standard library fallback should produce the same document."""
+        expected = json.loads(partial_drift_report.to_json(indent=indent))
+
+        monkeypatch.setattr(report_module, "orjson", None)
+
+        assert json.loads(partial_drift_report.to_json(indent=indent)) == expected
 
     def test_repr(self, partial_drift_report: DriftReport) -> None:
         """Should have informative repr."""
@@ -176,6 +296,40 @@ class TestDriftReport:
         assert "features=3" in repr_str
         assert "drifted=1" in repr_str
 
+    def test_report_pickles(self, partial_drift_report: DriftReport) -> None:
+        """Frozen, slotted reports should survive a pickle round trip."""
+        restored = pickle.loads(pickle.dumps(partial_drift_report))
+
+        assert restored == partial_drift_report
+        assert restored.drifted_features() == ["age"]
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="needs slots")
+    def test_reports_have_no_instance_dict(
+        self, partial_drift_report: DriftReport
+    ) -> None:
+        """Reports and results should use slots instead of a __dict__."""
+        assert not hasattr(partial_drift_report, "__dict__")
+        assert not hasattr(partial_drift_report.feature_results[0], "__dict__")
+
+    def test_report_is_immutable(self, partial_drift_report: DriftReport) -> None:
+        """Aggregates are computed once, so fields cannot be reassigned."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            partial_drift_report.feature_results = []  # type: ignore[misc]
+
+        drifted = partial_drift_report.drifted_features()
+        drifted.append("income")
+        assert partial_drift_report.drifted_features() == ["age"]
+
+    def test_feature_results_copied_to_tuple(self) -> None:
+        """Changing the caller's list should not desync the aggregates."""
+        results = [FeatureDriftResult("age", False, 0.1, "psi", 0.2)]
+        report = DriftReport(results, reference_size=100, production_size=100)
+        results.append(FeatureDriftResult("income", True, 0.5, "psi", 0.2))
+
+        assert isinstance(report.feature_results, tuple)
+        assert report.n_features == 1
+        assert report.status == DriftStatus.OK
+
     def test_timestamp_default(self) -> None:
         """Should have timestamp when created."""
         report = DriftReport(
@@ -186,6 +340,7 @@ class TestDriftReport:
 
         assert report.timestamp is not None
         assert isinstance(report.timestamp, datetime)
+        assert report.timestamp.tzinfo is timezone.utc
 
     def test_model_version(self) -> None:
         """Should support model version."""
@@ -198,3 +353,42 @@ class TestDriftReport:
 
         assert report.model_version == "v1.2.3"
         assert report.to_dict()["model_version"] == "v1.2.3"
+
+
+class TestComprehensiveDriftReport:
+    """Tests for ComprehensiveDriftReport aggregates."""
+
+    @staticmethod
+    def _report(*drift: bool) -> DriftReport:
+        return DriftReport(
+            feature_results=[
+                FeatureDriftResult(f"f{i}", has_drift, 0.3, "psi", 0.2)
+                for i, has_drift in enumerate(drift)
+            ],
+            reference_size=10,
+            production_size=10,
+        )
+
+    def test_worst_status_and_detected_types(self) -> None:
+        """Status should be the worst sub-report status."""
+        report = ComprehensiveDriftReport(
+            feature_report=self._report(True, False, False),
+            prediction_report=self._report(False),
+            concept_report=self._report(True, True),
+        )
+
+        assert report.status == DriftStatus.CRITICAL
+        assert report.has_drift()
+        assert report.drift_types_detected() == [DriftType.FEATURE, DriftType.CONCEPT]
+        assert report.to_dict()["drift_types_detected"] == ["FEATURE", "CONCEPT"]
+        assert "drift_types=[FEATURE, CONCEPT]" in repr(report)
+
+    def test_empty_report_is_ok(self) -> None:
+        """A report without sub-reports should be OK and without drift."""
+        report = ComprehensiveDriftReport()
+
+        assert report.status == DriftStatus.OK
+        assert not report.has_drift()
+        assert report.drift_types_detected() == []
+        assert "drift_types=[none]" in repr(report)
+        assert "Drift Types Detected: None" in report.summary()